@@ -3,7 +3,17 @@ import os
 import time
 import sys
 import json
-from collections import deque
+import re
+import struct
+import zlib
+import lzma
+import atexit
+import itertools
+import bisect
+import queue
+import threading
+from array import array
+from collections import deque, Counter, OrderedDict
 
 # Optional: numpy support
 try:
@@ -11,6 +21,75 @@ try:
 except ImportError:
     np = None
 
+# ========================
+# Rules
+# ========================
+
+class LifeRule:
+    """Life-like rule in B/S notation compiled to a lookup table.
+
+    table[state][neighbors] is the next state of a cell, so engines do one
+    table lookup per cell instead of branching on the rule.
+    """
+    def __init__(self, birth, survive, neighborhood=8):
+        self.birth = frozenset(birth)
+        self.survive = frozenset(survive)
+        self.neighborhood = neighborhood
+        for count in self.birth | self.survive:
+            if not 0 <= count <= neighborhood:
+                raise ValueError(f"Neighbor count {count} outside 0..{neighborhood}")
+        self.table = [[1 if n in self.birth else 0 for n in range(neighborhood + 1)],
+                      [1 if n in self.survive else 0 for n in range(neighborhood + 1)]]
+        self.array = np.array(self.table, dtype=np.uint8) if np is not None else None
+
+    @classmethod
+    def parse(cls, text, neighborhood=8):
+        """Parse 'B36/S23' style notation (also 'S/B' form like '23/3').
+
+        Counts are single digits unless separated by commas, e.g. 'B5/S4,5,6'.
+        """
+        def counts(part):
+            part = part.strip()
+            if ',' in part:
+                return [int(value) for value in part.split(',') if value.strip()]
+            return [int(value) for value in part]
+        parts = text.strip().upper().split('/')
+        if len(parts) != 2:
+            raise ValueError(f"Rule '{text}' must look like B3/S23")
+        first, second = parts
+        try:
+            if first.startswith('S') or second.startswith('B'):
+                first, second = second, first
+            if first.startswith('B') or second.startswith('S'):
+                return cls(counts(first.lstrip('B')), counts(second.lstrip('S')), neighborhood)
+            return cls(counts(second), counts(first), neighborhood)
+        except ValueError as e:
+            raise ValueError(f"Invalid rule '{text}': {e}")
+
+    def __str__(self):
+        def fmt(values):
+            if self.neighborhood > 9:
+                return ','.join(map(str, sorted(values)))
+            return ''.join(map(str, sorted(values)))
+        return f"B{fmt(self.birth)}/S{fmt(self.survive)}"
+
+    def __repr__(self):
+        if self.neighborhood != 8:
+            return f"LifeRule.parse('{self}', neighborhood={self.neighborhood})"
+        return f"LifeRule.parse('{self}')"
+
+    def __eq__(self, other):
+        return (isinstance(other, LifeRule) and self.birth == other.birth
+                and self.survive == other.survive and self.neighborhood == other.neighborhood)
+
+    def __hash__(self):
+        return hash((self.birth, self.survive, self.neighborhood))
+
+CONWAY = LifeRule.parse('B3/S23')
+HIGHLIFE = LifeRule.parse('B36/S23')
+DAY_AND_NIGHT = LifeRule.parse('B3678/S34678')
+RULE_3D = LifeRule.parse('B5/S456', neighborhood=26)
+
 # ========================
 # Core Game of Life Logic
 # ========================
@@ -33,115 +112,1176 @@ def count_neighbors(grid, row, col):
             count += grid[nr][nc]
     return count
 
-def next_generation(grid):
-    """Compute the next generation based on Conway's rules"""
+def next_generation(grid, rule=CONWAY):
+    """Compute the next generation under rule (Conway's B3/S23 by default).
+
+    NumPy arrays are stepped with the vectorized engine. Plain lists use the
+    vectorized engine too when numpy is installed (converted in and out) and
+    fall back to the pure-Python loop otherwise; both give identical results.
+    PackedBoard and SparseBoard instances are stepped with their own engines.
+    A MemmapBoard is stepped in place on disk and returned itself.
+    """
+    if isinstance(grid, MemmapBoard):
+        grid.step(rule=rule)
+        return grid
+    if isinstance(grid, PackedBoard):
+        return next_generation_packed(grid, rule)
+    if isinstance(grid, SparseBoard):
+        return next_generation_sparse(grid, rule)
+    if np is not None:
+        if isinstance(grid, np.ndarray):
+            return next_generation_numpy(grid, rule)
+        if grid and grid[0]:
+            return array_to_grid(next_generation_numpy(grid_to_array(grid), rule))
+    return next_generation_list(grid, rule)
+
+def count_population(grid):
+    """Count live cells on any supported board type"""
+    if isinstance(grid, (PackedBoard, SparseBoard, MemmapBoard)):
+        return grid.population()
+    if np is not None and isinstance(grid, np.ndarray):
+        return int(np.count_nonzero(grid))
+    return sum(sum(row) for row in grid)
+
+def next_generation_list(grid, rule=CONWAY):
+    """Compute the next generation with the pure-Python list-of-lists engine"""
     rows, cols = len(grid), len(grid[0])
+    table = rule.table
     new_grid = [[0] * cols for _ in range(rows)]
     for i in range(rows):
         for j in range(cols):
             neighbors = count_neighbors(grid, i, j)
-            current_state = grid[i][j]
-            if current_state == 1:
-                if neighbors < 2 or neighbors > 3:
-                    new_grid[i][j] = 0
-                else:
-                    new_grid[i][j] = 1
-            else:
-                if neighbors == 3:
-                    new_grid[i][j] = 1
+            new_grid[i][j] = table[grid[i][j]][neighbors]
     return new_grid
 
+# ========================
+# NumPy Engine
+# ========================
+
+def grid_to_array(grid):
+    """Convert a list-of-lists grid to a uint8 NumPy array"""
+    return np.array(grid, dtype=np.uint8)
+
+def array_to_grid(board):
+    """Convert a NumPy board back to a list-of-lists grid of Python ints"""
+    return board.astype(np.uint8).tolist()
+
+def count_neighbors_numpy(board):
+    """Count live neighbors of every cell at once with toroidal wrapping.
+
+    Uses a padded-slice sum: the board is wrapped by one cell on each side and
+    the eight shifted views are added together in uint8.
+    """
+    padded = np.pad(board, 1, mode='wrap')
+    rows, cols = board.shape
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+def next_generation_numpy(board, rule=CONWAY):
+    """Compute the next generation of a uint8 NumPy board via the rule table"""
+    board = np.asarray(board, dtype=np.uint8)
+    counts = count_neighbors_numpy(board)
+    return rule.array[board, counts]
+
+def step_band_numpy(band, rule=CONWAY):
+    """Step the inner rows of a band whose first and last rows are halo rows.
+
+    Columns wrap around; rows do not, so the caller supplies the neighbors
+    of the band as halos. Returns the new generation of the inner rows.
+    """
+    rows, cols = band.shape[0] - 2, band.shape[1]
+    padded = np.concatenate((band[:, -1:], band, band[:, :1]), axis=1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return rule.array[band[1:-1], counts]
+
+# ========================
+# Bit-Packed Engine
+# ========================
+
+def _popcount(value):
+    """Number of set bits in a non-negative int"""
+    return bin(value).count('1')
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+
+class PackedBoard:
+    """Toroidal board storing each row as a Python int, one bit per cell.
+
+    Bit j of row i is the cell at (i, j). A row costs cols/8 bytes instead of
+    8+ bytes per cell, and stepping works on whole rows with bitwise logic.
+    Indexing and iteration give read-only tuple rows; write cells with set().
+    """
+    def __init__(self, rows, cols, data=None):
+        self.rows = rows
+        self.cols = cols
+        self.mask = (1 << cols) - 1
+        self.data = list(data) if data is not None else [0] * rows
+
+    @classmethod
+    def from_grid(cls, grid):
+        rows, cols = len(grid), len(grid[0])
+        data = [int(''.join('1' if cell else '0' for cell in reversed(row)), 2)
+                for row in grid]
+        return cls(rows, cols, data)
+
+    @classmethod
+    def from_array(cls, board):
+        rows, cols = board.shape
+        packed = np.packbits(board.astype(bool), axis=1, bitorder='little')
+        data = [int.from_bytes(row.tobytes(), 'little') for row in packed]
+        return cls(rows, cols, data)
+
+    def to_grid(self):
+        return [self.row(i) for i in range(self.rows)]
+
+    def to_array(self):
+        nbytes = (self.cols + 7) // 8
+        buffer = b''.join(value.to_bytes(nbytes, 'little') for value in self.data)
+        packed = np.frombuffer(buffer, dtype=np.uint8).reshape(self.rows, nbytes)
+        return np.unpackbits(packed, axis=1, count=self.cols, bitorder='little')
+
+    def row(self, i):
+        bits = format(self.data[i], f'0{self.cols}b')
+        return [1 if bit == '1' else 0 for bit in reversed(bits)]
+
+    def get(self, i, j):
+        return (self.data[i] >> j) & 1
+
+    def set(self, i, j, value):
+        if value:
+            self.data[i] |= 1 << j
+        else:
+            self.data[i] &= ~(1 << j)
+
+    def population(self):
+        return sum(_popcount(value) for value in self.data)
+
+    def copy(self):
+        return PackedBoard(self.rows, self.cols, self.data)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, i):
+        return tuple(self.row(i))
+
+    def __iter__(self):
+        for i in range(self.rows):
+            yield tuple(self.row(i))
+
+    def __eq__(self, other):
+        return (isinstance(other, PackedBoard) and self.rows == other.rows
+                and self.cols == other.cols and self.data == other.data)
+
+def _count_equals(planes, count, mask):
+    """Bit mask of cells whose 4-bit count planes (s0..s3) equal count"""
+    result = mask
+    for bit, plane in enumerate(planes):
+        result &= plane if (count >> bit) & 1 else ~plane
+    return result
+
+def next_generation_packed(board, rule=CONWAY):
+    """Compute the next generation of a PackedBoard with SWAR full-adder logic.
+
+    Each row is combined with its left/right rotations into 2-bit horizontal
+    sums (including and excluding the cell itself). The sums of the row above,
+    the row itself and the row below are then added into four count
+    bit-planes, and the rule is evaluated on the planes for a whole row at once.
+    """
+    rows, cols, mask = board.rows, board.cols, board.mask
+    conway = rule == CONWAY
+    top = cols - 1
+    full0, full1, half0, half1 = [], [], [], []
+    for x in board.data:
+        west = ((x << 1) | (x >> top)) & mask
+        east = (x >> 1) | ((x & 1) << top)
+        half0.append(west ^ east)
+        half1.append(west & east)
+        full0.append(west ^ east ^ x)
+        full1.append((west & east) | (x & (west ^ east)))
+    new_data = [0] * rows
+    for i in range(rows):
+        up, down = i - 1, (i + 1) % rows
+        u0, u1 = full0[up], full1[up]
+        m0, m1 = half0[i], half1[i]
+        d0, d1 = full0[down], full1[down]
+        # Weight-1 column: u0 + m0 + d0
+        s0 = u0 ^ m0 ^ d0
+        c0 = (u0 & m0) | (d0 & (u0 ^ m0))
+        # Weight-2 column: u1 + m1 + d1 + c0
+        t0 = u1 ^ m1 ^ d1
+        t1 = (u1 & m1) | (d1 & (u1 ^ m1))
+        s1 = t0 ^ c0
+        c1 = t0 & c0
+        # Weight-4 and weight-8 columns
+        s2 = t1 ^ c1
+        s3 = t1 & c1
+        x = board.data[i]
+        if conway:
+            new_data[i] = s1 & ~s2 & ~s3 & (s0 | x) & mask
+            continue
+        planes = (s0, s1, s2, s3)
+        born = survived = 0
+        for count in rule.birth:
+            born |= _count_equals(planes, count, mask)
+        for count in rule.survive:
+            survived |= _count_equals(planes, count, mask)
+        new_data[i] = ((~x & born) | (x & survived)) & mask
+    return PackedBoard(rows, cols, new_data)
+
+# ========================
+# Sparse Engine
+# ========================
+
+class SparseBoard:
+    """Toroidal board storing only the coordinates of live cells.
+
+    Memory and stepping cost scale with the population instead of the area,
+    which suits a few gliders and still lifes on a huge, mostly empty board.
+    Indexing and iteration give read-only tuple rows; write cells with set().
+    """
+    def __init__(self, rows, cols, live=None):
+        self.rows = rows
+        self.cols = cols
+        self.live = set(live) if live is not None else set()
+
+    @classmethod
+    def from_grid(cls, grid):
+        live = [(i, j) for i, row in enumerate(grid) for j, cell in enumerate(row) if cell]
+        return cls(len(grid), len(grid[0]), live)
+
+    def to_grid(self):
+        grid = [[0] * self.cols for _ in range(self.rows)]
+        for i, j in self.live:
+            grid[i][j] = 1
+        return grid
+
+    def row(self, i):
+        # Probe the row's columns unless the whole population is smaller
+        if self.cols <= len(self.live):
+            live = self.live
+            return [1 if (i, j) in live else 0 for j in range(self.cols)]
+        cells = [0] * self.cols
+        for r, j in self.live:
+            if r == i:
+                cells[j] = 1
+        return cells
+
+    def get(self, i, j):
+        return 1 if (i, j) in self.live else 0
+
+    def set(self, i, j, value):
+        if value:
+            self.live.add((i, j))
+        else:
+            self.live.discard((i, j))
+
+    def population(self):
+        return len(self.live)
+
+    def copy(self):
+        return SparseBoard(self.rows, self.cols, self.live)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, i):
+        return tuple(self.row(i))
+
+    def __iter__(self):
+        by_row = {}
+        for i, j in self.live:
+            by_row.setdefault(i, []).append(j)
+        for i in range(self.rows):
+            cells = [0] * self.cols
+            for j in by_row.get(i, ()):
+                cells[j] = 1
+            yield tuple(cells)
+
+    def __eq__(self, other):
+        return (isinstance(other, SparseBoard) and self.rows == other.rows
+                and self.cols == other.cols and self.live == other.live)
+
+def next_generation_sparse(board, rule=CONWAY):
+    """Compute the next generation of a SparseBoard via the rule table.
+
+    Neighbor counts are accumulated in a Counter only around live cells, so
+    the cost of a generation is proportional to the population. Rules with
+    birth on 0 neighbors (B0) would fill the empty board and are rejected.
+    """
+    if 0 in rule.birth:
+        raise ValueError(f"Rule {rule} has B0 and cannot run on a sparse board")
+    rows, cols, live = board.rows, board.cols, board.live
+    birth, survive = rule.table
+    counts = Counter()
+    for i, j in live:
+        up, down = (i - 1) % rows, (i + 1) % rows
+        left, right = (j - 1) % cols, (j + 1) % cols
+        counts.update(((up, left), (up, j), (up, right),
+                       (i, left), (i, right),
+                       (down, left), (down, j), (down, right)))
+    new_live = [cell for cell, n in counts.items()
+                if (survive[n] if cell in live else birth[n])]
+    if survive[0]:
+        new_live.extend(cell for cell in live if cell not in counts)
+    return SparseBoard(rows, cols, new_live)
+
+# ========================
+# Memory-Mapped Engine
+# ========================
+
+MEMMAP_MAGIC = b'GOLM'
+MEMMAP_EXTENSION = '.golm'
+_MEMMAP_HEADER = struct.Struct('<4sBB2xIIQ64s')
+_MEMMAP_DATA_OFFSET = 4096
+
+class MemmapBoard:
+    """Bit-packed board living in a memory-mapped file, stepped in row bands.
+
+    The file holds a header page and two board buffers (rows packed little
+    endian, bit j of a row is column j). A step reads the current buffer one
+    band at a time, with one halo row above and below, and writes the next
+    generation into the other buffer; only then does the header flip to the
+    new buffer and generation. A crash mid-step therefore leaves the file at
+    the last completed generation, and memory use is bounded by band_rows
+    rather than the board size. Requires numpy.
+    """
+    def __init__(self, filename, band_rows=1024):
+        if np is None:
+            raise ValueError("MemmapBoard requires numpy to be installed")
+        self.filename = filename
+        self.band_rows = band_rows
+        self.header = np.memmap(filename, dtype=np.uint8, mode='r+', shape=(_MEMMAP_HEADER.size,))
+        magic, version, current, rows, cols, generation, rule = _MEMMAP_HEADER.unpack(self.header.tobytes())
+        if magic != MEMMAP_MAGIC or version != 1:
+            raise ValueError(f"{filename} is not a memory-mapped board file")
+        self.rows, self.cols = rows, cols
+        self.row_bytes = (cols + 7) // 8
+        self.current = current
+        self.generation = generation
+        self.rule = LifeRule.parse(rule.rstrip(b'\0').decode('ascii'))
+        self.buffers = np.memmap(filename, dtype=np.uint8, mode='r+', offset=_MEMMAP_DATA_OFFSET,
+                                 shape=(2, rows, self.row_bytes))
+
+    @classmethod
+    def create(cls, filename, rows, cols, rule=CONWAY, generation=0, board=None, band_rows=1024):
+        """Create a board file, optionally filled from any board, and open it"""
+        header = _MEMMAP_HEADER.pack(MEMMAP_MAGIC, 1, 0, rows, cols, generation, str(rule).encode('ascii'))
+        with open(filename, 'wb') as f:
+            f.write(header.ljust(_MEMMAP_DATA_OFFSET, b'\0'))
+            f.truncate(_MEMMAP_DATA_OFFSET + 2 * rows * ((cols + 7) // 8))
+        memmap_board = cls(filename, band_rows)
+        if board is not None:
+            memmap_board.load(board)
+        return memmap_board
+
+    def _write_header(self, sync):
+        header = _MEMMAP_HEADER.pack(MEMMAP_MAGIC, 1, self.current, self.rows, self.cols,
+                                     self.generation, str(self.rule).encode('ascii'))
+        self.header[:] = np.frombuffer(header, dtype=np.uint8)
+        if sync:
+            self.header.flush()
+
+    def load(self, board):
+        """Copy any board of the same shape into the current buffer"""
+        if board_shape(board) != (self.rows, self.cols):
+            raise ValueError(f"Board shape {board_shape(board)} does not match {self.rows}x{self.cols}")
+        flat = self.buffers[self.current].reshape(-1)
+        position = 0
+        for chunk in _iter_packed_rows(board):
+            flat[position:position + len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+            position += len(chunk)
+        self.flush()
+
+    def bands(self):
+        """Yield (start, stop, cells) for each band of the current buffer as uint8 rows"""
+        source = self.buffers[self.current]
+        for start in range(0, self.rows, self.band_rows):
+            stop = min(start + self.band_rows, self.rows)
+            yield start, stop, np.unpackbits(source[start:stop], axis=1, count=self.cols, bitorder='little')
+
+    def step(self, generations=1, sync=True, rule=None):
+        """Advance the board in place, persisting every generation.
+
+        sync=False skips msync: the file still survives a crash of this
+        process, but not of the machine. A rule replaces the board's own
+        rule and is recorded in the header.
+        """
+        if rule is not None:
+            self.rule = rule
+        for _ in range(generations):
+            source, target = self.buffers[self.current], self.buffers[1 - self.current]
+            for start in range(0, self.rows, self.band_rows):
+                stop = min(start + self.band_rows, self.rows)
+                halo = np.arange(start - 1, stop + 1) % self.rows
+                band = np.unpackbits(source[halo], axis=1, count=self.cols, bitorder='little')
+                target[start:stop] = np.packbits(step_band_numpy(band, self.rule), axis=1, bitorder='little')
+            if sync:
+                self.buffers.flush()
+            self.current = 1 - self.current
+            self.generation += 1
+            self._write_header(sync)
+
+    def get(self, i, j):
+        return int(self.buffers[self.current, i, j >> 3] >> (j & 7)) & 1
+
+    def set(self, i, j, value):
+        bit = np.uint8(1 << (j & 7))
+        if value:
+            self.buffers[self.current, i, j >> 3] |= bit
+        else:
+            self.buffers[self.current, i, j >> 3] &= ~bit
+
+    def population(self):
+        return sum(int(np.count_nonzero(cells)) for _, _, cells in self.bands())
+
+    def live_cells(self):
+        """Yield (row, col) for every live cell, one band at a time"""
+        for start, _, cells in self.bands():
+            for i, j in np.argwhere(cells):
+                yield start + int(i), int(j)
+
+    def to_array(self):
+        return np.unpackbits(self.buffers[self.current], axis=1, count=self.cols, bitorder='little')
+
+    def to_packed(self):
+        return PackedBoard(self.rows, self.cols,
+                           (int.from_bytes(row.tobytes(), 'little') for row in self.buffers[self.current]))
+
+    def flush(self):
+        self.buffers.flush()
+        self._write_header(True)
+
+    def close(self):
+        if self.buffers is not None:
+            self.flush()
+            self.buffers = self.header = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# ========================
+# Engine Selection
+# ========================
+
+ENGINES = ('list', 'numpy', 'packed', 'sparse')
+
+def board_engine(board):
+    """Return the engine name for a board object"""
+    if isinstance(board, PackedBoard):
+        return 'packed'
+    if isinstance(board, SparseBoard):
+        return 'sparse'
+    if isinstance(board, MemmapBoard):
+        return 'memmap'
+    if np is not None and isinstance(board, np.ndarray):
+        return 'numpy'
+    return 'list'
+
+def board_shape(board):
+    """Return (rows, cols) for any supported board type"""
+    if isinstance(board, (PackedBoard, SparseBoard, MemmapBoard)):
+        return board.rows, board.cols
+    if np is not None and isinstance(board, np.ndarray):
+        return board.shape
+    return len(board), len(board[0]) if board else 0
+
+def iter_live_cells(board):
+    """Yield (row, col) for every live cell of any supported board type"""
+    if isinstance(board, SparseBoard):
+        yield from board.live
+    elif isinstance(board, MemmapBoard):
+        yield from board.live_cells()
+    elif isinstance(board, PackedBoard):
+        for i, value in enumerate(board.data):
+            while value:
+                low = value & -value
+                yield i, low.bit_length() - 1
+                value ^= low
+    elif np is not None and isinstance(board, np.ndarray):
+        for i, j in np.argwhere(board):
+            yield int(i), int(j)
+    else:
+        for i, row in enumerate(board):
+            for j, cell in enumerate(row):
+                if cell:
+                    yield i, j
+
+def convert_board(board, engine):
+    """Convert a board to the representation used by the given engine.
+
+    Conversion goes through the live cells only, so moving a huge mostly
+    empty board between the sparse and packed engines never materializes a
+    list-of-lists grid. A MemmapBoard converts to any engine, but only a
+    MemmapBoard is returned for 'memmap' since that engine needs a file.
+    """
+    if engine == 'memmap':
+        if isinstance(board, MemmapBoard):
+            return board
+        raise ValueError("A memmap board needs a file: use MemmapBoard.create(filename, rows, cols, board=board)")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {', '.join(ENGINES)}")
+    if isinstance(board, MemmapBoard):
+        board = board.to_array() if engine in ('numpy', 'list') else board.to_packed()
+    if board_engine(board) == engine:
+        return board
+    rows, cols = board_shape(board)
+    if engine == 'sparse':
+        return SparseBoard(rows, cols, iter_live_cells(board))
+    if engine == 'packed':
+        if np is not None and isinstance(board, np.ndarray):
+            return PackedBoard.from_array(board)
+        if isinstance(board, list):
+            return PackedBoard.from_grid(board)
+        # Set bits in one byte buffer per row: or-ing into wide ints per cell is quadratic
+        packed = PackedBoard(rows, cols)
+        row_bytes = {}
+        for i, j in iter_live_cells(board):
+            buffer = row_bytes.get(i)
+            if buffer is None:
+                buffer = row_bytes[i] = bytearray((cols + 7) // 8)
+            buffer[j >> 3] |= 1 << (j & 7)
+        for i, buffer in row_bytes.items():
+            packed.data[i] = int.from_bytes(buffer, 'little')
+        return packed
+    if engine == 'numpy':
+        if np is None:
+            raise ValueError("The numpy engine requires numpy to be installed")
+        if isinstance(board, PackedBoard):
+            return board.to_array()
+        if isinstance(board, list):
+            return grid_to_array(board)
+        array = np.zeros((rows, cols), dtype=np.uint8)
+        for i, j in iter_live_cells(board):
+            array[i, j] = 1
+        return array
+    if np is not None and isinstance(board, np.ndarray):
+        return array_to_grid(board)
+    return board.to_grid()
+
+# ========================
+# Parallel Engine
+# ========================
+
+def _step_strip(src, dst, start, stop, table):
+    """Step rows [start, stop) of src into dst, reading one halo row on each side"""
+    rows = src.shape[0]
+    strip = np.concatenate((src[(start - 1) % rows][None], src[start:stop], src[stop % rows][None]))
+    padded = np.pad(strip, ((0, 0), (1, 1)), mode='wrap')
+    height, cols = stop - start, src.shape[1]
+    counts = np.zeros((height, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + height, dc:dc + cols]
+    dst[start:stop] = table[padded[1:-1, 1:-1], counts]
+
+def _parallel_worker(names, shape, start, stop, barrier, command, table):
+    """Worker loop: step one horizontal strip per generation until told to stop"""
+    from multiprocessing import shared_memory
+    buffers = [shared_memory.SharedMemory(name=name) for name in names]
+    boards = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf) for shm in buffers]
+    table = np.array(table, dtype=np.uint8)
+    front = 0
+    try:
+        while True:
+            barrier.wait()
+            generations = command.value
+            if generations < 0:
+                break
+            for _ in range(generations):
+                _step_strip(boards[front], boards[1 - front], start, stop, table)
+                front = 1 - front
+                barrier.wait()
+    except threading.BrokenBarrierError:
+        pass  # ParallelEngine.close gave up waiting and aborted the barrier
+    finally:
+        del boards
+        for shm in buffers:
+            shm.close()
+
+PARALLEL_CLOSE_TIMEOUT = 5  # seconds close() waits for the workers before terminating them
+
+class ParallelEngine:
+    """Multi-core stepping over horizontal strips in shared memory.
+
+    The board lives in two multiprocessing.shared_memory buffers used as
+    front/back arrays. A persistent pool of worker processes each owns one
+    strip, reads the single halo row above and below it straight from the
+    front buffer and writes its strip into the back buffer; a barrier ends
+    every generation before the buffers swap.
+    """
+    def __init__(self, rows, cols, workers=None, rule=CONWAY):
+        import multiprocessing
+        from multiprocessing import shared_memory
+        if np is None:
+            raise ValueError("The parallel engine requires numpy to be installed")
+        workers = max(1, min(workers or os.cpu_count() or 1, rows))
+        self.shape = (rows, cols)
+        self.rule = rule
+        self.buffers = [shared_memory.SharedMemory(create=True, size=max(1, rows * cols))
+                        for _ in range(2)]
+        self.boards = [np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf)
+                       for shm in self.buffers]
+        self.front = 0
+        self.barrier = multiprocessing.Barrier(workers + 1)
+        self.command = multiprocessing.Value('i', 0)
+        bounds = [rows * k // workers for k in range(workers + 1)]
+        names = [shm.name for shm in self.buffers]
+        self.processes = [
+            multiprocessing.Process(target=_parallel_worker, daemon=True,
+                                    args=(names, self.shape, bounds[k], bounds[k + 1],
+                                          self.barrier, self.command, rule.table))
+            for k in range(workers)
+        ]
+        for process in self.processes:
+            process.start()
+
+    def load(self, board):
+        """Copy a board of any supported type into the front buffer"""
+        self.boards[self.front][:] = convert_board(board, 'numpy')
+
+    def board(self):
+        """Return a copy of the current board as a uint8 array"""
+        return self.boards[self.front].copy()
+
+    def step(self, generations=1):
+        """Advance the shared board by the given number of generations"""
+        self.command.value = generations
+        self.barrier.wait()
+        for _ in range(generations):
+            self.barrier.wait()
+            self.front = 1 - self.front
+        return self.board()
+
+    def close(self):
+        """Stop the workers and release the shared memory"""
+        if not self.processes:
+            return
+        self.command.value = -1
+        if all(process.is_alive() for process in self.processes):
+            try:
+                self.barrier.wait(PARALLEL_CLOSE_TIMEOUT)
+            except threading.BrokenBarrierError:
+                pass
+        # A dead worker never reaches the barrier; breaking it releases the rest
+        self.barrier.abort()
+        for process in self.processes:
+            process.join(PARALLEL_CLOSE_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self.processes = []
+        self.boards = []
+        for shm in self.buffers:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+_parallel_engines = {}
+
+def next_generation_parallel(board, workers=None, rule=CONWAY):
+    """Compute the next generation with a cached ParallelEngine for the board's shape"""
+    shape = tuple(board_shape(board))
+    engine = _parallel_engines.get((shape, workers, rule))
+    if engine is None:
+        if not _parallel_engines:
+            # Registered after multiprocessing is imported so it runs before
+            # multiprocessing's own exit handler tears the workers down
+            atexit.register(close_parallel_engines)
+        engine = ParallelEngine(shape[0], shape[1], workers, rule)
+        _parallel_engines[(shape, workers, rule)] = engine
+    engine.load(board)
+    return engine.step()
+
+def close_parallel_engines():
+    """Shut down all cached parallel engines"""
+    for engine in _parallel_engines.values():
+        engine.close()
+    _parallel_engines.clear()
+
+def measure_parallel_speedup(rows=4096, cols=4096, generations=20, workers=None):
+    """
+    Time the serial NumPy engine against the parallel engine on a random board.
+    Returns (serial_seconds, parallel_seconds, speedup)
+    """
+    board = (np.random.random((rows, cols)) < 0.25).astype(np.uint8)
+    start = time.perf_counter()
+    serial = board
+    for _ in range(generations):
+        serial = next_generation_numpy(serial)
+    serial_time = time.perf_counter() - start
+    with ParallelEngine(rows, cols, workers) as engine:
+        engine.load(board)
+        start = time.perf_counter()
+        parallel = engine.step(generations)
+        parallel_time = time.perf_counter() - start
+    if not np.array_equal(serial, parallel):
+        raise RuntimeError("Parallel engine diverged from the serial engine")
+    return serial_time, parallel_time, serial_time / parallel_time if parallel_time else 0
+
+# ========================
+# Hashlife Engine
+# ========================
+
+class HashLifeNode:
+    """Canonical quadtree node; level 0 nodes are single cells"""
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population', 'results')
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.level = level
+        self.population = population
+        self.results = None
+
+class HashLife:
+    """Gosper's Hashlife on the unbounded plane.
+
+    Nodes are canonicalized through a hash table so identical sub-patterns
+    are shared, and the result of advancing each node is memoized. That lets
+    regular patterns such as guns and spaceships jump 2**k generations in a
+    single call. When the node table grows past max_nodes it is rebuilt from
+    the nodes still reachable from the root and all memoized results are
+    dropped, which keeps memory bounded.
+    """
+    def __init__(self, max_nodes=1 << 20, rule=CONWAY):
+        if 0 in rule.birth:
+            raise ValueError(f"Rule {rule} has B0 and cannot run on the unbounded plane")
+        self.max_nodes = max_nodes
+        self.rule = rule
+        self.cache = {}
+        self.off = HashLifeNode(None, None, None, None, 0, 0)
+        self.on = HashLifeNode(None, None, None, None, 0, 1)
+        self._empty = [self.off]
+        self.root = self.empty(3)
+        self.origin = (0, 0)
+        self.generation = 0
+
+    def join(self, nw, ne, sw, se):
+        """Return the canonical node with the given quadrants"""
+        key = (nw, ne, sw, se)
+        node = self.cache.get(key)
+        if node is None:
+            population = nw.population + ne.population + sw.population + se.population
+            node = HashLifeNode(nw, ne, sw, se, nw.level + 1, population)
+            self.cache[key] = node
+        return node
+
+    def empty(self, level):
+        """Return the canonical empty node of the given level"""
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self.join(e, e, e, e))
+        return self._empty[level]
+
+    def center(self, node):
+        """Return a node one level up with node in its middle"""
+        e = self.empty(node.level - 1)
+        return self.join(self.join(e, e, e, node.nw), self.join(e, e, node.ne, e),
+                         self.join(e, node.sw, e, e), self.join(node.se, e, e, e))
+
+    def _life_4x4(self, node):
+        """Advance the center 2x2 of a level 2 node by one generation"""
+        grid = []
+        for left, right in ((node.nw, node.ne), (node.sw, node.se)):
+            grid.append([left.nw.population, left.ne.population,
+                         right.nw.population, right.ne.population])
+            grid.append([left.sw.population, left.se.population,
+                         right.sw.population, right.se.population])
+        table = self.rule.table
+        out = []
+        for i in (1, 2):
+            for j in (1, 2):
+                neighbors = sum(grid[i + di][j + dj]
+                                for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                                if di or dj)
+                out.append(self.on if table[grid[i][j]][neighbors] else self.off)
+        return self.join(*out)
+
+    def successor(self, node, step):
+        """Return the center half of node advanced by 2**step generations"""
+        if node.population == 0:
+            return node.nw
+        step = min(step, node.level - 2)
+        if node.results is None:
+            node.results = {}
+        result = node.results.get(step)
+        if result is not None:
+            return result
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join, succ = self.join, self.successor
+            c1 = succ(nw, step)
+            c2 = succ(join(nw.ne, ne.nw, nw.se, ne.sw), step)
+            c3 = succ(ne, step)
+            c4 = succ(join(nw.sw, nw.se, sw.nw, sw.ne), step)
+            c5 = succ(join(nw.se, ne.sw, sw.ne, se.nw), step)
+            c6 = succ(join(ne.sw, ne.se, se.nw, se.ne), step)
+            c7 = succ(sw, step)
+            c8 = succ(join(sw.ne, se.nw, sw.se, se.sw), step)
+            c9 = succ(se, step)
+            if step < node.level - 2:
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw),
+                              join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw),
+                              join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                result = join(succ(join(c1, c2, c4, c5), step),
+                              succ(join(c2, c3, c5, c6), step),
+                              succ(join(c4, c5, c7, c8), step),
+                              succ(join(c5, c6, c8, c9), step))
+        node.results[step] = result
+        return result
+
+    def _is_padded(self, node):
+        """True when all live cells sit in the central half of node"""
+        inner = (node.nw.se.population + node.ne.sw.population
+                 + node.sw.ne.population + node.se.nw.population)
+        return node.level >= 3 and inner == node.population
+
+    def advance(self, exponent):
+        """Advance the pattern by 2**exponent generations in one call"""
+        root = self.root
+        row, col = self.origin
+        while root.level < exponent + 2 or not self._is_padded(root):
+            row -= 1 << (root.level - 1)
+            col -= 1 << (root.level - 1)
+            root = self.center(root)
+        row -= 1 << (root.level - 1)
+        col -= 1 << (root.level - 1)
+        root = self.center(root)
+        self.root = self.successor(root, exponent)
+        self.origin = (row + (1 << (root.level - 2)), col + (1 << (root.level - 2)))
+        self.generation += 1 << exponent
+        if len(self.cache) > self.max_nodes:
+            self.collect()
+        return self.root
+
+    def collect(self):
+        """Rebuild the node table from the nodes reachable from the root"""
+        old_cache = self.cache
+        self.cache = {}
+        reachable = {}
+        stack = [self.root] + self._empty[1:]
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in reachable:
+                continue
+            reachable[id(node)] = node
+            node.results = None
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+        for node in reachable.values():
+            self.cache[(node.nw, node.ne, node.sw, node.se)] = node
+        old_cache.clear()
+
+    def set_cells(self, cells):
+        """Replace the pattern with the given (row, col) live cells"""
+        cells = list(cells)
+        self.generation = 0
+        if not cells:
+            self.root = self.empty(3)
+            self.origin = (0, 0)
+            return
+        top = min(r for r, _ in cells)
+        left = min(c for _, c in cells)
+        extent = max(max(r for r, _ in cells) - top, max(c for _, c in cells) - left) + 1
+        level = max(3, (extent - 1).bit_length())
+        self.origin = (top, left)
+        self.root = self._build(level, [(r - top, c - left) for r, c in cells])
+
+    def _build(self, level, cells):
+        if not cells:
+            return self.empty(level)
+        if level == 0:
+            return self.on
+        half = 1 << (level - 1)
+        quads = ([], [], [], [])
+        for r, c in cells:
+            index = (2 if r >= half else 0) + (1 if c >= half else 0)
+            quads[index].append((r % half, c % half))
+        return self.join(*(self._build(level - 1, quad) for quad in quads))
+
+    def live_cells(self, window=None):
+        """Yield (row, col) of live cells in absolute coordinates.
+
+        window is an optional (top, left, bottom, right) half-open rectangle;
+        subtrees outside it are skipped without being visited.
+        """
+        stack = [(self.root, self.origin[0], self.origin[1])]
+        while stack:
+            node, row, col = stack.pop()
+            if node.population == 0:
+                continue
+            if window is not None:
+                size = 1 << node.level
+                top, left, bottom, right = window
+                if row >= bottom or col >= right or row + size <= top or col + size <= left:
+                    continue
+            if node.level == 0:
+                yield row, col
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.nw, row, col))
+            stack.append((node.ne, row, col + half))
+            stack.append((node.sw, row + half, col))
+            stack.append((node.se, row + half, col + half))
+
+    @classmethod
+    def from_grid(cls, grid, max_nodes=1 << 20, rule=CONWAY):
+        life = cls(max_nodes, rule)
+        life.set_cells(iter_live_cells(grid))
+        return life
+
+    def to_grid(self, rows, cols, top=0, left=0):
+        """Export the rows x cols window starting at (top, left) as a list grid"""
+        grid = [[0] * cols for _ in range(rows)]
+        for r, c in self.live_cells((top, left, top + rows, left + cols)):
+            grid[r - top][c - left] = 1
+        return grid
+
+    @property
+    def population(self):
+        return self.root.population
+
+def hashlife_jump(grid, exponent, rule=CONWAY):
+    """
+    Fast-forward a grid by 2**exponent generations with Hashlife.
+    Hashlife simulates the unbounded plane, so cells that travel outside the
+    original window are dropped instead of wrapping around the torus.
+    Returns (success: bool, message: str, new_grid or None)
+    """
+    if exponent < 0:
+        return False, "Exponent must be zero or positive", None
+    try:
+        rows, cols = board_shape(grid)
+        life = HashLife.from_grid(grid, rule=rule)
+        start = time.time()
+        life.advance(exponent)
+        elapsed = time.time() - start
+        new_grid = life.to_grid(rows, cols)
+        return True, (f"Jumped {life.generation} generations in {elapsed * 1000:.1f} ms "
+                      f"(total population {life.population})"), new_grid
+    except RecursionError:
+        return False, "Pattern too large for Hashlife jump", None
+
+# ========================
+# Active-Region Tracking
+# ========================
+
+TILE_SIZE = 16
+
+def tile_neighborhood(tiles, tile_rows, tile_cols):
+    """Return the given tiles plus their eight neighbors, wrapping toroidally"""
+    region = set()
+    for tr, tc in tiles:
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                region.add(((tr + dr) % tile_rows, (tc + dc) % tile_cols))
+    return region
+
+def changed_tiles_between(old_grid, new_grid, tile_size=TILE_SIZE):
+    """Return the set of tiles in which any cell differs between two list grids"""
+    changed = set()
+    cols = len(old_grid[0])
+    for i, (old_row, new_row) in enumerate(zip(old_grid, new_grid)):
+        if old_row is new_row or old_row == new_row:
+            continue
+        tr = i // tile_size
+        for start in range(0, cols, tile_size):
+            if old_row[start:start + tile_size] != new_row[start:start + tile_size]:
+                changed.add((tr, start // tile_size))
+    return changed
+
+def _step_all_tiles(grid, rule, tile_size):
+    """Dense fallback of next_generation_tiled: step the whole grid.
+
+    With numpy the changed tiles, births and deaths all come from the
+    before/after arrays; without it births and deaths are None so callers
+    recount the population.
+    """
+    if np is None:
+        new_grid = next_generation_list(grid, rule)
+        return new_grid, changed_tiles_between(grid, new_grid, tile_size), None, None
+    old = grid_to_array(grid)
+    new = next_generation_numpy(old, rule)
+    flipped = old != new
+    flips = int(np.count_nonzero(flipped))
+    births = int(np.count_nonzero(new[flipped]))
+    rows, cols = flipped.shape
+    flipped = np.pad(flipped, ((0, -rows % tile_size), (0, -cols % tile_size)))
+    tiles = flipped.reshape(flipped.shape[0] // tile_size, tile_size,
+                            flipped.shape[1] // tile_size, tile_size).any(axis=(1, 3))
+    changed = set(zip(*(axis.tolist() for axis in np.nonzero(tiles))))
+    return array_to_grid(new), changed, births, flips - births
+
+def next_generation_tiled(grid, active_tiles=None, tile_size=TILE_SIZE, rule=CONWAY):
+    """
+    Compute the next generation, recomputing only tiles that can change.
+    active_tiles is the set of (tile_row, tile_col) that changed last
+    generation, or None to recompute everything. Only those tiles and their
+    neighbors are stepped; rows outside them are shared with the old grid.
+    Births and deaths are counted as cells flip, so callers can track the
+    population without rescanning the board (they are None when the whole
+    board was stepped without numpy; recount then).
+    Returns (new_grid, changed_tiles, births, deaths)
+    """
+    rows, cols = len(grid), len(grid[0])
+    tile_rows = (rows + tile_size - 1) // tile_size
+    tile_cols = (cols + tile_size - 1) // tile_size
+    if active_tiles is not None:
+        region = tile_neighborhood(active_tiles, tile_rows, tile_cols)
+    if 0 in rule.birth:
+        # Empty tiles can come alive under B0 rules, so everything is active
+        active_tiles = None
+    if active_tiles is None or len(region) * 2 > tile_rows * tile_cols:
+        return _step_all_tiles(grid, rule, tile_size)
+    new_grid = list(grid)
+    spans_by_band = {}
+    for tr, tc in region:
+        spans_by_band.setdefault(tr, []).append(tc)
+    table = rule.table
+    changed = set()
+    births = deaths = 0
+    for tr, tile_cols_in_band in spans_by_band.items():
+        for i in range(tr * tile_size, min((tr + 1) * tile_size, rows)):
+            old_row = grid[i]
+            above, below = grid[i - 1], grid[(i + 1) % rows]
+            new_row = None
+            for tc in tile_cols_in_band:
+                for j in range(tc * tile_size, min((tc + 1) * tile_size, cols)):
+                    left, right = j - 1, (j + 1) % cols
+                    neighbors = (above[left] + above[j] + above[right]
+                                 + old_row[left] + old_row[right]
+                                 + below[left] + below[j] + below[right])
+                    cell = table[old_row[j]][neighbors]
+                    if cell != old_row[j]:
+                        if new_row is None:
+                            new_row = old_row[:]
+                        new_row[j] = cell
+                        changed.add((tr, tc))
+                        if cell:
+                            births += 1
+                        else:
+                            deaths += 1
+            if new_row is not None:
+                new_grid[i] = new_row
+    return new_grid, changed, births, deaths
+
 # ========================
 # Pattern Support
 # ========================
 
+PATTERN_LIBRARY = {
+    'glider': [
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 1, 1]
+    ],
+    'blinker': [
+        [0, 1, 0],
+        [0, 1, 0],
+        [0, 1, 0]
+    ],
+    'block': [
+        [1, 1],
+        [1, 1]
+    ],
+    'beehive': [
+        [0, 1, 1, 0],
+        [1, 0, 0, 1],
+        [0, 1, 1, 0]
+    ],
+    'loaf': [
+        [0, 1, 1, 0],
+        [1, 0, 0, 1],
+        [0, 1, 0, 1],
+        [0, 0, 1, 0]
+    ],
+    'boat': [
+        [1, 1, 0],
+        [1, 0, 1],
+        [0, 1, 0]
+    ],
+    'tub': [
+        [0, 1, 0],
+        [1, 0, 1],
+        [0, 1, 0]
+    ],
+    'beacon': [
+        [1, 1, 0, 0],
+        [1, 1, 0, 0],
+        [0, 0, 1, 1],
+        [0, 0, 1, 1]
+    ],
+    'toad': [
+        [0, 1, 1, 1],
+        [1, 1, 1, 0]
+    ],
+    'pulsar': [
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [1,0,0,0,0,1,0,1,0,0,0,0,1],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,1,1,1,0,0,0,1,1,1,0,0]
+    ],
+    'gosper_gun': [
+        [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1],
+        [0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1],
+        [1,1,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [1,1,0,0,0,0,0,0,0,0,1,0,0,0,1,0,1,1,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
+        [0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
+    ],
+    'penta_decathlon': [
+        [0,0,1,0,0,0,0,1,0,0],
+        [1,1,0,1,1,1,1,0,1,1],
+        [0,0,1,0,0,0,0,1,0,0]
+    ],
+    'lightweight_spaceship': [
+        [1,0,0,1,0],
+        [0,0,0,0,1],
+        [1,0,0,0,1],
+        [0,1,1,1,1]
+    ]
+}
+
 def load_pattern(pattern_name):
     """Load common Game of Life patterns"""
-    patterns = {
-        'glider': [
-            [0, 1, 0],
-            [0, 0, 1],
-            [1, 1, 1]
-        ],
-        'blinker': [
-            [0, 1, 0],
-            [0, 1, 0],
-            [0, 1, 0]
-        ],
-        'block': [
-            [1, 1],
-            [1, 1]
-        ],
-        'beehive': [
-            [0, 1, 1, 0],
-            [1, 0, 0, 1],
-            [0, 1, 1, 0]
-        ],
-        'loaf': [
-            [0, 1, 1, 0],
-            [1, 0, 0, 1],
-            [0, 1, 0, 1],
-            [0, 0, 1, 0]
-        ],
-        'boat': [
-            [1, 1, 0],
-            [1, 0, 1],
-            [0, 1, 0]
-        ],
-        'tub': [
-            [0, 1, 0],
-            [1, 0, 1],
-            [0, 1, 0]
-        ],
-        'beacon': [
-            [1, 1, 0, 0],
-            [1, 1, 0, 0],
-            [0, 0, 1, 1],
-            [0, 0, 1, 1]
-        ],
-        'toad': [
-            [0, 1, 1, 1],
-            [1, 1, 1, 0]
-        ],
-        'pulsar': [
-            [0,0,1,1,1,0,0,0,1,1,1,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,0,0],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [0,0,1,1,1,0,0,0,1,1,1,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,1,1,1,0,0,0,1,1,1,0,0],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [1,0,0,0,0,1,0,1,0,0,0,0,1],
-            [0,0,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,1,1,1,0,0,0,1,1,1,0,0]
-        ],
-        'gosper_gun': [
-            [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1],
-            [0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,1,1],
-            [1,1,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-            [1,1,0,0,0,0,0,0,0,0,1,0,0,0,1,0,1,1,0,0,0,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0,0,0,1,0,0,0,0,0,1,0,0,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,1,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],
-            [0,0,0,0,0,0,0,0,0,0,0,0,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0]
-        ],
-        'penta_decathlon': [
-            [0,0,1,0,0,0,0,1,0,0],
-            [1,1,0,1,1,1,1,0,1,1],
-            [0,0,1,0,0,0,0,1,0,0]
-        ],
-        'lightweight_spaceship': [
-            [1,0,0,1,0],
-            [0,0,0,0,1],
-            [1,0,0,0,1],
-            [0,1,1,1,1]
-        ]
-    }
-    return patterns.get(pattern_name.lower(), [])
+    pattern = PATTERN_INDEX.patterns.get(pattern_name.lower())
+    return [row[:] for row in pattern] if pattern else []
 
 def validate_pattern_data(pattern):
     """Validate that pattern data is properly formatted"""
@@ -173,7 +1313,10 @@ def verify_pattern_placement(original_grid, new_grid, pattern, start_row, start_
             grid_row = (start_row + i) % rows
             grid_col = (start_col + j) % cols
             expected = pattern[i][j]
-            actual = new_grid[grid_row][grid_col]
+            if isinstance(new_grid, (PackedBoard, SparseBoard)):
+                actual = new_grid.get(grid_row, grid_col)
+            else:
+                actual = new_grid[grid_row][grid_col]
             if actual != expected:
                 return False, f"Mismatch at grid({grid_row},{grid_col}): expected {expected}, got {actual}"
     return True, "Pattern placement verified"
@@ -181,8 +1324,11 @@ def verify_pattern_placement(original_grid, new_grid, pattern, start_row, start_
 def safe_load_and_place_pattern(grid, pattern_name, start_row=None, start_col=None):
     """
     Load and place a pattern with full validation.
+    pattern_name may also be the path of an RLE or Life 1.06 file.
     Returns (success: bool, message: str, new_grid or None)
     """
+    if pattern_name not in PATTERN_INDEX and os.path.isfile(pattern_name):
+        return _load_and_place_pattern_file(grid, pattern_name, start_row, start_col)
     pattern = load_pattern(pattern_name)
     if not pattern:
         return False, f"Pattern '{pattern_name}' not found", None
@@ -208,12 +1354,43 @@ def safe_load_and_place_pattern(grid, pattern_name, start_row=None, start_col=No
         return False, f"Placement verification failed: {msg}", None
 
     return True, f"Pattern '{pattern_name}' loaded successfully", new_grid
+
+def _load_and_place_pattern_file(grid, filename, start_row=None, start_col=None):
+    """Place a pattern file on grid, centered by default; same contract as safe_load_and_place_pattern"""
+    engine = 'packed' if isinstance(grid, PackedBoard) else 'sparse'
+    success, msg, pattern_board, rule = load_pattern_file(filename, engine)
+    if not success:
+        return False, msg, None
+    rows, cols = board_shape(grid)
+    p_rows, p_cols = pattern_board.rows, pattern_board.cols
+    if p_rows > rows or p_cols > cols:
+        return False, f"Pattern {p_rows}x{p_cols} too large for grid {rows}x{cols}", None
+    if start_row is None:
+        start_row = (rows - p_rows) // 2
+    if start_col is None:
+        start_col = (cols - p_cols) // 2
+    new_grid = place_cells(grid, pattern_board, start_row, start_col)
+    for i, j in iter_live_cells(pattern_board):
+        r, c = (start_row + i) % rows, (start_col + j) % cols
+        actual = new_grid.get(r, c) if isinstance(new_grid, (PackedBoard, SparseBoard)) else new_grid[r][c]
+        if not actual:
+            return False, f"Placement verification failed: cell ({r},{c}) is not set", None
+    name = os.path.basename(filename)
+    note = f" (rule {rule})" if rule != CONWAY else ""
+    return True, f"Pattern '{name}' loaded successfully{note}", new_grid
+
 def place_pattern(grid, pattern, start_row, start_col):
     """Place a pattern on the grid at specified position with wrapping"""
     if not pattern:
         return grid
     rows, cols = len(grid), len(grid[0])
     pattern_rows, pattern_cols = len(pattern), len(pattern[0])
+    if isinstance(grid, (PackedBoard, SparseBoard)):
+        new_board = grid.copy()
+        for i in range(pattern_rows):
+            for j in range(pattern_cols):
+                new_board.set((start_row + i) % rows, (start_col + j) % cols, pattern[i][j])
+        return new_board
     new_grid = [row[:] for row in grid]
     for i in range(pattern_rows):
         for j in range(pattern_cols):
@@ -222,23 +1399,273 @@ def place_pattern(grid, pattern, start_row, start_col):
             new_grid[new_row][new_col] = pattern[i][j]
     return new_grid
 
+def place_cells(grid, pattern_board, start_row, start_col):
+    """
+    Add the live cells of a pattern board to grid at an offset, wrapping.
+    Unlike place_pattern, cells outside the pattern's live cells are left
+    alone, so huge file patterns never need a dense copy. Packed targets
+    take whole rows at a time.
+    """
+    rows, cols = board_shape(grid)
+    if isinstance(grid, PackedBoard):
+        new_board = grid.copy()
+        shift = start_col % cols
+        for i, value in enumerate(convert_board(pattern_board, 'packed').data):
+            if value:
+                rotated = ((value << shift) | (value >> (cols - shift))) & new_board.mask
+                new_board.data[(start_row + i) % rows] |= rotated
+        return new_board
+    if isinstance(grid, SparseBoard):
+        new_board = grid.copy()
+        new_board.live.update(((start_row + i) % rows, (start_col + j) % cols)
+                              for i, j in iter_live_cells(pattern_board))
+        return new_board
+    new_grid = list(grid)
+    for i, j in iter_live_cells(pattern_board):
+        r = (start_row + i) % rows
+        if new_grid[r] is grid[r]:
+            new_grid[r] = grid[r][:]
+        new_grid[r][(start_col + j) % cols] = 1
+    return new_grid
+
+DETECTION_PATTERNS = ('block', 'beehive', 'loaf', 'boat', 'tub', 'blinker', 'toad', 'beacon')
+
+def pattern_orientations(pattern):
+    """Return the distinct rotations and reflections of a pattern"""
+    orientations = []
+    current = [list(row) for row in pattern]
+    for _ in range(4):
+        for candidate in (current, [row[::-1] for row in current]):
+            if candidate not in orientations:
+                orientations.append(candidate)
+        current = [list(row) for row in zip(*current[::-1])]
+    return orientations
+
+def _window_code(pattern):
+    """Bit-weighted code of a pattern: bit di * width + dj is cell (di, dj)"""
+    width = len(pattern[0])
+    code = 0
+    for di, row in enumerate(pattern):
+        for dj, cell in enumerate(row):
+            if cell:
+                code |= 1 << (di * width + dj)
+    return code
+
+def _cells_key(cells):
+    """Bounding-box key (height, width, code) of a cell set; bit r * width + c is cell (r, c)"""
+    top = min(r for r, _ in cells)
+    left = min(c for _, c in cells)
+    width = max(c for _, c in cells) - left + 1
+    code = 0
+    for r, c in cells:
+        code |= 1 << ((r - top) * width + c - left)
+    return max(r for r, _ in cells) - top + 1, width, code
+
+def _key_cells(key):
+    """Inverse of _cells_key: the cells of a key, relative to its bounding box"""
+    _, width, code = key
+    cells = []
+    while code:
+        low = code & -code
+        cells.append(divmod(low.bit_length() - 1, width))
+        code ^= low
+    return cells
+
+def canonical_key(cells):
+    """Smallest bounding-box key of an object over its 8 rotations and reflections"""
+    return min(_cells_key([((-c if flip_c else c), (-r if flip_r else r)) if swap else
+                           ((-r if flip_r else r), (-c if flip_c else c)) for r, c in cells])
+               for flip_r, flip_c, swap in itertools.product((False, True), repeat=3))
+
+class PatternIndex:
+    """Symmetry-reduced index of named patterns.
+
+    Each pattern is stored with its distinct orientations and its canonical
+    key, the smallest bit-packed (height, width, code) form over the 8
+    rotations and reflections. by_key maps canonical keys back to names, so
+    identifying a shape in any orientation is a single dict lookup.
+    """
+    def __init__(self, library=None, detect=()):
+        self.patterns = {}
+        self.orientations = {}
+        self.canonical = {}
+        self.by_key = {}
+        self.detect = []
+        self.version = 0
+        for name, pattern in (library or {}).items():
+            self.register(name, pattern)
+        self.detect = [name for name in detect if name in self.patterns]
+
+    def register(self, name, pattern, detect=False):
+        """
+        Add or replace a named pattern.
+        detect adds it to the patterns find_patterns_in_grid looks for.
+        Returns (success: bool, message: str)
+        """
+        is_valid, msg = validate_pattern_data(pattern)
+        if not is_valid:
+            return False, f"Invalid pattern '{name}': {msg}"
+        cells = [(r, c) for r, row in enumerate(pattern) for c, cell in enumerate(row) if cell]
+        if not cells:
+            return False, f"Pattern '{name}' has no live cells"
+        name = name.lower()
+        old_key = self.canonical.get(name)
+        key = canonical_key(cells)
+        self.patterns[name] = [row[:] for row in pattern]
+        self.orientations[name] = pattern_orientations(pattern)
+        self.canonical[name] = key
+        if old_key is not None and old_key != key and self.by_key.get(old_key) == name:
+            # The old shape now belongs to the next name registered with it, if any
+            del self.by_key[old_key]
+            owner = next((other for other, other_key in self.canonical.items() if other_key == old_key), None)
+            if owner is not None:
+                self.by_key[old_key] = owner
+        self.by_key.setdefault(key, name)
+        if detect and name not in self.detect:
+            self.detect.append(name)
+        self.version += 1
+        return True, f"Pattern '{name}' registered"
+
+    def lookup(self, pattern):
+        """Name of the registered pattern with this shape in any orientation, or None"""
+        cells = [(r, c) for r, row in enumerate(pattern) for c, cell in enumerate(row) if cell]
+        return self.by_key.get(canonical_key(cells)) if cells else None
+
+    def names(self):
+        return list(self.patterns)
+
+    def __contains__(self, name):
+        return name.lower() in self.patterns
+
+    def __len__(self):
+        return len(self.patterns)
+
+PATTERN_INDEX = PatternIndex(PATTERN_LIBRARY, detect=DETECTION_PATTERNS)
+
+def register_pattern(name, pattern, detect=False):
+    """
+    Register an extra pattern so it can be loaded, detected and named in
+    the object census like the built-in ones.
+    Returns (success: bool, message: str)
+    """
+    return PATTERN_INDEX.register(name, pattern, detect)
+
+_pattern_detectors = {}
+
+def _pattern_detector(names):
+    """Build (once per set of names) the orientation tables detect_patterns uses.
+
+    Returns (by_shape, by_anchor). by_shape groups orientations by the
+    window used for the vectorized codes: windows are capped at 64 cells so
+    codes fit a uint64, and larger patterns are verified cell by cell.
+    by_anchor groups them by shape and the offset of the first live cell,
+    for the pure-Python scan that starts from live cells.
+    """
+    cache_key = (names, PATTERN_INDEX.version)
+    detector = _pattern_detectors.get(cache_key)
+    if detector is not None:
+        return detector
+    by_shape = {}
+    by_anchor = {}
+    for name in names:
+        for oriented in PATTERN_INDEX.orientations.get(name, ()):
+            h, w = len(oriented), len(oriented[0])
+            kw = min(w, 64)
+            kh = min(h, 64 // kw)
+            prefix = [row[:kw] for row in oriented[:kh]]
+            exact = (kh, kw) == (h, w)
+            by_shape.setdefault((kh, kw), {}).setdefault(_window_code(prefix), []).append(
+                (name, oriented, exact))
+            anchor = next((di, dj) for di, row in enumerate(oriented)
+                          for dj, cell in enumerate(row) if cell)
+            by_anchor.setdefault((h, w) + anchor, {}).setdefault(_window_code(oriented), []).append(name)
+    detector = (by_shape, by_anchor)
+    _pattern_detectors[cache_key] = detector
+    return detector
+
+def _window_codes_numpy(board, h, w, wrap):
+    """uint64 window code of every h x w window of board, top-left indexed"""
+    if wrap:
+        board = np.pad(board, ((0, h - 1), (0, w - 1)), mode='wrap')
+    out_rows, out_cols = board.shape[0] - h + 1, board.shape[1] - w + 1
+    row_codes = np.zeros((board.shape[0], out_cols), dtype=np.uint64)
+    for dj in range(w):
+        row_codes |= board[:, dj:dj + out_cols].astype(np.uint64) << np.uint64(dj)
+    codes = np.zeros((out_rows, out_cols), dtype=np.uint64)
+    for di in range(h):
+        codes |= row_codes[di:di + out_rows] << np.uint64(di * w)
+    return codes
+
+def _detect_patterns_numpy(board, by_shape, wrap):
+    """Match every orientation with one window-code pass per window shape"""
+    rows, cols = board.shape
+    matches = {}
+    padded = {}
+    for (kh, kw), lookup in by_shape.items():
+        if kh > rows or kw > cols:
+            continue
+        codes = _window_codes_numpy(board, kh, kw, wrap)
+        keys = np.fromiter(lookup, dtype=np.uint64, count=len(lookup))
+        for i, j in zip(*np.nonzero(np.isin(codes, keys))):
+            for name, oriented, exact in lookup[int(codes[i, j])]:
+                h, w = len(oriented), len(oriented[0])
+                if h > rows or w > cols or (not wrap and (i + h > rows or j + w > cols)):
+                    continue
+                if not exact:
+                    if (h, w) not in padded:
+                        padded[(h, w)] = np.pad(board, ((0, h - 1), (0, w - 1)), mode='wrap')
+                    window = padded[(h, w)][i:i + h, j:j + w]
+                    if not np.array_equal(window, np.array(oriented, dtype=window.dtype)):
+                        continue
+                matches.setdefault(name, []).append((int(i), int(j)))
+    return matches
+
+def _detect_patterns_packed(board, by_anchor, wrap):
+    """Match every orientation by reading windows anchored on live cells"""
+    rows, cols = board.rows, board.cols
+    extended = [row | (row << cols) for row in board.data]
+    matches = {}
+    for i, c in iter_live_cells(board):
+        for (h, w, ai, aj), lookup in by_anchor.items():
+            if h > rows or w > cols:
+                continue
+            top, left = i - ai, c - aj
+            if wrap:
+                top, left = top % rows, left % cols
+            elif top < 0 or left < 0 or top + h > rows or left + w > cols:
+                continue
+            mask = (1 << w) - 1
+            code = 0
+            for di in range(h):
+                code |= ((extended[(top + di) % rows] >> left) & mask) << (di * w)
+            for name in lookup.get(code, ()):
+                matches.setdefault(name, []).append((top, left))
+    return matches
+
+def detect_patterns(grid, names=None, wrap=True):
+    """
+    Find every placement of the named library patterns, in any rotation or
+    reflection, in a single scan of the board.
+    Windows wrap around the edges like the simulation does unless wrap is
+    False. names defaults to the index's detection set. Works on any board
+    type; uses numpy when available.
+    Returns {name: [(row, col), ...]} with the top-left corner of each
+    match, for the patterns found at least once
+    """
+    names = tuple(PATTERN_INDEX.detect if names is None else names)
+    by_shape, by_anchor = _pattern_detector(names)
+    rows, cols = board_shape(grid)
+    if rows == 0 or cols == 0:
+        return {}
+    if np is not None:
+        matches = _detect_patterns_numpy(convert_board(grid, 'numpy'), by_shape, wrap)
+    else:
+        matches = _detect_patterns_packed(convert_board(grid, 'packed'), by_anchor, wrap)
+    return {name: sorted(matches[name]) for name in names if name in matches}
+
 def find_patterns_in_grid(grid):
     """Scan grid for known patterns"""
-    patterns_found = []
-    pattern_library = {
-        'block': load_pattern('block'),
-        'beehive': load_pattern('beehive'),
-        'loaf': load_pattern('loaf'),
-        'boat': load_pattern('boat'),
-        'tub': load_pattern('tub'),
-        'blinker': load_pattern('blinker'),
-        'toad': load_pattern('toad'),
-        'beacon': load_pattern('beacon')
-    }
-    for name, pattern in pattern_library.items():
-        if pattern and pattern_exists_in_grid(grid, pattern):
-            patterns_found.append(name)
-    return patterns_found
+    return list(detect_patterns(grid))
 
 def pattern_exists_in_grid(grid, pattern):
     """Check if pattern exists anywhere in grid (non-wrapping)"""
@@ -262,66 +1689,865 @@ def pattern_exists_in_grid(grid, pattern):
                 return True
     return False
 
+# ========================
+# Object Census
+# ========================
+
+CENSUS_KINDS = ('still life', 'oscillator', 'spaceship', 'other')
+CENSUS_SIMULATE_CELLS = 16  # unknown components larger than this are 'other' without being simulated
+CENSUS_CACHE_SIZE = 65536  # classified shapes remembered per rule (least recently used are dropped)
+_CENSUS_TABLES_KEPT = 4
+
+# (rule, max_period, index version) -> (library table, library object sizes, learned shapes LRU)
+_census_tables = OrderedDict()
+
+# Live cells up to two apart belong to one object, so objects with one-cell gaps
+# (the LWSS, the pulsar) stay whole; these are the links to later cells in row-major order
+CENSUS_LINK_DISTANCE = 2
+_CENSUS_LINKS = tuple((dr, dc) for dr in range(CENSUS_LINK_DISTANCE + 1)
+                      for dc in range(-CENSUS_LINK_DISTANCE, CENSUS_LINK_DISTANCE + 1)
+                      if dr > 0 or dc > 0)
+
+def _unwrap_cells(cells, rows, cols):
+    """Shift the cells of an object that straddles the board edge so it is contiguous"""
+    for axis, size in ((0, rows), (1, cols)):
+        occupied = sorted({cell[axis] for cell in cells})
+        gap, cut = occupied[0] + size - occupied[-1], None
+        for a, b in zip(occupied, occupied[1:]):
+            if b - a > gap:
+                gap, cut = b - a, a
+        if cut is not None:
+            cells = [tuple(v + size if k == axis and v <= cut else v for k, v in enumerate(cell))
+                     for cell in cells]
+    return cells
+
+def _simulate_object(cells, rule, max_period):
+    """Run an object in isolation until it repeats its own phase.
+
+    Returns (kind, period, phase_keys); kind is 'other' when the object dies,
+    changes into something else or does not repeat within max_period.
+    """
+    start = _cells_key(cells)
+    pad = max_period + 2
+    board = SparseBoard(start[0] + 2 * pad, start[1] + 2 * pad,
+                        ((r + pad, c + pad) for r, c in _key_cells(start)))
+    phases = [cells]
+    seen = set()
+    for gen in range(1, max_period + 1):
+        board = next_generation_sparse(board, rule)
+        if not board.live:
+            break
+        key = _cells_key(board.live)
+        if key == start:
+            moved = (min(r for r, _ in board.live), min(c for _, c in board.live)) != (pad, pad)
+            kind = 'spaceship' if moved else ('still life' if gen == 1 else 'oscillator')
+            return kind, gen, [canonical_key(phase) for phase in phases]
+        if key in seen:
+            # Settled into a cycle that does not contain the starting phase
+            break
+        seen.add(key)
+        phases.append(board.live)
+    return 'other', None, [canonical_key(cells)]
+
+def _census_table(rule, max_period):
+    """Classification tables for a rule: (canonical key -> (name, kind, period) for every
+    phase of the indexed objects, their cell counts, LRU of shapes classified since)"""
+    cache_key = (rule, max_period, PATTERN_INDEX.version)
+    tables = _census_tables.get(cache_key)
+    if tables is None:
+        table = {}
+        for name, pattern in PATTERN_INDEX.patterns.items():
+            cells = [(r, c) for r, row in enumerate(pattern) for c, cell in enumerate(row) if cell]
+            kind, period, phases = _simulate_object(cells, rule, max_period)
+            if kind != 'other':
+                for phase in phases:
+                    table.setdefault(phase, (name, kind, period))
+        sizes = {len(_key_cells(phase)) for phase in table}
+        tables = _census_tables[cache_key] = (table, sizes, OrderedDict())
+        while len(_census_tables) > _CENSUS_TABLES_KEPT:
+            _census_tables.popitem(last=False)
+    else:
+        _census_tables.move_to_end(cache_key)
+    return tables
+
+def classify_object(cells, rule=CONWAY, max_period=30):
+    """
+    Classify one object given its live cells.
+    Library objects are looked up by canonical key; other objects of up to
+    CENSUS_SIMULATE_CELLS cells are run in isolation and named with
+    apgsearch-style prefixes (xs<cells> for still lifes, xp<period> for
+    oscillators, xq<period> for spaceships). Larger unknown components are
+    'other'. Results are remembered in a bounded LRU.
+    Returns (name, kind, period)
+    """
+    return _classify_key(_cells_key(cells), len(cells), rule, max_period)
+
+def _classify_key(key, size, rule, max_period):
+    """classify_object for a bounding-box key of an object with size live cells"""
+    table, sizes, learned = _census_table(rule, max_period)
+    if size > CENSUS_SIMULATE_CELLS and size not in sizes:
+        return ('other', 'other', None)
+    result = learned.get(key)
+    if result is not None:
+        learned.move_to_end(key)
+        return result
+    cells = _key_cells(key)
+    result = table.get(canonical_key(cells))
+    if result is None:
+        kind, period = ('other', None)
+        if size <= CENSUS_SIMULATE_CELLS:
+            kind, period, _ = _simulate_object(cells, rule, max_period)
+        result = _census_name(kind, period, size)
+    _learn_object(learned, key, result)
+    return result
+
+def _census_name(kind, period, size):
+    """apgsearch-style (name, kind, period) for an object that is not in the library"""
+    if kind == 'still life':
+        return (f"xs{size}", kind, period)
+    if kind == 'oscillator':
+        return (f"xp{period}", kind, period)
+    if kind == 'spaceship':
+        return (f"xq{period}", kind, period)
+    return ('other', kind, period)
+
+def _learn_object(learned, key, result):
+    learned[key] = result
+    if len(learned) > CENSUS_CACHE_SIZE:
+        learned.popitem(last=False)
+
+_BATCH_CROP = 16  # bounding boxes up to this size are simulated together by _simulate_keys_numpy
+_BATCH_PAD = 6  # free cells around each object; reaching the edge of the box counts as 'other'
+_BATCH_CHUNK = 2048
+
+def _simulate_keys_numpy(keys, rule, max_period):
+    """Run many small objects in isolation at once; the vectorized counterpart of _simulate_object.
+
+    Each object gets its own zero-padded box in one (n, size, size) array
+    that is stepped with the rule table. After every generation the object's
+    window at its bounding-box corner is compared with its starting shape.
+    Objects are sorted by size so each chunk's boxes are only as big as needed.
+    Returns [(kind, period)] in the order of keys.
+    """
+    order = sorted(range(len(keys)), key=lambda index: max(keys[index][:2]))
+    keys = [keys[index] for index in order]
+    pad = _BATCH_PAD
+    kinds = np.full(len(keys), 3, dtype=np.int8)  # index into CENSUS_KINDS, 'other' until matched
+    periods = np.zeros(len(keys), dtype=np.int64)
+    for first in range(0, len(keys), _BATCH_CHUNK):
+        chunk = keys[first:first + _BATCH_CHUNK]
+        crop = max(max(key[:2]) for key in chunk)
+        size = crop + 2 * pad
+        span = np.arange(crop)
+        start = np.zeros((len(chunk), crop, crop), dtype=np.uint8)
+        # Codes that fit in 64 bits are unpacked together, wider ones cell by cell
+        narrow = np.array([key[0] * key[1] <= 64 for key in chunk])
+        heights = np.array([key[0] for key in chunk], dtype=np.int64)
+        widths = np.array([key[1] for key in chunk], dtype=np.int64)
+        codes = np.array([key[2] if key[0] * key[1] <= 64 else 0 for key in chunk], dtype=np.uint64)
+        for r in range(crop):
+            for c in range(crop):
+                inside = narrow & (r < heights) & (c < widths)
+                shift = np.where(inside, r * widths + c, 0).astype(np.uint64)
+                start[:, r, c] = ((codes >> shift) & np.uint64(1)).astype(np.uint8) & inside
+        for index in np.flatnonzero(~narrow):
+            for r, c in _key_cells(chunk[index]):
+                start[index, r, c] = 1
+        population = start.sum(axis=(1, 2))
+        board = np.zeros((len(chunk), size, size), dtype=np.uint8)
+        board[:, pad:pad + crop, pad:pad + crop] = start
+        active = np.arange(len(chunk))
+        previous = [board]
+        for gen in range(1, max_period + 1):
+            if not len(active):
+                break
+            padded = np.pad(board, ((0, 0), (1, 1), (1, 1)))
+            across = padded[:, :, :-2] + padded[:, :, 1:-1] + padded[:, :, 2:]
+            counts = across[:, :-2] + across[:, 1:-1] + across[:, 2:] - board
+            board = rule.array[board, counts]
+            live = board.sum(axis=(1, 2))
+            edge = (board[:, 0].any(axis=1) | board[:, -1].any(axis=1) |
+                    board[:, :, 0].any(axis=1) | board[:, :, -1].any(axis=1))
+            top = board.any(axis=2).argmax(axis=1)
+            left = board.any(axis=1).argmax(axis=1)
+            rows = np.minimum(top[:, None] + span, size - 1)
+            cols = np.minimum(left[:, None] + span, size - 1)
+            window = board[np.arange(len(active))[:, None, None], rows[:, :, None], cols[:, None, :]]
+            match = ~edge & (live == population[active]) & (window == start[active]).all(axis=(1, 2))
+            moved = (top != pad) | (left != pad)
+            matched = first + active[match]
+            kinds[matched] = np.where(moved[match], 2, 0 if gen == 1 else 1)
+            periods[matched] = gen
+            # Debris that has settled into a still life or blinker-like p2 without
+            # passing through the starting shape will never return to it
+            settled = np.zeros(len(active), dtype=bool)
+            for earlier in previous:
+                settled |= (board == earlier).all(axis=(1, 2))
+            keep = ~(match | edge | settled | (live == 0))
+            previous = [earlier[keep] for earlier in (board, previous[0])]
+            board, active = board[keep], active[keep]
+    results = [None] * len(keys)
+    for index, kind, period in zip(order, kinds.tolist(), periods.tolist()):
+        results[index] = (CENSUS_KINDS[kind], period if kind != 3 else None)
+    return results
+
+def _component_keys_numpy(board, max_cells=None, sizes=()):
+    """Label components of cells within CENSUS_LINK_DISTANCE with a vectorized union-find.
+
+    Returns (Counter of bounding-box keys, one per component, number of
+    components skipped for having more than max_cells cells and a cell count
+    not in sizes). Live cells
+    are linked to the later cells of _CENSUS_LINKS (wrapping) by binary
+    search in the sorted cell index, then labels are merged by hooking and
+    pointer jumping until every link joins cells with the same label.
+    """
+    rows, cols = board.shape
+    live_r, live_c = np.nonzero(board)
+    n = len(live_r)
+    if n == 0:
+        return Counter(), 0
+    live_r, live_c = live_r.astype(np.int64), live_c.astype(np.int64)
+    flat = live_r * cols + live_c
+    sources, targets = [], []
+    for dr, dc in _CENSUS_LINKS:
+        target = (live_r + dr) % rows * cols + (live_c + dc) % cols
+        pos = np.minimum(np.searchsorted(flat, target), n - 1)
+        hit = flat[pos] == target
+        sources.append(np.nonzero(hit)[0])
+        targets.append(pos[hit])
+    u, v = np.concatenate(sources), np.concatenate(targets)
+    labels = np.arange(n)
+    while True:
+        lu, lv = labels[u], labels[v]
+        split = lu != lv
+        if not split.any():
+            break
+        lu, lv = lu[split], lv[split]
+        np.minimum.at(labels, np.maximum(lu, lv), np.minimum(lu, lv))
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    order = np.argsort(labels, kind='stable')
+    sorted_labels = labels[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_labels)) + 1))
+    counts = np.diff(np.append(starts, n))
+    rs, cs = live_r[order], live_c[order]
+    skipped = 0
+    if max_cells is not None:
+        wanted = (counts <= max_cells) | np.isin(counts, list(sizes))
+        skipped = int(len(starts) - np.count_nonzero(wanted))
+        if skipped:
+            keep = np.repeat(wanted, counts)
+            rs, cs = rs[keep], cs[keep]
+            counts = counts[wanted]
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            if not len(counts):
+                return Counter(), skipped
+    top, bottom = np.minimum.reduceat(rs, starts), np.maximum.reduceat(rs, starts)
+    left, right = np.minimum.reduceat(cs, starts), np.maximum.reduceat(cs, starts)
+    heights, widths = bottom - top + 1, right - left + 1
+    straddles = ((top == 0) & (bottom == rows - 1)) | ((left == 0) & (right == cols - 1))
+    small = ~straddles & (heights * widths <= 63)
+    keys = Counter()
+    # Small components: build uint64 codes for all of them at once
+    owner = np.repeat(np.arange(len(starts)), counts)
+    bits = (rs - top[owner]) * widths[owner] + cs - left[owner]
+    bits = np.where(small[owner], bits, 0).astype(np.uint64)
+    codes = np.bitwise_or.reduceat(np.left_shift(np.uint64(1), bits), starts)
+    stacked = np.stack([heights[small].astype(np.uint64), widths[small].astype(np.uint64), codes[small]], axis=1)
+    if len(stacked):
+        unique, repeats = np.unique(stacked, axis=0, return_counts=True)
+        for (h, w, code), count in zip(unique.tolist(), repeats.tolist()):
+            keys[(h, w, code)] += count
+    for index in np.flatnonzero(~small):
+        span = slice(starts[index], starts[index] + counts[index])
+        cells = list(zip(rs[span].tolist(), cs[span].tolist()))
+        keys[_cells_key(_unwrap_cells(cells, rows, cols))] += 1
+    return keys, skipped
+
+def _component_keys_sparse(board, max_cells=None, sizes=()):
+    """Label components by flood fill over the live-cell set (same result as the numpy version)"""
+    rows, cols = board.rows, board.cols
+    unvisited = set(iter_live_cells(board))
+    keys = Counter()
+    skipped = 0
+    while unvisited:
+        stack = [unvisited.pop()]
+        cells = []
+        while stack:
+            r, c = stack.pop()
+            cells.append((r, c))
+            for dr in range(-CENSUS_LINK_DISTANCE, CENSUS_LINK_DISTANCE + 1):
+                for dc in range(-CENSUS_LINK_DISTANCE, CENSUS_LINK_DISTANCE + 1):
+                    neighbor = ((r + dr) % rows, (c + dc) % cols)
+                    if neighbor in unvisited:
+                        unvisited.remove(neighbor)
+                        stack.append(neighbor)
+        if max_cells is not None and len(cells) > max_cells and len(cells) not in sizes:
+            skipped += 1
+        else:
+            keys[_cells_key(_unwrap_cells(cells, rows, cols))] += 1
+    return keys, skipped
+
+def object_census(grid, rule=CONWAY, max_period=30):
+    """
+    Count and classify the objects on a board.
+    Live cells are split into components of cells at most
+    CENSUS_LINK_DISTANCE apart (wrapping around the edges), each component
+    is canonicalized under the 8 symmetries and looked up in a table of
+    known objects; small unseen shapes are classified once by running them
+    in isolation (see classify_object). Objects closer than that to each
+    other form one component and are counted as 'other', and so are
+    objects built from pieces further apart, such as the Gosper gun.
+    Components too large to be anything known are counted as 'other' during
+    labeling. Works on any board type.
+    Returns {kind: Counter({name: count})} for the kinds in CENSUS_KINDS
+    """
+    sizes = _census_table(rule, max_period)[1]
+    if np is not None:
+        keys, skipped = _component_keys_numpy(convert_board(grid, 'numpy'), CENSUS_SIMULATE_CELLS, sizes)
+    else:
+        keys, skipped = _component_keys_sparse(convert_board(grid, 'sparse'), CENSUS_SIMULATE_CELLS, sizes)
+    census = {kind: Counter() for kind in CENSUS_KINDS}
+    if skipped:
+        census['other']['other'] += skipped
+    table, _, learned = _census_table(rule, max_period)
+    batch = []
+    for key, count in keys.items():
+        result = learned.get(key)
+        if result is not None:
+            learned.move_to_end(key)
+        elif np is not None and key[0] <= _BATCH_CROP and key[1] <= _BATCH_CROP:
+            batch.append(key)
+            continue
+        else:
+            result = _classify_key(key, _popcount(key[2]), rule, max_period)
+        census[result[1]][result[0]] += keys[key]
+    # Unseen small shapes are simulated together; only those that turn out
+    # to be objects are canonicalized to look up their library name
+    for key, (kind, period) in zip(batch, _simulate_keys_numpy(batch, rule, max_period) if batch else ()):
+        result = _census_name(kind, period, _popcount(key[2]))
+        if kind != 'other':
+            result = table.get(canonical_key(_key_cells(key)), result)
+        _learn_object(learned, key, result)
+        census[result[1]][result[0]] += keys[key]
+    return census
+
 # ========================
 # Utilities & I/O
 # ========================
 
-def save_state(grid, generation, filename="game_save.json"):
-    """Save current game state to file"""
+def save_state(grid, generation, filename="game_save.json", rule=CONWAY):
+    """Save current game state to file (in the binary format for .golb names)"""
+    if filename.lower().endswith(BINARY_SAVE_EXTENSION):
+        return save_state_binary(grid, generation, filename, rule)
+    if filename.lower().endswith(MEMMAP_EXTENSION):
+        return save_state_memmap(grid, generation, filename, rule)
     try:
-        state = {
-            'grid': grid,
-            'generation': generation,
-            'rows': len(grid),
-            'cols': len(grid[0]) if grid else 0
-        }
+        if isinstance(grid, MemmapBoard):
+            grid = grid.to_packed()
+        elif np is not None and isinstance(grid, np.ndarray):
+            grid = array_to_grid(grid)
+        if isinstance(grid, PackedBoard):
+            state = {
+                'packed': True,
+                'grid': [format(value, 'x') for value in grid.data],
+                'generation': generation,
+                'rows': grid.rows,
+                'cols': grid.cols
+            }
+        elif isinstance(grid, SparseBoard):
+            state = {
+                'sparse': True,
+                'grid': sorted(grid.live),
+                'generation': generation,
+                'rows': grid.rows,
+                'cols': grid.cols
+            }
+        else:
+            state = {
+                'grid': grid,
+                'generation': generation,
+                'rows': len(grid),
+                'cols': len(grid[0]) if grid else 0
+            }
         with open(filename, 'w') as f:
             json.dump(state, f)
         return True, f"Game saved to {filename}"
     except Exception as e:
         return False, f"Error saving game: {str(e)}"
 
+def save_state_memmap(grid, generation, filename="game_save.golm", rule=CONWAY):
+    """
+    Save game state as a memory-mapped board file that can be reopened
+    with load_state and stepped in place with MemmapBoard.step.
+    Returns (success: bool, message: str)
+    """
+    if generation >= 1 << 64:
+        return False, f"Generation {generation} does not fit a {MEMMAP_EXTENSION} file; save as {BINARY_SAVE_EXTENSION} or JSON"
+    try:
+        if isinstance(grid, MemmapBoard) and os.path.abspath(grid.filename) == os.path.abspath(filename):
+            grid.generation = generation
+            grid.flush()
+        else:
+            rows, cols = board_shape(grid)
+            MemmapBoard.create(filename, rows, cols, rule, generation, board=grid).close()
+        return True, f"Game saved to {filename}"
+    except Exception as e:
+        return False, f"Error saving game: {str(e)}"
+
 def load_state(filename="game_save.json"):
-    """Load game state from file"""
+    """Load game state from file, detecting the JSON or binary format"""
     try:
+        with open(filename, 'rb') as f:
+            magic = f.read(len(BINARY_SAVE_MAGIC))
+        if magic == BINARY_SAVE_MAGIC:
+            success, board, generation, _ = load_state_binary(filename)
+            return success, board, generation
+        if magic == MEMMAP_MAGIC:
+            board = MemmapBoard(filename)
+            return True, board, board.generation
+        if magic == RUNLOG_MAGIC:
+            with RunLogReader(filename) as log:
+                return True, log[-1], log.generation_at(len(log) - 1)
         with open(filename, 'r') as f:
             state = json.load(f)
+        if state.get('packed'):
+            data = [int(value, 16) for value in state['grid']]
+            return True, PackedBoard(state['rows'], state['cols'], data), state['generation']
+        if state.get('sparse'):
+            live = (tuple(cell) for cell in state['grid'])
+            return True, SparseBoard(state['rows'], state['cols'], live), state['generation']
         return True, state['grid'], state['generation']
     except FileNotFoundError:
         return False, None, 0
     except Exception as e:
         return False, None, 0
 
-def export_as_image(grid, filename="generation.png", cell_size=10):
-    """Export current grid as PNG image"""
+BINARY_SAVE_MAGIC = b'GOLB'
+BINARY_SAVE_EXTENSION = '.golb'
+_BINARY_HEADER = struct.Struct('<4sBBBBIIQIH')
+_BINARY_WIDE_GENERATION = struct.Struct('<H')
+_COMPRESSIONS = (None, 'zlib', 'lzma')
+
+def _iter_packed_rows(grid):
+    """Yield each row of any board as little-endian bit-packed bytes (bit j = column j)"""
+    rows, cols = board_shape(grid)
+    row_bytes = (cols + 7) // 8
+    if isinstance(grid, MemmapBoard):
+        current = grid.buffers[grid.current]
+        for start in range(0, rows, grid.band_rows):
+            yield current[start:start + grid.band_rows].tobytes()
+        return
+    if np is not None and not isinstance(grid, (PackedBoard, SparseBoard)):
+        board = convert_board(grid, 'numpy')
+        for start in range(0, rows, 1024):
+            block = np.packbits(board[start:start + 1024].astype(bool), axis=1, bitorder='little')
+            yield block.tobytes()
+        return
+    for value in convert_board(grid, 'packed').data:
+        yield value.to_bytes(row_bytes, 'little')
+
+def _binary_generation(generation):
+    """(version, header field, trailing bytes) storing generation in a binary save.
+
+    Generations that fit 64 bits go in the header (version 1). Larger ones,
+    e.g. after a Hashlife jump, are written as a length-prefixed integer
+    after the rule text (version 2).
+    """
+    if generation < 1 << 64:
+        return 1, generation, b''
+    body = generation.to_bytes((generation.bit_length() + 7) // 8, 'little')
+    return 2, 0, _BINARY_WIDE_GENERATION.pack(len(body)) + body
+
+def save_state_binary(grid, generation, filename="game_save.golb", rule=CONWAY,
+                      compression='zlib', checksum=True):
+    """
+    Save game state in the compact binary format: a fixed header (magic,
+    engine, compression, dims, generation, CRC32, rule) followed by the
+    board bit-packed one bit per cell and optionally zlib or lzma compressed.
+    Rows are streamed through the compressor, so no full copy of the body
+    is ever held in memory.
+    Returns (success: bool, message: str)
+    """
     try:
-        from PIL import Image, ImageDraw
-        rows, cols = len(grid), len(grid[0])
-        img_width = cols * cell_size
-        img_height = rows * cell_size
-        img = Image.new('RGB', (img_width, img_height), 'white')
-        draw = ImageDraw.Draw(img)
-        for i in range(rows):
-            for j in range(cols):
-                if grid[i][j]:
-                    x1, y1 = j * cell_size, i * cell_size
-                    x2, y2 = x1 + cell_size, y1 + cell_size
-                    draw.rectangle([x1, y1, x2, y2], fill='black')
-        img.save(filename)
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"Unknown compression '{compression}'")
+        rows, cols = board_shape(grid)
+        engine = 'packed' if isinstance(grid, MemmapBoard) else board_engine(grid)
+        rule_text = str(rule).encode('ascii')
+        if compression == 'zlib':
+            compressor = zlib.compressobj(6)
+        elif compression == 'lzma':
+            compressor = lzma.LZMACompressor()
+        else:
+            compressor = None
+        version, header_generation, wide_generation = _binary_generation(generation)
+        crc = 0
+        with open(filename, 'wb') as f:
+            header = _BINARY_HEADER.pack(BINARY_SAVE_MAGIC, version, ENGINES.index(engine),
+                                         _COMPRESSIONS.index(compression), int(checksum),
+                                         rows, cols, header_generation, 0, len(rule_text))
+            f.write(header + rule_text + wide_generation)
+            for chunk in _iter_packed_rows(grid):
+                if checksum:
+                    crc = zlib.crc32(chunk, crc)
+                f.write(compressor.compress(chunk) if compressor else chunk)
+            if compressor:
+                f.write(compressor.flush())
+            if checksum:
+                f.seek(0)
+                f.write(_BINARY_HEADER.pack(BINARY_SAVE_MAGIC, version, ENGINES.index(engine),
+                                            _COMPRESSIONS.index(compression), 1,
+                                            rows, cols, header_generation, crc, len(rule_text)))
+        return True, f"Game saved to {filename}"
+    except Exception as e:
+        return False, f"Error saving game: {str(e)}"
+
+def load_state_binary(filename="game_save.golb"):
+    """
+    Load a binary save, rebuilding the board type it was saved from.
+    The body is decompressed in one call and unpacked with np.frombuffer
+    and np.unpackbits (or int.from_bytes per row without numpy).
+    Returns (success: bool, board or None, generation, rule or None)
+    """
+    try:
+        with open(filename, 'rb') as f:
+            header = f.read(_BINARY_HEADER.size)
+            (magic, version, engine, compression, flags,
+             rows, cols, generation, crc, rule_length) = _BINARY_HEADER.unpack(header)
+            if magic != BINARY_SAVE_MAGIC or version not in (1, 2):
+                raise ValueError("Not a binary save file")
+            rule = LifeRule.parse(f.read(rule_length).decode('ascii'))
+            if version == 2:
+                length, = _BINARY_WIDE_GENERATION.unpack(f.read(_BINARY_WIDE_GENERATION.size))
+                generation = int.from_bytes(f.read(length), 'little')
+            body = f.read()
+        compression = _COMPRESSIONS[compression]
+        if compression == 'zlib':
+            body = zlib.decompress(body)
+        elif compression == 'lzma':
+            body = lzma.decompress(body)
+        row_bytes = (cols + 7) // 8
+        if len(body) != rows * row_bytes:
+            raise ValueError("Truncated board data")
+        if flags & 1 and zlib.crc32(body) != crc:
+            raise ValueError("Checksum mismatch")
+        engine = ENGINES[engine]
+        if engine in ('numpy', 'list') and np is not None:
+            packed_rows = np.frombuffer(body, dtype=np.uint8).reshape(rows, row_bytes)
+            board = np.unpackbits(packed_rows, axis=1, count=cols, bitorder='little')
+            return True, (board if engine == 'numpy' else array_to_grid(board)), generation, rule
+        board = PackedBoard(rows, cols, (int.from_bytes(body[i:i + row_bytes], 'little')
+                                         for i in range(0, len(body), row_bytes)))
+        if engine == 'sparse':
+            board = convert_board(board, 'sparse')
+        elif engine != 'packed':
+            board = board.to_grid()
+        return True, board, generation, rule
+    except Exception as e:
+        return False, None, 0, None
+
+_RLE_TOKEN = re.compile(r'(\d*)([^\d])')
+_LIVE_RUN = re.compile('1+')
+
+def _read_rle_header(f):
+    """Skip comment lines and parse the 'x = m, y = n, rule = ...' header.
+
+    Returns (width, height, rule); the size is None when the header is
+    missing, in which case the file position is left at the first body line.
+    """
+    width = height = None
+    rule = CONWAY
+    while True:
+        position = f.tell()
+        line = f.readline()
+        if not line:
+            break
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if not stripped.startswith('x'):
+            f.seek(position)
+            break
+        fields = {}
+        for part in stripped.split(','):
+            key, _, value = part.partition('=')
+            fields[key.strip().lower()] = value.strip()
+        width, height = int(fields['x']), int(fields['y'])
+        if fields.get('rule'):
+            rule = LifeRule.parse(fields['rule'])
+        break
+    return width, height, rule
+
+def _iter_rle_runs(f, chunk_size=1 << 16):
+    """Yield (row, col, length) runs of live cells from the body of an RLE file.
+
+    The body is read in fixed-size chunks, so even a single multi-megabyte
+    line never has to be held in memory at once. A run count cut off at the
+    end of a chunk is carried over to the next one.
+    """
+    row = col = 0
+    carry = ''
+    for chunk in iter(lambda: f.read(chunk_size), ''):
+        chunk = carry + ''.join(chunk.split())
+        body = chunk.rstrip('0123456789')
+        carry = chunk[len(body):]
+        for count, tag in _RLE_TOKEN.findall(body):
+            length = int(count) if count else 1
+            if tag in 'b.':
+                col += length
+            elif tag == '$':
+                row += length
+                col = 0
+            elif tag == '!':
+                return
+            else:
+                yield row, col, length
+                col += length
+
+def _iter_life106_cells(f):
+    """Yield (row, col) for every cell line of a Life 1.06 file"""
+    for line in f:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            x, y = line.split()
+            yield int(y), int(x)
+
+def _board_from_runs(runs, engine, rows=None, cols=None):
+    """Build a SparseBoard or PackedBoard from (row, col, length) runs of live cells.
+
+    The board is at least rows x cols and grows to fit every run.
+    """
+    rows, cols = rows or 0, cols or 0
+    if engine == 'packed':
+        data = {}
+        for r, c, length in runs:
+            data[r] = data.get(r, 0) | (((1 << length) - 1) << c)
+        if data:
+            rows = max(rows, max(data) + 1)
+            cols = max(cols, max(value.bit_length() for value in data.values()))
+        return PackedBoard(rows, cols, (data.get(i, 0) for i in range(rows)))
+    if engine != 'sparse':
+        raise ValueError(f"Pattern files load into 'sparse' or 'packed' boards, not '{engine}'")
+    live = set()
+    for r, c, length in runs:
+        live.update((r, c + k) for k in range(length))
+        rows, cols = max(rows, r + 1), max(cols, c + length)
+    return SparseBoard(rows, cols, live)
+
+def read_rle(filename, engine='sparse'):
+    """
+    Stream an RLE pattern file straight into a SparseBoard or PackedBoard.
+    Returns (success: bool, message: str, board or None, rule or None)
+    """
+    try:
+        with open(filename, 'r') as f:
+            width, height, rule = _read_rle_header(f)
+            board = _board_from_runs(_iter_rle_runs(f), engine, height, width)
+        return True, f"Read {board.population()} cells from {filename}", board, rule
+    except (OSError, ValueError, KeyError) as e:
+        return False, f"Error reading RLE file: {str(e)}", None, None
+
+def read_life106(filename, engine='sparse'):
+    """
+    Stream a Life 1.06 file into a SparseBoard or PackedBoard.
+    Coordinates may be negative, so the file is read twice: once for the
+    bounding box and once to place the cells.
+    Returns (success: bool, message: str, board or None, rule or None)
+    """
+    try:
+        with open(filename, 'r') as f:
+            top = left = None
+            for r, c in _iter_life106_cells(f):
+                top = r if top is None else min(top, r)
+                left = c if left is None else min(left, c)
+            f.seek(0)
+            runs = ((r - top, c - left, 1) for r, c in _iter_life106_cells(f))
+            board = _board_from_runs(runs, engine)
+        return True, f"Read {board.population()} cells from {filename}", board, CONWAY
+    except (OSError, ValueError) as e:
+        return False, f"Error reading Life 1.06 file: {str(e)}", None, None
+
+def load_pattern_file(filename, engine='sparse'):
+    """
+    Load an RLE or Life 1.06 pattern file, picking the format from the
+    extension or, failing that, the first line.
+    Returns (success: bool, message: str, board or None, rule or None)
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in ('.lif', '.life'):
+        return read_life106(filename, engine)
+    if extension != '.rle':
+        try:
+            with open(filename, 'r') as f:
+                first_line = f.readline()
+        except OSError as e:
+            return False, f"Error reading pattern file: {str(e)}", None, None
+        if first_line.startswith('#Life 1.06'):
+            return read_life106(filename, engine)
+    return read_rle(filename, engine)
+
+def _iter_row_runs(packed):
+    """Yield (row, [(col, length), ...]) for every non-empty row of a PackedBoard"""
+    for i, value in enumerate(packed.data):
+        if value:
+            # Scan the row's binary digits (least significant first) in C
+            bits = format(value, 'b')[::-1]
+            yield i, [(match.start(), match.end() - match.start()) for match in _LIVE_RUN.finditer(bits)]
+
+def write_rle(grid, filename="pattern.rle", rule=CONWAY, name=None):
+    """
+    Write the live cells of any board as an RLE pattern (cropped to their
+    bounding box), streaming rows to the file as they are encoded.
+    Returns (success: bool, message: str)
+    """
+    try:
+        packed = convert_board(grid, 'packed')
+        filled = [i for i, value in enumerate(packed.data) if value]
+        with open(filename, 'w') as f:
+            if name:
+                f.write(f"#N {name}\n")
+            if not filled:
+                f.write(f"x = 0, y = 0, rule = {rule}\n!\n")
+                return True, f"Empty pattern saved as {filename}"
+            top, bottom = filled[0], filled[-1]
+            left = min((packed.data[i] & -packed.data[i]).bit_length() - 1 for i in filled)
+            right = max(packed.data[i].bit_length() for i in filled)
+            f.write(f"x = {right - left}, y = {bottom - top + 1}, rule = {rule}\n")
+            line = ''
+            previous = top
+            for i, runs in _iter_row_runs(packed):
+                tokens = []
+                if i > previous:
+                    tokens.append(f"{i - previous if i - previous > 1 else ''}$")
+                previous = i
+                col = left
+                for start, length in runs:
+                    if start > col:
+                        tokens.append(f"{start - col if start - col > 1 else ''}b")
+                    tokens.append(f"{length if length > 1 else ''}o")
+                    col = start + length
+                for token in tokens:
+                    if len(line) + len(token) > 70:
+                        f.write(line + '\n')
+                        line = ''
+                    line += token
+            f.write(line + '!\n')
+        return True, f"Pattern saved as {filename}"
+    except Exception as e:
+        return False, f"Error writing RLE file: {str(e)}"
+
+def write_life106(grid, filename="pattern.lif"):
+    """
+    Write the live cells of any board in Life 1.06 format ('x y' per cell).
+    Returns (success: bool, message: str)
+    """
+    try:
+        with open(filename, 'w') as f:
+            f.write("#Life 1.06\n")
+            for i, runs in _iter_row_runs(convert_board(grid, 'packed')):
+                for start, length in runs:
+                    f.writelines(f"{j} {i}\n" for j in range(start, start + length))
+        return True, f"Pattern saved as {filename}"
+    except Exception as e:
+        return False, f"Error writing Life 1.06 file: {str(e)}"
+
+CELL_PALETTE = ((255, 255, 255), (0, 0, 0))  # RGB for dead, alive
+
+def density_palette(block, palette=CELL_PALETTE):
+    """Colours for 0..block*block live cells in a block, square-root scaled so sparse blocks stay visible"""
+    full = block * block
+    dead, alive = palette
+    return [tuple(round(d + (a - d) * (k / full) ** 0.5) for d, a in zip(dead, alive)) for k in range(full + 1)]
+
+def _board_window(grid, window):
+    """The (top, left, height, width) cell window of any board as a uint8 array"""
+    if window is None:
+        return np.asarray(convert_board(grid, 'numpy'), dtype=np.uint8)
+    top, left, height, width = window
+    if isinstance(grid, list):
+        rows = [row[left:left + width] for row in grid[top:top + height]]
+        return np.array(rows, dtype=np.uint8).reshape(height, width)
+    return np.asarray(convert_board(grid, 'numpy'), dtype=np.uint8)[top:top + height, left:left + width]
+
+def board_pixels(grid, cell_size=1, palette=CELL_PALETTE, window=None, block=1):
+    """Render any board to an RGB uint8 array (requires numpy).
+
+    window = (top, left, height, width) limits rendering to those cells.
+    With block > 1 each block x block group is reduced to its live count
+    and drawn as one density-shaded pixel before upscaling to cell_size.
+    """
+    cells = _board_window(grid, window)
+    if block > 1:
+        height, width = cells.shape
+        cells = np.pad(cells, ((0, -height % block), (0, -width % block)))
+        cells = cells.reshape(cells.shape[0] // block, block, cells.shape[1] // block, block).sum(axis=(1, 3))
+    pixels = np.asarray(density_palette(block, palette), dtype=np.uint8)[cells]
+    if cell_size > 1:
+        pixels = np.repeat(np.repeat(pixels, cell_size, axis=0), cell_size, axis=1)
+    return pixels
+
+def board_ppm(grid, cell_size=1, palette=CELL_PALETTE, window=None, block=1):
+    """Render any board (or a window of it, see board_pixels) as binary PPM data for Tk's PhotoImage"""
+    if np is not None:
+        pixels = board_pixels(grid, cell_size, palette, window, block)
+        return b'P6 %d %d 255\n' % (pixels.shape[1], pixels.shape[0]) + pixels.tobytes()
+    rows, cols = board_shape(grid)
+    top, left, height, width = window or (0, 0, rows, cols)
+    cells = [row[left:left + width] for row in convert_board(grid, 'list')[top:top + height]]
+    if block > 1:
+        cells = [[sum(sum(row[j:j + block]) for row in cells[i:i + block]) for j in range(0, width, block)]
+                 for i in range(0, height, block)]
+    colors = [bytes(color) * cell_size for color in density_palette(block, palette)]
+    header = b'P6 %d %d 255\n' % (len(cells[0]) * cell_size, len(cells) * cell_size)
+    return header + b''.join(b''.join(colors[cell] for cell in row) * cell_size for row in cells)
+
+def export_as_image(grid, filename="generation.png", cell_size=10, mode='1', palette=CELL_PALETTE,
+                    optimize=False):
+    """Export current grid as PNG image.
+
+    mode '1' writes a 1-bit black-and-white PNG, 'P' a two-colour paletted
+    PNG in palette's colours and 'RGB' a full-colour one. The image is
+    decoded straight from the bit-packed rows and upscaled with a
+    nearest-neighbour resize, so no Python loop touches the cells.
+    optimize=True asks PIL for a smaller file at several times the save cost.
+    """
+    try:
+        from PIL import Image
+        if mode not in ('1', 'P', 'RGB'):
+            return False, f"Unsupported image mode '{mode}' (use '1', 'P' or 'RGB')"
+        rows, cols = board_shape(grid)
+        packed = b''.join(_iter_packed_rows(grid))
+        if mode == '1':
+            # Inverted so live cells (set bits) come out black
+            img = Image.frombytes('1', (cols, rows), packed, 'raw', '1;IR')
+        else:
+            img = Image.frombytes('1', (cols, rows), packed, 'raw', '1;R').convert('L').point(lambda v: v // 255)
+            img.putpalette([channel for color in palette for channel in color])
+        if cell_size > 1:
+            img = img.resize((cols * cell_size, rows * cell_size), Image.NEAREST)
+        if mode == 'RGB':
+            img = img.convert('RGB')
+        img.save(filename, optimize=optimize)
         return True, f"Image exported to {filename}"
     except ImportError:
         return False, "PIL library not available for image export"
     except Exception as e:
         return False, f"Error exporting image: {str(e)}"
 
+GIF_MAX_FRAMES = 50
+
 def export_gif(grid_history, filename="simulation.gif", cell_size=10, duration=200):
-    """Export history as animated GIF (last 50 frames)"""
+    """Export history as animated GIF (last GIF_MAX_FRAMES frames)"""
     try:
         from PIL import Image, ImageDraw
         if not grid_history:
             return False, "No history to export"
         frames = []
-        for grid in grid_history[-50:]:
+        for grid in grid_history[-GIF_MAX_FRAMES:]:
             rows, cols = len(grid), len(grid[0])
             img_width = cols * cell_size
             img_height = rows * cell_size
@@ -525,53 +2751,623 @@ def export_web(grid, filename="gameoflife.html"):
     except Exception as e:
         return False, f"Error exporting HTML: {str(e)}"
 
-def create_pattern_preview(pattern, size=80):
-    """Generate a small preview image of a pattern (for GUI)"""
-    try:
-        from PIL import Image, ImageDraw, ImageTk
-        if not pattern:
-            return None
-        rows, cols = len(pattern), len(pattern[0])
-        if rows == 0 or cols == 0:
-            return None
-        cell_size = max(1, min(size // max(rows, cols), 8))
-        img_width = cols * cell_size + 10
-        img_height = rows * cell_size + 10
-        img = Image.new('RGB', (img_width, img_height), 'white')
-        draw = ImageDraw.Draw(img)
-        draw.rectangle([0, 0, img_width-1, img_height-1], outline='gray')
-        offset_x = (img_width - cols * cell_size) // 2
-        offset_y = (img_height - rows * cell_size) // 2
-        for i in range(rows):
-            for j in range(cols):
-                if pattern[i][j]:
-                    x1 = offset_x + j * cell_size
-                    y1 = offset_y + i * cell_size
-                    x2 = x1 + cell_size
-                    y2 = y1 + cell_size
-                    draw.rectangle([x1, y1, x2, y2], fill='black')
-        return ImageTk.PhotoImage(img)
-    except ImportError:
-        return None
-    except Exception:
-        return None
+def create_pattern_preview(pattern, size=80):
+    """Generate a small preview image of a pattern (for GUI)"""
+    try:
+        from PIL import Image, ImageDraw, ImageTk
+        if not pattern:
+            return None
+        rows, cols = len(pattern), len(pattern[0])
+        if rows == 0 or cols == 0:
+            return None
+        cell_size = max(1, min(size // max(rows, cols), 8))
+        img_width = cols * cell_size + 10
+        img_height = rows * cell_size + 10
+        img = Image.new('RGB', (img_width, img_height), 'white')
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, img_width-1, img_height-1], outline='gray')
+        offset_x = (img_width - cols * cell_size) // 2
+        offset_y = (img_height - rows * cell_size) // 2
+        for i in range(rows):
+            for j in range(cols):
+                if pattern[i][j]:
+                    x1 = offset_x + j * cell_size
+                    y1 = offset_y + i * cell_size
+                    x2 = x1 + cell_size
+                    y2 = y1 + cell_size
+                    draw.rectangle([x1, y1, x2, y2], fill='black')
+        return ImageTk.PhotoImage(img)
+    except ImportError:
+        return None
+    except Exception:
+        return None
+
+# ========================
+# History
+# ========================
+
+def grid_delta(old_grid, new_grid):
+    """Return the flat indices (row * cols + col) of cells that differ"""
+    cols = len(old_grid[0])
+    delta = array('l')
+    for i, (old_row, new_row) in enumerate(zip(old_grid, new_grid)):
+        if old_row is new_row or old_row == new_row:
+            continue
+        base = i * cols
+        delta.extend(base + j for j, (a, b) in enumerate(zip(old_row, new_row)) if a != b)
+    return delta
+
+def apply_delta(grid, delta):
+    """Flip the cells listed in a delta in place (deltas are XOR, so self-inverse)"""
+    cols = len(grid[0])
+    for index in delta:
+        row = grid[index // cols]
+        col = index % cols
+        row[col] = 1 - row[col]
+    return grid
+
+class GridHistory:
+    """Undo/redo history of list grids stored as keyframes plus XOR deltas.
+
+    Every keyframe_interval-th generation is kept as a full copy and the
+    generations in between as the flat indices of the cells that changed.
+    Each keyframe and its deltas form a segment in a deque, so the oldest
+    generations are evicted one segment at a time in O(1) once the history
+    holds more than max_length generations. Reading any generation replays
+    at most keyframe_interval - 1 deltas from its keyframe.
+    """
+    def __init__(self, grid, generation=0, max_length=1000, keyframe_interval=50):
+        self.max_length = max_length
+        self.keyframe_interval = keyframe_interval
+        self.first_generation = generation
+        self.segments = deque()
+        self.length = 0
+        self.last = None
+        self.append(grid)
+
+    def append(self, grid):
+        """Record the next generation, evicting the oldest segment if full"""
+        if not isinstance(grid, list):
+            grid = convert_board(grid, 'list')
+        if self.segments and len(self.segments[-1][1]) + 1 < self.keyframe_interval:
+            self.segments[-1][1].append(grid_delta(self.last, grid))
+        else:
+            self.segments.append(([row[:] for row in grid], []))
+        self.last = [row[:] for row in grid]
+        self.length += 1
+        while self.length > self.max_length and len(self.segments) > 1:
+            evicted = self.segments.popleft()
+            size = 1 + len(evicted[1])
+            self.length -= size
+            self.first_generation += size
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def generation_at(self, index):
+        """Generation number of the entry at index"""
+        return self.first_generation + index
+
+    def _frames(self, start, stop):
+        """Yield copies of entries start..stop-1, replaying deltas sequentially"""
+        if start >= stop:
+            return
+        segment_index, offset = divmod(start, self.keyframe_interval)
+        remaining = stop - start
+        for keyframe, deltas in itertools.islice(self.segments, segment_index, None):
+            grid = [row[:] for row in keyframe]
+            for step in range(len(deltas) + 1):
+                if step:
+                    apply_delta(grid, deltas[step - 1])
+                if step >= offset:
+                    yield [row[:] for row in grid]
+                    remaining -= 1
+                    if not remaining:
+                        return
+            offset = 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step == 1:
+                return list(self._frames(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("history index out of range")
+        if index == self.length - 1:
+            return [row[:] for row in self.last]
+        return next(self._frames(index, index + 1))
+
+    def __iter__(self):
+        return self._frames(0, self.length)
+
+class CheckpointTimeline:
+    """Bounded-memory history that recomputes generations on demand.
+
+    The simulation is deterministic, so only every interval-th board is kept,
+    bit-packed, as a checkpoint and any other generation is regenerated by
+    stepping forward from the nearest earlier checkpoint with the fast engine.
+    The interval starts from the board size and memory budget and doubles,
+    thinning the stored checkpoints, whenever they outgrow their half of the
+    budget. Recently visited generations sit in a small LRU cache (the other
+    half) so scrubbing around one spot stays cheap. Boards edited by hand are
+    pinned as checkpoints and discard the generations after them.
+
+    It has the same index-based interface as GridHistory (len, indexing,
+    slicing, append, generation_at).
+    """
+    def __init__(self, grid, generation=0, rule=CONWAY, memory_budget=32 * 1024 * 1024,
+                 cache_size=64):
+        self.rule = rule
+        self.start = generation
+        self.end = generation
+        rows, cols = board_shape(grid)
+        checkpoint_bytes = rows * ((cols + 7) // 8 + 32)
+        board_bytes = rows * cols * (1 if np is not None else 8)
+        self.max_checkpoints = max(2, (memory_budget // 2) // checkpoint_bytes)
+        self.cache_size = max(2, min(cache_size, (memory_budget // 2) // max(1, board_bytes)))
+        # Cover the first 1024 generations within the checkpoint budget
+        self.interval = 1
+        while 1024 // self.interval > self.max_checkpoints:
+            self.interval *= 2
+        self.checkpoints = {}
+        self.checkpoint_generations = []
+        self.pinned = set()
+        self.cache = OrderedDict()
+        self._store(generation, grid, pinned=True)
+
+    def _to_working(self, board):
+        """Board type used for stepping and caching (uint8 array or list grid)"""
+        if np is not None:
+            return convert_board(board, 'numpy').astype(np.uint8, copy=True)
+        return [row[:] for row in convert_board(board, 'list')]
+
+    def _to_grid(self, board):
+        if np is not None:
+            return array_to_grid(board)
+        return [row[:] for row in board]
+
+    def _store(self, generation, board, pinned=False):
+        if generation not in self.checkpoints:
+            bisect.insort(self.checkpoint_generations, generation)
+        self.checkpoints[generation] = convert_board(board, 'packed')
+        if pinned:
+            self.pinned.add(generation)
+        if len(self.checkpoints) > self.max_checkpoints:
+            self._thin()
+
+    def _thin(self):
+        """Double the checkpoint interval and drop checkpoints off the new grid"""
+        self.interval *= 2
+        keep = [g for g in self.checkpoint_generations
+                if g in self.pinned or (g - self.start) % self.interval == 0]
+        for g in set(self.checkpoint_generations) - set(keep):
+            del self.checkpoints[g]
+        self.checkpoint_generations = keep
+
+    def _cache_put(self, generation, board):
+        self.cache[generation] = board
+        self.cache.move_to_end(generation)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def append(self, grid):
+        """Record the next generation after the current end of the timeline"""
+        self.end += 1
+        if (self.end - self.start) % self.interval == 0:
+            self._store(self.end, grid)
+        self._cache_put(self.end, self._to_working(grid))
+
+    def edit(self, generation, grid):
+        """Replace the board at generation and drop every later generation"""
+        self.end = generation
+        for g in [g for g in self.checkpoint_generations if g > generation]:
+            del self.checkpoints[g]
+            self.pinned.discard(g)
+        self.checkpoint_generations = [g for g in self.checkpoint_generations if g <= generation]
+        for g in [g for g in self.cache if g >= generation]:
+            del self.cache[g]
+        self._store(generation, grid, pinned=True)
+
+    def board_at(self, generation):
+        """Return the list grid at generation, regenerating it if necessary"""
+        if not self.start <= generation <= self.end:
+            raise IndexError(f"generation {generation} outside {self.start}..{self.end}")
+        cached = self.cache.get(generation)
+        if cached is not None:
+            self.cache.move_to_end(generation)
+            return self._to_grid(cached)
+        index = bisect.bisect_right(self.checkpoint_generations, generation) - 1
+        base = self.checkpoint_generations[index]
+        closer = [g for g in self.cache if base < g < generation]
+        if closer:
+            base = max(closer)
+            board = self.cache[base]
+        else:
+            board = self._to_working(self.checkpoints[base])
+        for g in range(base + 1, generation + 1):
+            board = next_generation(board, self.rule)
+            self._cache_put(g, board)
+        return self._to_grid(board)
+
+    def __len__(self):
+        return self.end - self.start + 1
+
+    def __bool__(self):
+        return True
+
+    def generation_at(self, index):
+        """Generation number of the entry at index"""
+        return self.start + index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.board_at(self.start + i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("timeline index out of range")
+        return self.board_at(self.start + index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+RUNLOG_MAGIC = b'GOLR'
+RUNLOG_EXTENSION = '.golr'
+_RUNLOG_HEADER = struct.Struct('<4sB3xIIQI64s')
+_RUNLOG_RECORD = struct.Struct('<BQII')
+_RUNLOG_TRAILER = struct.Struct('<QQQ4s')
+_RUNLOG_INDEX_MAGIC = b'GOLX'
+_KEYFRAME, _DELTA = 0, 1
+
+def _flat_snapshot(grid):
+    """Copy a board into the flat form run logs diff against (numpy array or PackedBoard)"""
+    if np is not None:
+        return np.array(convert_board(grid, 'numpy'), dtype=np.uint8).reshape(-1)
+    return convert_board(grid, 'packed').copy()
+
+def _flat_delta(old, new):
+    """Flat indices of the cells that differ between two snapshots"""
+    if np is not None:
+        return np.flatnonzero(old != new)
+    delta = []
+    for i, (a, b) in enumerate(zip(old.data, new.data)):
+        changed = a ^ b
+        while changed:
+            low = changed & -changed
+            delta.append(i * new.cols + low.bit_length() - 1)
+            changed ^= low
+    return delta
+
+class RunLogWriter:
+    """Append-only recording of a run: keyframes every K generations, XOR deltas between.
+
+    Each generation is one record (kind, generation, population, payload).
+    Keyframes hold the zlib-compressed bit-packed board, deltas the
+    zlib-compressed flat indices of the cells that flipped. close() appends
+    an index footer of keyframe offsets; a log cut short by a crash has no
+    footer and is recovered by RunLogReader scanning the records.
+    """
+    def __init__(self, filename, rows, cols, generation=0, rule=CONWAY, keyframe_interval=100):
+        self.filename = filename
+        self.rows, self.cols = rows, cols
+        self.keyframe_interval = keyframe_interval
+        self.delta_type = 'I' if rows * cols <= 1 << 32 else 'Q'
+        self.first_generation = generation
+        self.next_generation = generation
+        self.index = array('Q')
+        self.previous = None
+        self.f = open(filename, 'wb')
+        self.f.write(_RUNLOG_HEADER.pack(RUNLOG_MAGIC, 1, rows, cols, generation,
+                                         keyframe_interval, str(rule).encode('ascii')))
+
+    def append(self, grid):
+        """Record the next generation of the run"""
+        if board_shape(grid) != (self.rows, self.cols):
+            raise ValueError(f"Board shape {board_shape(grid)} does not match {self.rows}x{self.cols}")
+        snapshot = _flat_snapshot(grid)
+        offset = self.f.tell()
+        if (self.next_generation - self.first_generation) % self.keyframe_interval == 0:
+            kind = _KEYFRAME
+            payload = zlib.compress(b''.join(_iter_packed_rows(grid)))
+            self.index.extend((self.next_generation, offset))
+        else:
+            kind = _DELTA
+            payload = zlib.compress(array(self.delta_type, _flat_delta(self.previous, snapshot)).tobytes())
+        self.f.write(_RUNLOG_RECORD.pack(kind, self.next_generation, count_population(grid), len(payload)))
+        self.f.write(payload)
+        self.previous = snapshot
+        self.next_generation += 1
+
+    def flush(self):
+        self.f.flush()
+
+    def close(self):
+        """Write the keyframe index footer and close the file"""
+        if self.f is None:
+            return
+        index_offset = self.f.tell()
+        self.f.write(self.index.tobytes())
+        self.f.write(_RUNLOG_TRAILER.pack(index_offset, len(self.index) // 2,
+                                          self.next_generation, _RUNLOG_INDEX_MAGIC))
+        self.f.close()
+        self.f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class RunLogReader:
+    """Random access to a run log with the same index API as GridHistory.
+
+    Seeking to a generation bisects the keyframe index and replays at most
+    K - 1 deltas; iterating replays records sequentially. Only the current
+    board is held in memory, so even very long runs can feed export_gif,
+    show_analytics and the GUI history slider.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.f = open(filename, 'rb')
+        header = self.f.read(_RUNLOG_HEADER.size)
+        magic, version, rows, cols, generation, keyframe_interval, rule = _RUNLOG_HEADER.unpack(header)
+        if magic != RUNLOG_MAGIC or version != 1:
+            raise ValueError(f"{filename} is not a run log")
+        self.rows, self.cols = rows, cols
+        self.first_generation = generation
+        self.keyframe_interval = keyframe_interval
+        self.rule = LifeRule.parse(rule.rstrip(b'\0').decode('ascii'))
+        self.delta_type = 'I' if rows * cols <= 1 << 32 else 'Q'
+        if not self._read_index():
+            self._scan()
+
+    def _read_index(self):
+        """Load the footer index; False when the log has none (unclean shutdown)"""
+        end = self.f.seek(0, os.SEEK_END)
+        if end < _RUNLOG_HEADER.size + _RUNLOG_TRAILER.size:
+            return False
+        self.f.seek(end - _RUNLOG_TRAILER.size)
+        index_offset, count, next_generation, magic = _RUNLOG_TRAILER.unpack(self.f.read(_RUNLOG_TRAILER.size))
+        if magic != _RUNLOG_INDEX_MAGIC or index_offset + count * 16 + _RUNLOG_TRAILER.size != end:
+            return False
+        self.f.seek(index_offset)
+        index = array('Q')
+        index.frombytes(self.f.read(count * 16))
+        self.keyframes, self.offsets = list(index[0::2]), list(index[1::2])
+        self.length = next_generation - self.first_generation
+        self.data_end = index_offset
+        return True
+
+    def _scan(self):
+        """Rebuild the keyframe index by walking the records, dropping a torn last record"""
+        self.keyframes, self.offsets = [], []
+        self.length = 0
+        self.data_end = offset = _RUNLOG_HEADER.size
+        end = self.f.seek(0, os.SEEK_END)
+        while offset + _RUNLOG_RECORD.size <= end:
+            self.f.seek(offset)
+            kind, generation, _, size = _RUNLOG_RECORD.unpack(self.f.read(_RUNLOG_RECORD.size))
+            if offset + _RUNLOG_RECORD.size + size > end or generation != self.first_generation + self.length:
+                break
+            if kind == _KEYFRAME:
+                self.keyframes.append(generation)
+                self.offsets.append(offset)
+            offset += _RUNLOG_RECORD.size + size
+            self.length += 1
+            self.data_end = offset
+
+    def _records(self, offset):
+        """Yield (kind, generation, population, payload) from offset to the end of the data"""
+        while offset < self.data_end:
+            self.f.seek(offset)
+            kind, generation, population, size = _RUNLOG_RECORD.unpack(self.f.read(_RUNLOG_RECORD.size))
+            payload = self.f.read(size)
+            offset += _RUNLOG_RECORD.size + size
+            yield kind, generation, population, payload
+
+    def _decode_keyframe(self, payload):
+        body = zlib.decompress(payload)
+        row_bytes = (self.cols + 7) // 8
+        if np is not None:
+            rows = np.frombuffer(body, dtype=np.uint8).reshape(self.rows, row_bytes)
+            return np.unpackbits(rows, axis=1, count=self.cols, bitorder='little').reshape(-1)
+        board = PackedBoard(self.rows, self.cols, (int.from_bytes(body[i:i + row_bytes], 'little')
+                                                   for i in range(0, len(body), row_bytes)))
+        return bytearray(cell for row in board.to_grid() for cell in row)
+
+    def _apply_delta(self, cells, payload):
+        delta = array(self.delta_type)
+        delta.frombytes(zlib.decompress(payload))
+        if np is not None:
+            cells[np.frombuffer(delta, dtype=np.uint32 if self.delta_type == 'I' else np.uint64)] ^= 1
+        else:
+            for index in delta:
+                cells[index] ^= 1
+
+    def _to_board(self, cells, engine):
+        if np is not None:
+            board = cells.reshape(self.rows, self.cols).copy()
+            return board if engine == 'numpy' else convert_board(board, engine)
+        grid = [list(cells[i * self.cols:(i + 1) * self.cols]) for i in range(self.rows)]
+        return grid if engine == 'list' else convert_board(grid, engine)
+
+    def _frames(self, start, stop, engine='list'):
+        """Yield boards for entries start..stop-1, replaying from the keyframe before start"""
+        if start >= stop:
+            return
+        k = bisect.bisect_right(self.keyframes, self.first_generation + start) - 1
+        cells = None
+        for kind, generation, _, payload in self._records(self.offsets[k]):
+            if kind == _KEYFRAME:
+                cells = self._decode_keyframe(payload)
+            else:
+                self._apply_delta(cells, payload)
+            index = generation - self.first_generation
+            if index >= start:
+                yield self._to_board(cells, engine)
+                if index + 1 >= stop:
+                    return
+
+    def board_at(self, generation, engine='list'):
+        """The board at an absolute generation, on the requested engine"""
+        index = generation - self.first_generation
+        if not 0 <= index < self.length:
+            raise IndexError(f"generation {generation} is not in the log")
+        return next(self._frames(index, index + 1, engine))
+
+    def populations(self):
+        """Yield (generation, population) for every record without decoding boards"""
+        offset = _RUNLOG_HEADER.size
+        while offset < self.data_end:
+            self.f.seek(offset)
+            _, generation, population, size = _RUNLOG_RECORD.unpack(self.f.read(_RUNLOG_RECORD.size))
+            offset += _RUNLOG_RECORD.size + size
+            yield generation, population
+
+    def stats(self, detect_cycles=False):
+        """GameStats for the log built from the record headers alone.
+
+        detect_cycles=True replays and hashes every board as well, so the
+        stats also report the cycle; that decodes the whole log.
+        """
+        stats = GameStats()
+        if not detect_cycles:
+            for generation, population in self.populations():
+                stats.record_population(generation, population)
+            return stats
+        engine = 'numpy' if np is not None else 'packed'
+        for index, board in enumerate(self._frames(0, self.length, engine)):
+            stats.update(board, self.first_generation + index)
+        return stats
+
+    def __len__(self):
+        return self.length
+
+    def __bool__(self):
+        return self.length > 0
+
+    def generation_at(self, index):
+        """Generation number of the entry at index"""
+        return self.first_generation + index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step == 1:
+                return list(self._frames(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("run log index out of range")
+        return next(self._frames(index, index + 1))
+
+    def __iter__(self):
+        return self._frames(0, self.length)
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 # ========================
 # Statistics
 # ========================
 
+def _tile_digest(grid, tr, tc, tile_size):
+    """Position-keyed hash of one tile of a list grid"""
+    c0, c1 = tc * tile_size, (tc + 1) * tile_size
+    rows = range(tr * tile_size, min((tr + 1) * tile_size, len(grid)))
+    return hash((tr, tc, b''.join(bytes(grid[i][c0:c1]) for i in rows)))
+
+def board_hash(board, tile_size=TILE_SIZE):
+    """Fast 64-bit hash of a board's cells for cycle detection.
+
+    List grids are hashed as the XOR of per-tile hashes so GameStats can
+    update the hash incrementally from the tiles that changed; the other
+    board types hash their packed buffer or live-cell set directly.
+    """
+    if isinstance(board, PackedBoard):
+        return hash((board.rows, board.cols, tuple(board.data)))
+    if isinstance(board, SparseBoard):
+        return hash((board.rows, board.cols, frozenset(board.live)))
+    if isinstance(board, MemmapBoard):
+        digest = hash((board.rows, board.cols))
+        for chunk in _iter_packed_rows(board):
+            digest = hash((digest, chunk))
+        return digest
+    if np is not None and isinstance(board, np.ndarray):
+        return hash((board.shape, np.packbits(board.astype(bool)).tobytes()))
+    rows, cols = len(board), len(board[0])
+    digest = hash((rows, cols))
+    for tr in range((rows + tile_size - 1) // tile_size):
+        for tc in range((cols + tile_size - 1) // tile_size):
+            digest ^= _tile_digest(board, tr, tc, tile_size)
+    return digest
+
 class GameStats:
-    """Advanced statistics tracking for Game of Life"""
-    def __init__(self):
+    """Advanced statistics tracking for Game of Life.
+
+    Every new generation's board hash goes into a hash-to-generation table,
+    so the first repeated board gives the exact period and transient length
+    of the run (still lifes have period 1, oscillators their own period).
+    An update at or before the last hashed generation means the board was
+    edited or rewound, so cycle detection starts over from it.
+    When the stepping engine reports births and deaths for a generation the
+    population is updated from them instead of recounting the board.
+    """
+    def __init__(self, max_hashes=100000):
         self.population_history = deque(maxlen=1000)
         self.generation = 0
         self.max_population = 0
         self.min_population = float('inf')
         self.stable_count = 0
         self.last_population = 0
+        self.tile_hashes = None
+        self.tile_size = None
+        self.tile_digest = 0
+        self.max_hashes = max_hashes
+        self.seen_hashes = {}
+        self.first_hashed_generation = None
+        self.last_hashed_generation = None
+        self.cycle_period = None
+        self.transient_length = None
+        self.census = None
+        self.census_generation = None
+
+    def update(self, grid, gen, changed_tiles=None, tile_size=TILE_SIZE, births=None, deaths=None):
+        """Record generation gen of grid.
+
+        changed_tiles lets list grids be rehashed incrementally; births and
+        deaths, when given for the step from gen - 1, replace the full
+        population count.
+        """
+        if births is not None and self.population_history and self.generation == gen - 1:
+            live_cells = self.last_population + births - deaths
+        else:
+            live_cells = count_population(grid)
+        if isinstance(grid, list):
+            if changed_tiles is None:
+                self.tile_hashes = None
+            digest = self._update_tiles(grid, changed_tiles, tile_size)
+        else:
+            digest = board_hash(grid)
+        self._record_hash(digest, gen)
+        self.record_population(gen, live_cells)
 
-    def update(self, grid, gen):
-        live_cells = sum(sum(row) for row in grid)
+    def record_population(self, gen, live_cells):
+        """Record the population of generation gen without looking at the board"""
         self.population_history.append((gen, live_cells))
         self.generation = gen
         self.max_population = max(self.max_population, live_cells)
@@ -583,6 +3379,68 @@ class GameStats:
             self.stable_count = 0
         self.last_population = live_cells
 
+    def _update_tiles(self, grid, changed_tiles, tile_size):
+        """Rehash only the changed tiles, keeping a per-tile hash cache.
+
+        Returns the same hash board_hash gives for the grid.
+        """
+        rows, cols = len(grid), len(grid[0])
+        if self.tile_hashes is None or self.tile_size != tile_size:
+            self.tile_size = tile_size
+            self.tile_hashes = {}
+            self.tile_digest = hash((rows, cols))
+            changed_tiles = [(tr, tc) for tr in range((rows + tile_size - 1) // tile_size)
+                             for tc in range((cols + tile_size - 1) // tile_size)]
+        for tr, tc in changed_tiles:
+            digest = _tile_digest(grid, tr, tc, tile_size)
+            self.tile_digest ^= self.tile_hashes.get((tr, tc), 0) ^ digest
+            self.tile_hashes[(tr, tc)] = digest
+        return self.tile_digest
+
+    def reset_cycle(self):
+        """Forget the hashed generations, e.g. after the board was edited"""
+        self.seen_hashes = {}
+        self.first_hashed_generation = None
+        self.last_hashed_generation = None
+        self.cycle_period = None
+        self.transient_length = None
+
+    def _record_hash(self, digest, gen):
+        """Remember the board hash of a new generation and detect a cycle"""
+        if self.last_hashed_generation is not None and gen <= self.last_hashed_generation:
+            self.reset_cycle()
+        if self.first_hashed_generation is None:
+            self.first_hashed_generation = gen
+        self.last_hashed_generation = gen
+        if self.cycle_period is not None:
+            return
+        first_seen = self.seen_hashes.get(digest)
+        if first_seen is not None:
+            self.cycle_period = gen - first_seen
+            self.transient_length = first_seen - self.first_hashed_generation
+            return
+        self.seen_hashes[digest] = gen
+        if len(self.seen_hashes) > self.max_hashes:
+            del self.seen_hashes[next(iter(self.seen_hashes))]
+
+    def get_cycle(self):
+        """Return (period, transient_length) once the run has repeated, else None.
+
+        transient_length counts generations from the first one recorded
+        since the last reset.
+        """
+        if self.cycle_period is None:
+            return None
+        return self.cycle_period, self.transient_length
+
+    def get_census(self, grid, interval=50):
+        """Object census of grid, recomputed at most once every interval generations"""
+        if (self.census is None or self.generation < self.census_generation
+                or self.generation - self.census_generation >= interval):
+            self.census = object_census(grid)
+            self.census_generation = self.generation
+        return self.census
+
     def get_growth_rate(self, window=10):
         if len(self.population_history) < 2:
             return 0
@@ -596,8 +3454,9 @@ class GameStats:
     def get_current_population(self):
         return self.population_history[-1][1] if self.population_history else 0
 
-    def is_stable(self, threshold=5):
-        return self.stable_count >= threshold
+    def is_stable(self):
+        """True once the board has settled into a still life or oscillator (exact cycle detection)"""
+        return self.cycle_period is not None
 
     def is_extinct(self):
         return self.get_current_population() == 0
@@ -609,7 +3468,7 @@ class GameStats:
         if self.is_extinct():
             status = "Extinct"
         elif self.is_stable():
-            status = "Stable"
+            status = "Stable" if self.cycle_period in (None, 1) else "Oscillating"
         elif abs(growth_rate) < 0.1:
             status = "Near Stable"
         return {
@@ -619,11 +3478,19 @@ class GameStats:
             'growth_rate': growth_rate,
             'status': status,
             'generation': self.generation,
-            'stable_count': self.stable_count
+            'stable_count': self.stable_count,
+            'period': self.cycle_period,
+            'transient': self.transient_length
         }
 
 def show_analytics(stats, grid=None):
-    """Display detailed analytics"""
+    """Display detailed analytics, from live stats or a RunLogReader.
+
+    A run log's stats come from its record headers, without cycle detection.
+    """
+    if isinstance(stats, RunLogReader):
+        grid = stats[-1] if grid is None else grid
+        stats = stats.stats()
     print("\n" + "="*50)
     print("GAME OF LIFE ANALYTICS")
     print("="*50)
@@ -636,6 +3503,8 @@ def show_analytics(stats, grid=None):
     print(f"Status: {summary['status']}")
     if summary['stable_count'] > 0:
         print(f"Stable for: {summary['stable_count']} generations")
+    if summary['period'] is not None:
+        print(f"Cycle: period {summary['period']} after {summary['transient']} generations")
     if len(stats.population_history) > 1:
         recent_pops = [p[1] for p in list(stats.population_history)[-10:]]
         print(f"Recent Population Trend: {' → '.join(map(str, recent_pops))}")
@@ -651,15 +3520,201 @@ def show_analytics(stats, grid=None):
         print("\n" + "-"*30)
         print("PATTERN ANALYSIS")
         print("-"*30)
-        patterns = find_patterns_in_grid(grid)
+        patterns = detect_patterns(grid)
         if patterns:
-            print(f"Detected Patterns: {', '.join(patterns).title()}")
+            for name, spots in patterns.items():
+                where = ', '.join(f"({r},{c})" for r, c in spots[:5])
+                more = f" (+{len(spots) - 5} more)" if len(spots) > 5 else ""
+                print(f"{name.replace('_', ' ').title()}: {len(spots)} at {where}{more}")
         else:
             print("No common patterns detected")
+        census = stats.get_census(grid)
+        print("\n" + "-"*30)
+        print(f"OBJECT CENSUS (generation {stats.census_generation})")
+        print("-"*30)
+        for kind, counts in census.items():
+            if counts:
+                objects = ', '.join(f"{name.replace('_', ' ')} x{count}" for name, count in counts.most_common(8))
+                print(f"{kind.title()} ({sum(counts.values())}): {objects}")
+        if not any(census.values()):
+            print("No objects on the board")
     print("="*50)
     print("Analytics displayed - returning to game...")
     time.sleep(3)
 
+# ========================
+# Ensemble Simulation
+# ========================
+
+def initialize_ensemble(count, rows, cols, densities=0.2):
+    """Initialize a (count, rows, cols) uint8 stack of random boards.
+
+    densities is a single density or one density per board.
+    """
+    densities = np.broadcast_to(np.asarray(densities, dtype=float), (count,))
+    return (np.random.random((count, rows, cols)) < densities[:, None, None]).astype(np.uint8)
+
+def next_generation_ensemble(boards, rule=CONWAY):
+    """Step every board of a (N, rows, cols) stack at once, each on its own torus"""
+    boards = np.asarray(boards, dtype=np.uint8)
+    _, rows, cols = boards.shape
+    padded = np.pad(boards, ((0, 0), (1, 1), (1, 1)), mode='wrap')
+    counts = np.zeros(boards.shape, dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[:, dr:dr + rows, dc:dc + cols]
+    return rule.array[boards, counts]
+
+class EnsembleStats:
+    """Per-board statistics for a stack of boards, mirroring GameStats.
+
+    Each board keeps its own hash-to-generation table, so a board counts as
+    settled (still life or oscillator) as soon as one of its states repeats;
+    cycle_period and transient_length are 0 until then.
+    """
+    def __init__(self, count, max_hashes=100000):
+        self.population_history = deque(maxlen=1000)
+        self.generation = 0
+        self.max_population = np.zeros(count, dtype=np.int64)
+        self.min_population = np.full(count, np.iinfo(np.int64).max, dtype=np.int64)
+        self.stable_count = np.zeros(count, dtype=np.int64)
+        self.last_population = np.zeros(count, dtype=np.int64)
+        self.max_hashes = max_hashes
+        self.seen_hashes = [{} for _ in range(count)]
+        self.first_hashed_generation = None
+        self.cycle_period = np.zeros(count, dtype=np.int64)
+        self.transient_length = np.zeros(count, dtype=np.int64)
+
+    def update(self, boards, gen):
+        live_cells = np.count_nonzero(boards, axis=(1, 2)).astype(np.int64)
+        self.population_history.append((gen, live_cells))
+        self.generation = gen
+        np.maximum(self.max_population, live_cells, out=self.max_population)
+        alive = live_cells > 0
+        self.min_population[alive] = np.minimum(self.min_population[alive], live_cells[alive])
+        same = live_cells == self.last_population
+        self.stable_count = np.where(same, self.stable_count + 1, 0)
+        self.last_population = live_cells
+        self._record_hashes(boards, gen)
+
+    def _record_hashes(self, boards, gen):
+        """Hash the boards that have not settled yet and detect their cycles"""
+        if self.first_hashed_generation is None:
+            self.first_hashed_generation = gen
+        active = np.flatnonzero(self.cycle_period == 0)
+        if not len(active):
+            return
+        packed = np.packbits(boards[active].reshape(len(active), -1).astype(bool), axis=1)
+        for index, row in zip(active, packed):
+            seen = self.seen_hashes[index]
+            digest = hash(row.tobytes())
+            first_seen = seen.get(digest)
+            if first_seen is not None:
+                self.cycle_period[index] = gen - first_seen
+                self.transient_length[index] = first_seen - self.first_hashed_generation
+                self.seen_hashes[index] = {}
+                continue
+            seen[digest] = gen
+            if len(seen) > self.max_hashes:
+                del seen[next(iter(seen))]
+
+    def get_current_population(self):
+        return self.last_population
+
+    def is_stable(self):
+        """Per-board flags: True once the board has settled into a still life or oscillator"""
+        return self.cycle_period > 0
+
+    def is_extinct(self):
+        return self.last_population == 0
+
+    def get_summary(self, index):
+        """Summary of one board in the same shape as GameStats.get_summary"""
+        history = [(gen, int(pops[index])) for gen, pops in self.population_history]
+        stats = GameStats()
+        for gen, population in history[-10:]:
+            stats.population_history.append((gen, population))
+        growth_rate = stats.get_growth_rate()
+        status = "Active"
+        if self.is_extinct()[index]:
+            status = "Extinct"
+        elif self.is_stable()[index]:
+            status = "Stable" if self.cycle_period[index] == 1 else "Oscillating"
+        elif abs(growth_rate) < 0.1:
+            status = "Near Stable"
+        min_population = int(self.min_population[index])
+        return {
+            'current_population': int(self.last_population[index]),
+            'max_population': int(self.max_population[index]),
+            'min_population': min_population if min_population != np.iinfo(np.int64).max else 0,
+            'growth_rate': growth_rate,
+            'status': status,
+            'generation': self.generation,
+            'stable_count': int(self.stable_count[index]),
+            'period': int(self.cycle_period[index]) or None,
+            'transient': int(self.transient_length[index]) if self.cycle_period[index] else None
+        }
+
+def run_ensemble(count, rows, cols, densities=0.2, generations=100, rule=CONWAY,
+                 stop_when_settled=True):
+    """
+    Run count independent random boards together for a density sweep.
+    Stops early once every board is extinct or has repeated a state (still
+    life or oscillator) when stop_when_settled.
+    Returns (boards, stats)
+    """
+    if np is None:
+        raise ValueError("Ensemble simulation requires numpy to be installed")
+    boards = initialize_ensemble(count, rows, cols, densities)
+    stats = EnsembleStats(count)
+    stats.update(boards, 0)
+    for generation in range(1, generations + 1):
+        boards = next_generation_ensemble(boards, rule)
+        stats.update(boards, generation)
+        if stop_when_settled and np.all(stats.is_extinct() | stats.is_stable()):
+            break
+    return boards, stats
+
+# ========================
+# Headless Runs
+# ========================
+
+def run_headless(grid, generations, rule=CONWAY, stop_on_cycle=True, start_generation=0,
+                 log_path=None, keyframe_interval=100):
+    """
+    Run a simulation without any UI.
+    Stops early once the board is extinct or repeats when stop_on_cycle.
+    With log_path every generation is appended to a run log (see RunLogReader).
+    Returns (grid, generation, stats)
+    """
+    generation = start_generation
+    stats = GameStats()
+    stats.update(grid, generation)
+    log = None
+    if log_path:
+        rows, cols = board_shape(grid)
+        log = RunLogWriter(log_path, rows, cols, generation, rule, keyframe_interval)
+        log.append(grid)
+    changed_tiles = births = deaths = None
+    try:
+        for _ in range(generations):
+            if isinstance(grid, list):
+                grid, changed_tiles, births, deaths = next_generation_tiled(grid, changed_tiles, rule=rule)
+            else:
+                grid = next_generation(grid, rule)
+            generation += 1
+            stats.update(grid, generation, changed_tiles, births=births, deaths=deaths)
+            if log is not None:
+                log.append(grid)
+            if stop_on_cycle and stats.get_cycle() is not None:
+                break
+    finally:
+        if log is not None:
+            log.close()
+    return grid, generation, stats
+
 # ========================
 # Terminal UI
 # ========================
@@ -678,11 +3733,14 @@ def print_grid_terminal(grid, generation, paused, history_pos, max_history, stat
     if stats:
         summary = stats.get_summary()
         print(f"Population: {summary['current_population']} | Growth Rate: {summary['growth_rate']:.2f} | Status: {summary['status']}")
-        patterns = find_patterns_in_grid(grid)
+        if summary['period'] is not None:
+            print(f"Cycle Detected: period {summary['period']} after {summary['transient']} generations")
+        patterns = detect_patterns(grid)
         if patterns:
-            print(f"Patterns Detected: {', '.join(patterns).title()}")
+            found = ', '.join(f"{name.replace('_', ' ').title()} x{len(spots)}" for name, spots in patterns.items())
+            print(f"Patterns Detected: {found}")
     print("Controls: [Space] Play/Pause | [→] Forward | [←] Backward | [R]eset | [P]attern | [S]ave | [L]oad")
-    print("Advanced: [E]xport PNG | [G]IF Export | [W]eb Export | [A]nalytics | [GUI] Switch | [Q]uit")
+    print("Advanced: [E]xport PNG | [G]IF Export | [W]eb Export | [A]nalytics | [J]ump 2^k | [GUI] Switch | [Q]uit")
 
 def get_key():
     """Get single keypress without Enter - cross-platform"""
@@ -732,16 +3790,18 @@ def get_key():
 
 def show_pattern_menu():
     """Show available patterns and get user selection"""
-    patterns = ['glider', 'blinker', 'block', 'beehive', 'loaf', 'boat', 'tub', 
-                'beacon', 'toad', 'pulsar', 'gosper_gun', 'penta_decathlon', 'lightweight_spaceship']
+    patterns = PATTERN_INDEX.names()
     print("\nAvailable Patterns:")
     for i, pattern in enumerate(patterns, 1):
         print(f"{i:2}. {pattern.replace('_', ' ').title()}")
+    print("    Or enter the path of an RLE (.rle) or Life 1.06 (.lif) file")
     while True:
         try:
-            choice = input(f"\nEnter pattern number (1-{len(patterns)}) or 0 to cancel: ").strip()
+            choice = input(f"\nEnter pattern number (1-{len(patterns)}), a file path, or 0 to cancel: ").strip()
             if choice == '0':
                 return None
+            if os.path.isfile(choice):
+                return choice
             choice_idx = int(choice) - 1
             if 0 <= choice_idx < len(patterns):
                 return patterns[choice_idx]
@@ -757,10 +3817,12 @@ def run_terminal_version():
     generation = 0
     paused = False
     last_update_time = time.time()
-    history = [grid]
+    history = GridHistory(grid, generation)
     history_pos = 0
+    dirty_tiles = None
     stats = GameStats()
     stats.update(grid, generation)
+    auto_stopped_stats = None
     print("Conway's Game of Life - ULTIMATE Terminal Edition")
     print("🚀 Features: Patterns • Analytics • GIF Export • Web Export • Pattern Detection")
     print("Starting in 3 seconds...")
@@ -775,32 +3837,33 @@ def run_terminal_version():
                 paused = not paused
                 should_redraw = True
             elif key == 'right':
+                changed_tiles = births = deaths = None
                 if history_pos < len(history) - 1:
                     history_pos += 1
-                    grid = [row[:] for row in history[history_pos]]
-                    generation = history_pos
+                    grid = history[history_pos]
+                    generation = history.generation_at(history_pos)
                 else:
-                    new_grid = next_generation(grid)
-                    history.append([row[:] for row in new_grid])
-                    if len(history) > 1000:
-                        history.pop(0)
-                    else:
-                        history_pos += 1
+                    new_grid, changed_tiles, births, deaths = next_generation_tiled(grid, dirty_tiles)
+                    history.append(new_grid)
+                    history_pos = len(history) - 1
                     grid = new_grid
                     generation += 1
-                stats.update(grid, generation)
+                dirty_tiles = changed_tiles
+                stats.update(grid, generation, changed_tiles, births=births, deaths=deaths)
                 should_redraw = True
             elif key == 'left':
                 if history_pos > 0:
                     history_pos -= 1
-                    grid = [row[:] for row in history[history_pos]]
-                    generation = history_pos
+                    grid = history[history_pos]
+                    dirty_tiles = None
+                    generation = history.generation_at(history_pos)
                     stats.update(grid, generation)
                     should_redraw = True
             elif key == 'r': 
                 grid = initialize_grid(rows, cols, 0.25)
+                dirty_tiles = None
                 generation = 0
-                history = [grid]
+                history = GridHistory(grid, generation)
                 history_pos = 0
                 stats = GameStats()
                 stats.update(grid, generation)
@@ -811,14 +3874,19 @@ def run_terminal_version():
                     success, message, new_grid = safe_load_and_place_pattern(grid, pattern_name)
                     if success:
                         grid = new_grid
+                        dirty_tiles = None
                         generation = 0
-                        history = [grid]
+                        history = GridHistory(grid, generation)
                         history_pos = 0
                         stats = GameStats()
                         stats.update(grid, generation)
                         should_redraw = True
-                        print(f"\n{pattern_name.replace('_', ' ').title()} placed!")
+                        print(f"\n{message}")
                         time.sleep(1)
+                    else:
+                        print(f"\n{message}")
+                        time.sleep(2)
+                        should_redraw = True
             elif key == 's':
                 success, message = save_state(grid, generation)
                 print(f"\n{message}")
@@ -827,9 +3895,15 @@ def run_terminal_version():
             elif key == 'l':
                 success, loaded_grid, loaded_gen = load_state()
                 if success:
-                    grid = loaded_grid
+                    # The terminal UI steps list grids with the tiled engine
+                    try:
+                        grid = convert_board(loaded_grid, 'list')
+                    finally:
+                        if isinstance(loaded_grid, MemmapBoard):
+                            loaded_grid.close()
+                    dirty_tiles = None
                     generation = loaded_gen
-                    history = [grid]
+                    history = GridHistory(grid, generation)
                     history_pos = 0
                     stats = GameStats()
                     stats.update(grid, generation)
@@ -859,26 +3933,46 @@ def run_terminal_version():
             elif key == 'a':
                 show_analytics(stats, grid)
                 should_redraw = True
+            elif key == 'j':
+                try:
+                    exponent = int(input("\nJump ahead 2^k generations, enter k (e.g. 30): ").strip())
+                except ValueError:
+                    exponent = -1
+                success, message, new_grid = hashlife_jump(grid, exponent)
+                print(f"\n{message}")
+                if success:
+                    grid = new_grid
+                    dirty_tiles = None
+                    generation += 1 << exponent
+                    history = GridHistory(grid, generation)
+                    history_pos = 0
+                    stats = GameStats()
+                    stats.update(grid, generation)
+                time.sleep(2)
+                should_redraw = True
             elif key.startswith('gui') or key == 'u':
                 return run_gui_version()
             elif key == 'q': 
                 print("\nGoodbye!")
                 return
             if not paused and current_time - last_update_time >= 0.3:
+                changed_tiles = births = deaths = None
                 if history_pos < len(history) - 1:
                     history_pos += 1
-                    grid = [row[:] for row in history[history_pos]]
-                    generation = history_pos
+                    grid = history[history_pos]
+                    generation = history.generation_at(history_pos)
                 else:
-                    new_grid = next_generation(grid)
-                    history.append([row[:] for row in new_grid])
-                    if len(history) > 1000:
-                        history.pop(0)
-                    else:
-                        history_pos += 1
+                    new_grid, changed_tiles, births, deaths = next_generation_tiled(grid, dirty_tiles)
+                    history.append(new_grid)
+                    history_pos = len(history) - 1
                     grid = new_grid
                     generation += 1
-                stats.update(grid, generation)
+                dirty_tiles = changed_tiles
+                stats.update(grid, generation, changed_tiles, births=births, deaths=deaths)
+                if stats.get_cycle() is not None and auto_stopped_stats is not stats:
+                    # The board has settled into a cycle: stop burning CPU
+                    paused = True
+                    auto_stopped_stats = stats
                 last_update_time = current_time
                 should_redraw = True
             if should_redraw:
@@ -891,6 +3985,119 @@ def run_terminal_version():
 # GUI Version
 # ========================
 
+BLIT_RENDER_CELLS = 10000  # visible windows above this many cells render as one image in 'auto' mode
+MAX_CELL_SIZE = 64  # largest zoom, in pixels per cell
+FOLLOW_RADIUS = 8  # cells around the followed object searched for its new centroid
+FRAME_INTERVAL_MS = 16  # how often the GUI picks up the newest frame while running (~60 fps)
+PATTERN_SCAN_INTERVAL = 10  # generations between whole-board pattern scans while running
+
+class SimulationWorker:
+    """Steps a GUI session on a background thread.
+
+    Each generation is appended to the timeline and stats under the shared
+    lock and published as (grid, generation, history_pos, changed_tiles) to
+    a bounded queue. When the display falls behind, the oldest frame is
+    dropped and its changed tiles merged into the next, so the consumer can
+    always jump straight to the newest generation. grid, generation,
+    history_pos, dirty_tiles and history hold the latest state after stop().
+    While recorder is a list, every generation is recorded into it, dropped
+    display frames included.
+    """
+    def __init__(self, grid, generation, history, history_pos, stats, lock, dirty_tiles=None,
+                 rule=CONWAY, interval=0.0, max_frames=2):
+        self.grid = grid
+        self.generation = generation
+        self.history = history
+        self.history_pos = history_pos
+        self.stats = stats
+        self.lock = lock
+        self.dirty_tiles = dirty_tiles
+        self.rule = rule
+        self.interval = interval
+        self.recorder = None
+        self.frames = queue.Queue(max_frames)
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="life-worker", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        """Ask the thread to finish its current generation and wait for it"""
+        self.stopping.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def step(self):
+        """Advance one generation, replaying the timeline when it is ahead; returns the changed tiles"""
+        changed_tiles = births = deaths = None
+        with self.lock:
+            replay = self.history_pos < len(self.history) - 1
+            if replay:
+                self.history_pos += 1
+                self.grid = self.history[self.history_pos]
+                self.generation = self.history.generation_at(self.history_pos)
+        if not replay:
+            # The grid is only read here, so the lock is not held while stepping
+            grid, changed_tiles, births, deaths = next_generation_tiled(self.grid, self.dirty_tiles, rule=self.rule)
+            with self.lock:
+                if isinstance(self.history, RunLogReader):
+                    self.history.close()
+                    self.history = CheckpointTimeline(self.grid, self.generation, self.rule)
+                self.history.append(grid)
+                self.history_pos = len(self.history) - 1
+                self.grid = grid
+                self.generation += 1
+        with self.lock:
+            self.stats.update(self.grid, self.generation, changed_tiles, births=births, deaths=deaths)
+            if self.recorder is not None:
+                record_frame(self.recorder, self.grid)
+        self.dirty_tiles = changed_tiles
+        return changed_tiles
+
+    def _publish(self, frame):
+        while True:
+            try:
+                self.frames.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    stale = self.frames.get_nowait()
+                except queue.Empty:
+                    continue
+                frame = frame[:3] + (_merge_tiles(stale[3], frame[3]),)
+
+    def _run(self):
+        while not self.stopping.is_set():
+            changed_tiles = self.step()
+            self._publish((self.grid, self.generation, self.history_pos, changed_tiles))
+            if self.interval:
+                self.stopping.wait(self.interval)
+
+    def latest(self):
+        """Newest published frame with the changed tiles of every skipped one, or None"""
+        frame = None
+        while True:
+            try:
+                newer = self.frames.get_nowait()
+            except queue.Empty:
+                return frame
+            if frame is not None:
+                newer = newer[:3] + (_merge_tiles(frame[3], newer[3]),)
+            frame = newer
+
+def record_frame(frames, grid):
+    """Append a copy of grid to a GIF recording, keeping about the frames export_gif uses"""
+    frames.append([row[:] for row in grid])
+    if len(frames) > 2 * GIF_MAX_FRAMES:
+        del frames[:-GIF_MAX_FRAMES]
+
+def _merge_tiles(older, newer):
+    """Union of two changed-tile sets; None means unknown, so everything is redrawn"""
+    if older is None or newer is None:
+        return None
+    return older | newer
+
 def run_gui_version():
     """Run the ULTIMATE enhanced GUI version"""
     try:
@@ -912,13 +4119,36 @@ def run_gui_version():
             self.grid = initialize_grid(self.rows, self.cols, 0.25)
             self.generation = 0
             self.paused = True
-            self.history = [self.grid]
+            self.history = CheckpointTimeline(self.grid, self.generation)
             self.history_pos = 0
             self.speed = 200
             self.stats = GameStats()
             self.stats.update(self.grid, self.generation)
             self.recording = False
             self.recorded_frames = []
+            self.drag_cells = None
+            self.drag_value = 1
+            self.drag_resume = False
+            self.dirty_tiles = None
+            self.drawn_layout = None
+            self.drawn_origin = None
+            self.patterns_stale = True
+            self.pattern_scan_generation = None
+            self.cell_items = []
+            self.drawn_grid = []
+            self.render_mode = 'auto'
+            self.board_image_item = None
+            self.board_photo = None
+            self.view = None
+            self.view_fit = True
+            self.view_top = self.view_left = 0
+            self.view_cell_size = self.view_block = 1
+            self.follow = None
+            self.pan_anchor = None
+            self.lock = threading.RLock()
+            self.worker = None
+            self.after_id = None
+            self.scale_pos = 0
             self.setup_ui()
             self.update_display()
 
@@ -941,7 +4171,7 @@ def run_gui_version():
             speed_subframe.pack(side=tk.LEFT, padx=5)
             tk.Label(speed_subframe, text="Speed:", font=('Arial', 8)).pack(side=tk.LEFT)
             self.speed_var = tk.IntVar(value=self.speed)
-            self.speed_scale = tk.Scale(speed_subframe, from_=50, to=1000, orient=tk.HORIZONTAL, 
+            self.speed_scale = tk.Scale(speed_subframe, from_=0, to=1000, orient=tk.HORIZONTAL, 
                                        variable=self.speed_var, length=80, command=self.update_speed)
             self.speed_scale.pack(side=tk.LEFT)
 
@@ -950,6 +4180,9 @@ def run_gui_version():
             tk.Button(advanced_controls, text="🎭 Patterns", command=self.load_pattern_gui, bg='#9C27B0', fg='white').pack(side=tk.LEFT, padx=2)
             tk.Button(advanced_controls, text="💾 Save", command=self.save_game, bg='#607D8B', fg='white').pack(side=tk.LEFT, padx=2)
             tk.Button(advanced_controls, text="📁 Load", command=self.load_game, bg='#795548', fg='white').pack(side=tk.LEFT, padx=2)
+            self.render_button = tk.Button(advanced_controls, text="🖼️ Render: Auto", command=self.cycle_render_mode,
+                                           bg='#455A64', fg='white')
+            self.render_button.pack(side=tk.LEFT, padx=2)
 
             export_controls = tk.LabelFrame(control_frame1, text="Export Options", font=('Arial', 9, 'bold'))
             export_controls.pack(side=tk.LEFT, padx=5, pady=2)
@@ -976,34 +4209,52 @@ def run_gui_version():
             self.status_label.pack()
             self.pop_label = tk.Label(status_frame, text="Population: 0 | Growth Rate: 0.00", font=('Arial', 10))
             self.pop_label.pack()
-            help_text = ("🎮 Controls: [Space] Play/Pause | [→←] Step | [R]eset | [C]lear | [P]attern | Click/Drag to draw")
+            help_text = ("🎮 Controls: [Space] Play/Pause | [→←] Step | [R]eset | [C]lear | [P]attern | Click/Drag to draw\n"
+                         "🔎 View: [+/-]/Wheel Zoom | [0] Fit | [↑↓ Shift+←→]/Middle-drag Pan | Right-click Follow")
             help_label = tk.Label(status_frame, text=help_text, font=('Arial', 8), fg='gray')
             help_label.pack()
+            self.history_scale = tk.Scale(status_frame, from_=0, to=0, orient=tk.HORIZONTAL, showvalue=False,
+                                          length=400, label="History", command=self.scrub_history)
+            self.history_scale.pack()
 
             self.canvas = tk.Canvas(self.root, bg='white', width=800, height=500)
             self.canvas.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
             self.canvas.bind('<Button-1>', self.on_canvas_click)
             self.canvas.bind('<B1-Motion>', self.on_canvas_drag)
+            self.canvas.bind('<ButtonRelease-1>', self.on_canvas_release)
             self.root.focus_set()
             self.root.bind('<KeyPress>', self.on_key_press)
             self.root.bind('<Left>', self.on_arrow_key)
             self.root.bind('<Right>', self.on_arrow_key)
+            self.root.bind('<Up>', self.on_pan_key)
+            self.root.bind('<Down>', self.on_pan_key)
+            self.root.bind('<Shift-Left>', self.on_pan_key)
+            self.root.bind('<Shift-Right>', self.on_pan_key)
+            self.canvas.bind('<Button-2>', self.on_pan_start)
+            self.canvas.bind('<B2-Motion>', self.on_pan_drag)
+            self.canvas.bind('<Button-3>', self.on_follow_click)
+            self.canvas.bind('<MouseWheel>', self.on_mouse_wheel)
+            self.canvas.bind('<Button-4>', self.on_mouse_wheel)
+            self.canvas.bind('<Button-5>', self.on_mouse_wheel)
 
         def update_speed(self, value):
             self.speed = int(value)
+            if self.worker is not None:
+                self.worker.interval = self.speed / 1000
 
         def clear_grid(self):
+            self.pause()
             self.grid = [[0] * self.cols for _ in range(self.rows)]
+            self.dirty_tiles = None
             self.generation = 0
-            self.history = [[row[:] for row in self.grid]]
+            self.history = CheckpointTimeline(self.grid, self.generation)
             self.history_pos = 0
-            self.paused = True
             self.stats = GameStats()
             self.stats.update(self.grid, self.generation)
             self.update_display()
 
         def get_grid_stats(self):
-            live_cells = sum(sum(row) for row in self.grid)
+            live_cells = self.stats.get_current_population()
             total_cells = self.rows * self.cols
             population_percent = (live_cells / total_cells) * 100 if total_cells > 0 else 0
             return live_cells, population_percent
@@ -1012,6 +4263,11 @@ def run_gui_version():
             self.recording = not self.recording
             if self.recording:
                 self.recorded_frames = []
+            # While running the worker records every generation, not just the displayed ones
+            if self.worker is not None:
+                with self.lock:
+                    self.worker.recorder = self.recorded_frames if self.recording else None
+            if self.recording:
                 self.record_button.config(text="⏹️ Stop", bg='#4CAF50')
             else:
                 self.record_button.config(text="🔴 Record", bg='#F44336')
@@ -1035,8 +4291,7 @@ def run_gui_version():
                     messagebox.showerror("Export Failed", message)
 
         def load_pattern_gui(self):
-            patterns = ['glider', 'blinker', 'block', 'beehive', 'loaf', 'boat', 'tub', 
-                       'beacon', 'toad', 'pulsar', 'gosper_gun', 'penta_decathlon', 'lightweight_spaceship']
+            patterns = PATTERN_INDEX.names()
             dialog = tk.Toplevel(self.root)
             dialog.title("🎭 Select Pattern")
             dialog.geometry("500x600")
@@ -1100,29 +4355,44 @@ def run_gui_version():
                 select_btn.pack(anchor=tk.E, pady=2)
             canvas_frame.pack(side="left", fill="both", expand=True)
             scrollbar.pack(side="right", fill="y")
+            tk.Button(dialog, text="📂 Open RLE / Life 1.06 File...",
+                      command=lambda: self.open_pattern_file(selected_pattern, dialog),
+                      bg='#2196F3', fg='white').pack(pady=(10, 0))
             tk.Button(dialog, text="Cancel", command=dialog.destroy, bg='#F44336', fg='white').pack(pady=10)
             dialog.wait_window()
             if selected_pattern[0]:
+                self.pause()
                 success, message, new_grid = safe_load_and_place_pattern(self.grid, selected_pattern[0])
                 if success:
                     self.grid = new_grid
+                    self.dirty_tiles = None
                     self.generation = 0
-                    self.history = [[row[:] for row in self.grid]]
+                    self.history = CheckpointTimeline(self.grid, self.generation)
                     self.history_pos = 0
-                    self.paused = True
                     self.stats = GameStats()
                     self.stats.update(self.grid, self.generation)
                     self.update_display()
                     messagebox.showinfo("Pattern Loaded", 
-                                    f"🎭 {selected_pattern[0].replace('_', ' ').title()} loaded successfully!")
+                                    f"🎭 {selected_pattern[0].replace('_', ' ').title()} loaded successfully!"
+                                    if selected_pattern[0] in PATTERN_INDEX else f"🎭 {message}")
+                else:
+                    messagebox.showerror("❌ Pattern Failed", message)
         def select_pattern(self, pattern_name, selected_pattern, dialog):
             selected_pattern[0] = pattern_name
             dialog.destroy()
 
+        def open_pattern_file(self, selected_pattern, dialog):
+            filename = filedialog.askopenfilename(
+                filetypes=[("Pattern files", "*.rle *.lif *.life"), ("RLE files", "*.rle"),
+                           ("Life 1.06 files", "*.lif *.life"), ("All files", "*.*")]
+            )
+            if filename:
+                self.select_pattern(filename, selected_pattern, dialog)
+
         def save_game(self):
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=[("JSON files", "*.json"), ("Binary saves", "*.golb"), ("Memory-mapped boards", "*.golm"), ("All files", "*.*")],
                 title="Save Game State"
             )
             if filename:
@@ -1134,19 +4404,26 @@ def run_gui_version():
 
         def load_game(self):
             filename = filedialog.askopenfilename(
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=[("Saved games", "*.json *.golb *.golm *.golr"), ("All files", "*.*")],
                 title="Load Game State"
             )
-            if filename:
+            if filename and filename.endswith(RUNLOG_EXTENSION):
+                self.load_run_log(filename)
+            elif filename:
                 success, loaded_grid, loaded_gen = load_state(filename)
                 if success:
-                    self.grid = loaded_grid
-                    self.rows = len(loaded_grid)
-                    self.cols = len(loaded_grid[0]) if loaded_grid else 0
+                    self.pause()
+                    try:
+                        self.grid = convert_board(loaded_grid, 'list')
+                    finally:
+                        if isinstance(loaded_grid, MemmapBoard):
+                            loaded_grid.close()
+                    self.dirty_tiles = None
+                    self.rows = len(self.grid)
+                    self.cols = len(self.grid[0]) if self.grid else 0
                     self.generation = loaded_gen
-                    self.history = [[row[:] for row in self.grid]]
+                    self.history = CheckpointTimeline(self.grid, self.generation)
                     self.history_pos = 0
-                    self.paused = True
                     self.stats = GameStats()
                     self.stats.update(self.grid, self.generation)
                     self.update_display()
@@ -1154,6 +4431,35 @@ def run_gui_version():
                 else:
                     messagebox.showerror("Load Failed", "Failed to load game state!")
 
+        def load_run_log(self, filename):
+            """Browse a recorded run: the history slider seeks into the log on disk"""
+            try:
+                log = RunLogReader(filename)
+            except (OSError, ValueError, struct.error) as e:
+                messagebox.showerror("Load Failed", f"Failed to open run log: {e}")
+                return
+            if not log:
+                log.close()
+                messagebox.showerror("Load Failed", "Run log is empty!")
+                return
+            self.pause()
+            self.history = log
+            self.history_pos = len(log) - 1
+            self.grid = log[self.history_pos]
+            self.dirty_tiles = None
+            self.rows, self.cols = log.rows, log.cols
+            self.generation = log.generation_at(self.history_pos)
+            self.stats = log.stats()
+            self.update_display()
+            messagebox.showinfo("📁 Load Successful", f"Run log loaded ({len(log)} generations)")
+
+        def own_history(self):
+            """Replace a read-only run log with an editable timeline starting at the current board"""
+            if isinstance(self.history, RunLogReader):
+                self.history.close()
+                self.history = CheckpointTimeline(self.grid, self.generation)
+                self.history_pos = 0
+
         def export_image(self):
             filename = filedialog.asksaveasfilename(
                 defaultextension=".png",
@@ -1177,7 +4483,8 @@ def run_gui_version():
                 title="Export Animation as GIF"
             )
             if filename:
-                success, message = export_gif(self.history, filename, cell_size=15, duration=200)
+                with self.lock:
+                    success, message = export_gif(self.history, filename, cell_size=15, duration=200)
                 if success:
                     messagebox.showinfo("🎬 Export Successful", message)
                 else:
@@ -1226,39 +4533,286 @@ def run_gui_version():
                 self.switch_to_terminal()
             elif key == 'q':
                 self.on_closing()
+            elif key in ('+', '='):
+                self.zoom_view(1)
+            elif key == '-':
+                self.zoom_view(-1)
+            elif key == '0':
+                self.fit_view()
+
+        def cycle_render_mode(self):
+            """Switch between automatic, per-cell canvas and single-image rendering"""
+            modes = ('auto', 'cells', 'image')
+            self.render_mode = modes[(modes.index(self.render_mode) + 1) % len(modes)]
+            self.render_button.config(text=f"🖼️ Render: {self.render_mode.title()}")
+            self.update_display()
+
+        def active_render_mode(self, view):
+            """Downsampled views are always blitted; 'auto' also blits large windows"""
+            top, left, height, width, cell_size, block = view[:6]
+            if block > 1 or self.render_mode == 'image':
+                return 'image'
+            if self.render_mode == 'auto' and height * width > BLIT_RENDER_CELLS:
+                return 'image'
+            return 'cells'
+
+        def compute_view(self, canvas_width, canvas_height):
+            """The visible cell window and where it sits on the canvas.
+
+            Returns (top, left, height, width, cell_size, block, offset_x, offset_y):
+            each block x block group of cells is drawn as one cell_size square.
+            Fit mode shows the whole board, downsampling when it has more
+            cells than the canvas has pixels.
+            """
+            if self.view_fit:
+                cell_size = max(1, min(canvas_width // self.cols, canvas_height // self.rows))
+                block = 1
+                while -(-self.cols // block) > canvas_width or -(-self.rows // block) > canvas_height:
+                    block *= 2
+                top, left, height, width = 0, 0, self.rows, self.cols
+            else:
+                cell_size, block = self.view_cell_size, self.view_block
+                height = max(1, min(self.rows, canvas_height // cell_size * block))
+                width = max(1, min(self.cols, canvas_width // cell_size * block))
+                if self.follow is not None:
+                    self.view_top = round(self.follow[0] - height / 2)
+                    self.view_left = round(self.follow[1] - width / 2)
+                self.view_top = top = min(max(0, self.view_top), self.rows - height)
+                self.view_left = left = min(max(0, self.view_left), self.cols - width)
+            offset_x = (canvas_width - -(-width // block) * cell_size) // 2
+            offset_y = (canvas_height - -(-height // block) * cell_size) // 2
+            return top, left, height, width, cell_size, block, offset_x, offset_y
+
+        def canvas_to_cell(self, x, y):
+            """Board (row, col) under a canvas point, or None outside the drawn window"""
+            if self.view is None:
+                return None
+            top, left, height, width, cell_size, block, offset_x, offset_y = self.view
+            if x < offset_x or y < offset_y:
+                return None
+            row = (y - offset_y) // cell_size * block
+            col = (x - offset_x) // cell_size * block
+            if row >= height or col >= width:
+                return None
+            return top + row, left + col
+
+        def pin_view(self):
+            """Leave fit mode, keeping the current window as the starting point for pan/zoom"""
+            if self.view_fit and self.view is not None:
+                self.view_top, self.view_left = self.view[0], self.view[1]
+                self.view_cell_size, self.view_block = self.view[4], self.view[5]
+                self.view_fit = False
+
+        def zoom_view(self, direction, x=None, y=None):
+            """Zoom in (direction > 0) or out around a canvas point, the window centre by default"""
+            if self.view is None:
+                return
+            top, left, height, width, cell_size, block, offset_x, offset_y = self.view
+            canvas_width, canvas_height = self.canvas.winfo_width(), self.canvas.winfo_height()
+            x = canvas_width // 2 if x is None else x
+            y = canvas_height // 2 if y is None else y
+            anchor_row = top + (y - offset_y) / cell_size * block
+            anchor_col = left + (x - offset_x) / cell_size * block
+            if direction > 0:
+                if block > 1:
+                    block //= 2
+                else:
+                    cell_size = min(cell_size * 2, MAX_CELL_SIZE)
+            elif height == self.rows and width == self.cols:
+                self.view_fit = True
+                self.update_display()
+                return
+            elif cell_size > 1:
+                cell_size //= 2
+            else:
+                block *= 2
+            self.view_fit = False
+            self.view_cell_size, self.view_block = cell_size, block
+            self.view_top = round(anchor_row - y / cell_size * block)
+            self.view_left = round(anchor_col - x / cell_size * block)
+            self.update_display()
+
+        def fit_view(self):
+            self.view_fit = True
+            self.follow = None
+            self.update_display()
+
+        def pan_view(self, rows, cols):
+            """Move the window by a number of cells; panning stops following"""
+            self.pin_view()
+            self.follow = None
+            self.view_top += rows
+            self.view_left += cols
+            self.update_display()
+
+        def on_pan_key(self, event):
+            if self.view is None:
+                return
+            step_rows, step_cols = max(1, self.view[2] // 4), max(1, self.view[3] // 4)
+            rows, cols = {'Up': (-step_rows, 0), 'Down': (step_rows, 0),
+                          'Left': (0, -step_cols), 'Right': (0, step_cols)}[event.keysym]
+            self.pan_view(rows, cols)
+
+        def on_pan_start(self, event):
+            self.pan_anchor = (event.x, event.y)
+
+        def on_pan_drag(self, event):
+            if self.view is None or self.pan_anchor is None:
+                return
+            cell_size, block = self.view[4], self.view[5]
+            rows = (self.pan_anchor[1] - event.y) // cell_size * block
+            cols = (self.pan_anchor[0] - event.x) // cell_size * block
+            if rows or cols:
+                self.pan_anchor = (self.pan_anchor[0] - cols // block * cell_size,
+                                   self.pan_anchor[1] - rows // block * cell_size)
+                self.pan_view(rows, cols)
 
-        def update_display(self):
+        def on_mouse_wheel(self, event):
+            direction = 1 if event.num == 4 or getattr(event, 'delta', 0) > 0 else -1
+            self.zoom_view(direction, event.x, event.y)
+
+        def on_follow_click(self, event):
+            """Right-click follows the object under the pointer; right-click empty space to stop"""
+            cell = self.canvas_to_cell(event.x, event.y)
+            self.follow = self.track_follow(cell) if cell is not None else None
+            if self.follow is not None:
+                self.pin_view()
+            self.update_display()
+
+        def track_follow(self, point):
+            """Centroid of the live cells within FOLLOW_RADIUS of point, or None if there are none"""
+            row, col = int(point[0]), int(point[1])
+            total_row = total_col = count = 0
+            for i in range(max(0, row - FOLLOW_RADIUS), min(self.rows, row + FOLLOW_RADIUS + 1)):
+                grid_row = self.grid[i]
+                for j in range(max(0, col - FOLLOW_RADIUS), min(self.cols, col + FOLLOW_RADIUS + 1)):
+                    if grid_row[j]:
+                        total_row += i
+                        total_col += j
+                        count += 1
+            if not count:
+                return None
+            return total_row / count, total_col / count
+
+        def blit_board(self, layout):
+            """Draw the visible window as one image item, recreating the item only when the layout changes"""
+            top, left, height, width, cell_size, block, offset_x, offset_y = self.view
+            if layout != self.drawn_layout:
+                self.canvas.delete("all")
+                self.cell_items = []
+                self.drawn_grid = []
+                self.board_image_item = None
+                self.drawn_layout = None
+                if layout[0] <= 1 or layout[1] <= 1:
+                    return
+            window = None if (height, width) == (self.rows, self.cols) else (top, left, height, width)
+            ppm = board_ppm(self.grid, cell_size, window=window, block=block)
+            self.board_photo = tk.PhotoImage(data=ppm, format='PPM')
+            if self.board_image_item is None:
+                self.board_image_item = self.canvas.create_image(offset_x, offset_y, image=self.board_photo,
+                                                                 anchor=tk.NW)
+            else:
+                self.canvas.itemconfig(self.board_image_item, image=self.board_photo)
+            self.drawn_layout = layout
+            self.drawn_origin = (top, left)
+
+        def build_cells(self, layout):
+            """Create one rectangle item per visible cell; only needed when the layout changes.
+
+            Panning keeps the layout, so the same items are recoloured for the
+            new window by redraw_changed_cells instead of being rebuilt.
+            """
+            top, left, height, width, cell_size, block, offset_x, offset_y = self.view
             self.canvas.delete("all")
+            self.cell_items = []
+            self.drawn_grid = []
+            self.board_image_item = None
+            self.drawn_layout = None
+            if layout[0] <= 1 or layout[1] <= 1:
+                return
+            for i in range(top, top + height):
+                y1 = offset_y + (i - top) * cell_size
+                row_items = []
+                for j in range(left, left + width):
+                    x1 = offset_x + (j - left) * cell_size
+                    color = 'black' if self.grid[i][j] else 'white'
+                    row_items.append(self.canvas.create_rectangle(x1, y1, x1 + cell_size, y1 + cell_size,
+                                                                  fill=color, outline='gray'))
+                self.cell_items.append(row_items)
+            self.drawn_grid = [row[left:left + width] for row in self.grid[top:top + height]]
+            self.drawn_layout = layout
+            self.drawn_origin = (top, left)
+
+        def redraw_changed_cells(self, changed_tiles=None):
+            """Recolour only the visible cells that differ from what is drawn.
+
+            changed_tiles (from the tiled engine) limits the comparison to
+            those tiles; without it every visible row is compared, which is
+            also how a panned window is brought onto the existing items.
+            Returns the number of cells recoloured.
+            """
+            top, left = self.view[:2]
+            height, width = self.drawn_layout[-1][:2]
+            bottom, right = top + height, left + width
+            if (top, left) != self.drawn_origin:
+                self.drawn_origin = (top, left)
+                changed_tiles = None
+            if changed_tiles is None:
+                spans = [(i, left, right) for i in range(top, bottom)]
+            else:
+                spans = [(i, max(left, tj * TILE_SIZE), min((tj + 1) * TILE_SIZE, right))
+                         for ti, tj in changed_tiles
+                         for i in range(max(top, ti * TILE_SIZE), min((ti + 1) * TILE_SIZE, bottom))]
+            recoloured = 0
+            for i, start, stop in spans:
+                row, drawn = self.grid[i], self.drawn_grid[i - top]
+                if start >= stop or row[start:stop] == drawn[start - left:stop - left]:
+                    continue
+                items = self.cell_items[i - top]
+                for j in range(start, stop):
+                    if row[j] != drawn[j - left]:
+                        drawn[j - left] = row[j]
+                        self.canvas.itemconfig(items[j - left], fill='black' if row[j] else 'white')
+                        recoloured += 1
+            return recoloured
+
+        def update_display(self, changed_tiles=None):
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
-            if canvas_width > 1 and canvas_height > 1:
-                max_cell_width = canvas_width // self.cols
-                max_cell_height = canvas_height // self.rows
-                self.cell_size = min(max_cell_width, max_cell_height)
-                total_width = self.cols * self.cell_size
-                total_height = self.rows * self.cell_size
-                offset_x = (canvas_width - total_width) // 2
-                offset_y = (canvas_height - total_height) // 2
-                for i in range(self.rows):
-                    for j in range(self.cols):
-                        x1 = offset_x + j * self.cell_size
-                        y1 = offset_y + i * self.cell_size
-                        x2 = x1 + self.cell_size
-                        y2 = y1 + self.cell_size
-                        color = 'black' if self.grid[i][j] else 'white'
-                        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline='gray')
-            self.update_statistics()
-            self.update_pattern_detection()
-            if self.recording:
-                self.recorded_frames.append([row[:] for row in self.grid])
+            if self.follow is not None:
+                self.follow = self.track_follow(self.follow)
+            self.view = self.compute_view(canvas_width, canvas_height)
+            self.cell_size = self.view[4]
+            mode = self.active_render_mode(self.view)
+            # The window origin is not part of the layout: panning and following keep the canvas items
+            layout = (canvas_width, canvas_height, self.rows, self.cols, mode, self.view[2:])
+            if mode == 'image':
+                changed = (layout != self.drawn_layout or self.view[:2] != self.drawn_origin
+                           or changed_tiles is None or bool(changed_tiles))
+                if changed:
+                    self.blit_board(layout)
+            elif layout != self.drawn_layout:
+                self.build_cells(layout)
+                changed = True
+            else:
+                changed = self.redraw_changed_cells(changed_tiles) > 0
+            self.update_pattern_detection(changed_tiles)
+            if self.recording and self.worker is None and (
+                    not self.recorded_frames or self.recorded_frames[-1] != self.grid):
+                record_frame(self.recorded_frames, self.grid)
+            # The worker updates the timeline and stats under the same lock
+            with self.lock:
+                self.update_statistics()
+                history_length = len(self.history)
+                live_cells, population_percent = self.get_grid_stats()
+                growth_rate = self.stats.get_growth_rate()
             status = 'RUNNING' if not self.paused else 'PAUSED'
-            history_info = f" | History: {self.history_pos}/{len(self.history)-1}"
+            history_info = f" | History: {self.history_pos}/{history_length-1}"
             self.status_label.config(text=f"Generation: {self.generation} | {status}{history_info}")
-            live_cells, population_percent = self.get_grid_stats()
-            growth_rate = self.stats.get_growth_rate()
+            self.history_scale.config(to=max(0, history_length - 1))
+            self.scale_pos = self.history_pos
+            self.history_scale.set(self.history_pos)
             self.pop_label.config(text=f"Population: {live_cells} ({population_percent:.1f}%) | Growth Rate: {growth_rate:.2f}")
-            if not self.paused:
-                self.root.after(self.speed, self.auto_step)
 
         def update_statistics(self):
             self.stats_text.config(state=tk.NORMAL)
@@ -1273,16 +4827,35 @@ Status: {summary['status']}
 """
             if summary['stable_count'] > 0:
                 stats_info += f"Stable: {summary['stable_count']} gens\n"
+            if summary['period'] is not None:
+                stats_info += f"Cycle: p{summary['period']} after {summary['transient']} gens\n"
             if len(self.stats.population_history) > 1:
                 recent = [p[1] for p in list(self.stats.population_history)[-5:]]
                 stats_info += f"Trend: {' → '.join(map(str, recent))}\n"
             self.stats_text.insert(tk.END, stats_info)
             self.stats_text.config(state=tk.DISABLED)
 
-        def update_pattern_detection(self):
-            patterns = find_patterns_in_grid(self.grid)
+        def update_pattern_detection(self, changed_tiles=None):
+            """Rescan the whole board for library patterns once it has changed.
+
+            changed_tiles (from the tiled engine) being empty means the board
+            did not change. While running the scan happens at most every
+            PATTERN_SCAN_INTERVAL generations; mid-stroke edits wait for the
+            release.
+            """
+            if changed_tiles is None or changed_tiles:
+                self.patterns_stale = True
+            if not self.patterns_stale or self.drag_cells is not None:
+                return
+            if (not self.paused and self.pattern_scan_generation is not None
+                    and abs(self.generation - self.pattern_scan_generation) < PATTERN_SCAN_INTERVAL):
+                return
+            self.patterns_stale = False
+            self.pattern_scan_generation = self.generation
+            patterns = detect_patterns(self.grid)
             if patterns:
-                pattern_text = f"🔍 Found: {', '.join(p.title() for p in patterns[:3])}"
+                found = [f"{name.title()} x{len(spots)}" for name, spots in patterns.items()]
+                pattern_text = f"🔍 Found: {', '.join(found[:3])}"
                 if len(patterns) > 3:
                     pattern_text += f" (+{len(patterns)-3} more)"
                 self.pattern_label.config(text=pattern_text, fg='green')
@@ -1290,79 +4863,162 @@ Status: {summary['status']}
                 self.pattern_label.config(text="No common patterns detected", fg='gray')
 
         def on_canvas_click(self, event):
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            total_width = self.cols * self.cell_size
-            total_height = self.rows * self.cell_size
-            offset_x = (canvas_width - total_width) // 2
-            offset_y = (canvas_height - total_height) // 2
-            adjusted_x = event.x - offset_x
-            adjusted_y = event.y - offset_y
-            if adjusted_x >= 0 and adjusted_y >= 0:
-                col = adjusted_x // self.cell_size
-                row = adjusted_y // self.cell_size
-                if 0 <= row < self.rows and 0 <= col < self.cols:
-                    self.grid[row][col] = 1 - self.grid[row][col]
-                    self.stats.update(self.grid, self.generation)
-                    self.update_display()
+            """Start a stroke: toggle the cell, and paint that value over cells dragged across"""
+            cell = self.canvas_to_cell(event.x, event.y)
+            # Zoomed out past one cell per pixel a click covers a whole block: zoom in to edit
+            if cell is None or self.view[5] > 1:
+                return
+            # Drawing while running: stop the worker for the whole stroke, resume on release
+            self.drag_resume = self.worker is not None
+            self.pause()
+            row, col = cell
+            self.drag_value = 1 - self.grid[row][col]
+            self.drag_cells = set()
+            self.paint_cell(cell)
 
         def on_canvas_drag(self, event):
-            self.on_canvas_click(event)
+            if self.drag_cells is None:
+                return
+            cell = self.canvas_to_cell(event.x, event.y)
+            if cell is not None and self.view[5] == 1 and cell not in self.drag_cells:
+                self.paint_cell(cell)
+
+        def paint_cell(self, cell):
+            row, col = cell
+            self.drag_cells.add(cell)
+            if self.grid[row][col] == self.drag_value:
+                return
+            self.grid[row][col] = self.drag_value
+            tile = (row // TILE_SIZE, col // TILE_SIZE)
+            if self.dirty_tiles is not None:
+                self.dirty_tiles.add(tile)
+            self.update_display({tile})
+
+        def on_canvas_release(self, event):
+            """End a stroke: record the edits once, then carry on running if the stroke paused the run"""
+            if self.drag_cells is None:
+                return
+            self.drag_cells = None
+            # The edited board starts a new branch of the timeline
+            self.own_history()
+            self.history.edit(self.generation, self.grid)
+            self.stats.update(self.grid, self.generation)
+            self.update_display()
+            if self.drag_resume:
+                self.drag_resume = False
+                self.play()
 
         def toggle_pause(self):
-            self.paused = not self.paused
-            if not self.paused:
-                self.auto_step()
+            if self.paused:
+                self.play()
+            else:
+                self.pause()
             self.update_display()
 
+        def play(self):
+            """Start stepping on a SimulationWorker thread and poll it for frames"""
+            if self.worker is not None:
+                return
+            # Mid-stroke the run resumes once the button is released
+            if self.drag_cells is not None:
+                self.drag_resume = True
+                return
+            self.paused = False
+            self.worker = SimulationWorker(self.grid, self.generation, self.history, self.history_pos, self.stats,
+                                           self.lock, self.dirty_tiles, interval=self.speed / 1000)
+            if self.recording:
+                self.worker.recorder = self.recorded_frames
+            self.worker.start()
+            self.after_id = self.root.after(FRAME_INTERVAL_MS, self.poll_frames)
+
+        def pause(self):
+            """Stop the worker, if any, and take over its latest state"""
+            self.paused = True
+            if self.after_id is not None:
+                self.root.after_cancel(self.after_id)
+                self.after_id = None
+            if self.worker is None:
+                return
+            worker, self.worker = self.worker, None
+            worker.stop()
+            self.grid, self.generation = worker.grid, worker.generation
+            self.history, self.history_pos = worker.history, worker.history_pos
+            self.dirty_tiles = worker.dirty_tiles
+            self.update_display()
+
+        def poll_frames(self):
+            """Show the newest generation the worker has finished; the only pending after() while running"""
+            self.after_id = None
+            frame = self.worker.latest()
+            if frame is not None:
+                self.grid, self.generation, self.history_pos, changed_tiles = frame
+                self.history = self.worker.history
+                self.update_display(changed_tiles)
+            self.after_id = self.root.after(FRAME_INTERVAL_MS, self.poll_frames)
+
         def step_forward(self):
+            self.pause()
+            changed_tiles = births = deaths = None
             if self.history_pos < len(self.history) - 1:
                 self.history_pos += 1
-                self.grid = [row[:] for row in self.history[self.history_pos]]
-                self.generation = self.history_pos
+                self.grid = self.history[self.history_pos]
+                self.generation = self.history.generation_at(self.history_pos)
             else:
-                new_grid = next_generation(self.grid)
-                self.history.append([row[:] for row in new_grid])
-                if len(self.history) > 1000:
-                    self.history.pop(0)
-                else:
-                    self.history_pos += 1
+                new_grid, changed_tiles, births, deaths = next_generation_tiled(self.grid, self.dirty_tiles)
+                self.own_history()
+                self.history.append(new_grid)
+                self.history_pos = len(self.history) - 1
                 self.grid = new_grid
                 self.generation += 1
+            self.dirty_tiles = changed_tiles
+            self.stats.update(self.grid, self.generation, changed_tiles, births=births, deaths=deaths)
+            self.update_display(changed_tiles)
+
+        def scrub_history(self, value):
+            index = int(value)
+            # Tk echoes the position update_display sets; only user moves count
+            if index in (self.history_pos, self.scale_pos) or not 0 <= index < len(self.history):
+                return
+            self.pause()
+            self.history_pos = index
+            self.grid = self.history[index]
+            self.dirty_tiles = None
+            self.generation = self.history.generation_at(index)
             self.stats.update(self.grid, self.generation)
             self.update_display()
 
         def step_backward(self):
+            self.pause()
             if self.history_pos > 0:
                 self.history_pos -= 1
-                self.grid = [row[:] for row in self.history[self.history_pos]]
-                self.generation = self.history_pos
+                self.grid = self.history[self.history_pos]
+                self.dirty_tiles = None
+                self.generation = self.history.generation_at(self.history_pos)
                 self.stats.update(self.grid, self.generation)
                 self.update_display()
 
         def reset_grid(self):
+            self.pause()
             self.grid = initialize_grid(self.rows, self.cols, 0.25)
+            self.dirty_tiles = None
             self.generation = 0
-            self.history = [[row[:] for row in self.grid]]
+            self.history = CheckpointTimeline(self.grid, self.generation)
             self.history_pos = 0
-            self.paused = True
             self.stats = GameStats()
             self.stats.update(self.grid, self.generation)
             self.update_display()
 
         def switch_to_terminal(self):
+            self.pause()
             self.root.destroy()
             run_terminal_version()
 
-        def auto_step(self):
-            if not self.paused:
-                self.step_forward()
-
         def run(self):
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
             self.root.mainloop()
 
         def on_closing(self):
+            self.pause()
             self.root.destroy()
 
     gui = UltimateGameOfLifeGUI()
@@ -1373,33 +5029,27 @@ Status: {summary['status']}
 # ========================
 
 def initialize_3d_grid(x_size, y_size, z_size, density=0.1):
-    """Initialize a 3D grid for 3D Game of Life"""
-    try:
-        import numpy as np
-        return np.random.choice([0, 1], size=(x_size, y_size, z_size), p=[1-density, density])
-    except ImportError:
-        return [[[1 if random.random() < density else 0 
-                 for _ in range(z_size)] 
-                for _ in range(y_size)] 
-               for _ in range(x_size)]
+    """Initialize a 3D grid for 3D Game of Life (uint8 array when numpy is available)"""
+    if np is not None:
+        return (np.random.random((x_size, y_size, z_size)) < density).astype(np.uint8)
+    return [[[1 if random.random() < density else 0 
+             for _ in range(z_size)] 
+            for _ in range(y_size)] 
+           for _ in range(x_size)]
 
 def count_3d_neighbors(grid, x, y, z):
     """Count neighbors in 3D space"""
-    try:
-        import numpy as np
-        if isinstance(grid, np.ndarray):
-            X, Y, Z = grid.shape
-            count = 0
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    for dz in [-1, 0, 1]:
-                        if dx == dy == dz == 0:
-                            continue
-                        nx, ny, nz = (x+dx) % X, (y+dy) % Y, (z+dz) % Z
-                        count += grid[nx, ny, nz]
-            return count
-    except ImportError:
-        pass
+    if np is not None and isinstance(grid, np.ndarray):
+        X, Y, Z = grid.shape
+        count = 0
+        for dx in [-1, 0, 1]:
+            for dy in [-1, 0, 1]:
+                for dz in [-1, 0, 1]:
+                    if dx == dy == dz == 0:
+                        continue
+                    nx, ny, nz = (x+dx) % X, (y+dy) % Y, (z+dz) % Z
+                    count += int(grid[nx, ny, nz])
+        return count
     X, Y, Z = len(grid), len(grid[0]), len(grid[0][0])
     count = 0
     for dx in [-1, 0, 1]:
@@ -1411,41 +5061,44 @@ def count_3d_neighbors(grid, x, y, z):
                 count += grid[nx][ny][nz]
     return count
 
-def next_3d_generation(grid):
-    """3D Game of Life rules (simplified)"""
-    try:
-        import numpy as np
+def count_3d_neighbors_numpy(board):
+    """Count the 26 neighbors of every voxel at once with toroidal wrapping.
+
+    The 3x3x3 box sum is separable, so it is built from three 1D sums of
+    rolled copies (one per axis) and the voxel itself is subtracted. The
+    maximum count of 26 fits in uint8.
+    """
+    box = board.astype(np.uint8)
+    for axis in range(3):
+        box = box + np.roll(box, 1, axis) + np.roll(box, -1, axis)
+    return box - board
+
+def next_3d_generation_numpy(board, rule=RULE_3D):
+    """Compute the next 3D generation of a uint8 NumPy board via the rule table"""
+    board = np.asarray(board, dtype=np.uint8)
+    return rule.array[board, count_3d_neighbors_numpy(board)]
+
+def next_3d_generation(grid, rule=RULE_3D):
+    """3D Game of Life rules (B5/S456 over 26 neighbors by default)"""
+    if np is not None:
         if isinstance(grid, np.ndarray):
-            X, Y, Z = grid.shape
-            new_grid = np.zeros_like(grid)
-            for x in range(X):
-                for y in range(Y):
-                    for z in range(Z):
-                        neighbors = count_3d_neighbors(grid, x, y, z)
-                        if grid[x, y, z] == 1:
-                            if 4 <= neighbors <= 6:
-                                new_grid[x, y, z] = 1
-                        else:
-                            if neighbors == 5:
-                                new_grid[x, y, z] = 1
-            return new_grid
-    except ImportError:
-        pass
+            return next_3d_generation_numpy(grid, rule)
+        return next_3d_generation_numpy(np.array(grid, dtype=np.uint8), rule).tolist()
+    return next_3d_generation_list(grid, rule)
+
+def next_3d_generation_list(grid, rule=RULE_3D):
+    """Compute the next 3D generation with the pure-Python nested-list engine"""
+    table = rule.table
     X, Y, Z = len(grid), len(grid[0]), len(grid[0][0])
     new_grid = [[[0 for _ in range(Z)] for _ in range(Y)] for _ in range(X)]
     for x in range(X):
         for y in range(Y):
             for z in range(Z):
                 neighbors = count_3d_neighbors(grid, x, y, z)
-                if grid[x][y][z] == 1:
-                    if 4 <= neighbors <= 6:
-                        new_grid[x][y][z] = 1
-                else:
-                    if neighbors == 5:
-                        new_grid[x][y][z] = 1
+                new_grid[x][y][z] = table[grid[x][y][z]][neighbors]
     return new_grid
 
-def run_3d_demo():
+def run_3d_demo(size=20, generations=10):
     """Demo 3D Game of Life (requires matplotlib)"""
     try:
         import matplotlib.pyplot as plt
@@ -1453,26 +5106,30 @@ def run_3d_demo():
         import numpy as np
         print("🌌 3D Game of Life Demo")
         print("Initializing 3D grid...")
-        grid = initialize_3d_grid(20, 20, 20, 0.15)
+        grid = initialize_3d_grid(size, size, size, 0.15)
+        # Keep the scatter plot responsive on big grids by sampling voxels
+        max_points = 20000
         fig = plt.figure(figsize=(10, 8))
         ax = fig.add_subplot(111, projection='3d')
-        for generation in range(10):
+        for generation in range(generations):
             ax.clear()
             ax.set_title(f'3D Game of Life - Generation {generation}')
             if isinstance(grid, np.ndarray):
-                live_cells = np.where(grid == 1)
-                if len(live_cells[0]) > 0:
-                    ax.scatter(live_cells[0], live_cells[1], live_cells[2], 
-                             c='red', s=20, alpha=0.6)
+                live_cells = np.argwhere(grid == 1)
+                if len(live_cells) > max_points:
+                    live_cells = live_cells[np.random.choice(len(live_cells), max_points, replace=False)]
+                if len(live_cells) > 0:
+                    ax.scatter(live_cells[:, 0], live_cells[:, 1], live_cells[:, 2], 
+                             c='red', s=20 if size <= 32 else 2, alpha=0.6)
             ax.set_xlabel('X')
             ax.set_ylabel('Y')
             ax.set_zlabel('Z')
-            ax.set_xlim(0, 20)
-            ax.set_ylim(0, 20)
-            ax.set_zlim(0, 20)
+            ax.set_xlim(0, size)
+            ax.set_ylim(0, size)
+            ax.set_zlim(0, size)
             plt.pause(1)
             grid = next_3d_generation(grid)
-            live_count = np.sum(grid) if isinstance(grid, np.ndarray) else sum(sum(sum(plane) for plane in layer) for layer in grid)
+            live_count = int(np.count_nonzero(grid))
             print(f"Generation {generation}: {live_count} live cells")
             if live_count == 0:
                 print("Population extinct!")
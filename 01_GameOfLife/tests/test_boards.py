@@ -0,0 +1,31 @@
+import pytest
+
+import gameOfLifeFinal as gol
+
+GRID = [[0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [1, 1, 1, 0]]
+
+
+def test_packed_rows_are_read_only():
+    board = gol.PackedBoard.from_grid(GRID)
+    assert board[1] == (0, 0, 1, 0)
+    assert [list(row) for row in board] == GRID
+    with pytest.raises(TypeError):
+        board[0][0] = 1
+    board.set(0, 0, 1)
+    assert board[0][0] == 1
+
+
+@pytest.mark.parametrize('extra', [(), [(r, c) for r in range(5, 10) for c in range(4)]])
+def test_sparse_rows_are_read_only(extra):
+    grid = [row[:] for row in GRID] + [[0] * 4 for _ in range(7)]
+    for r, c in extra:
+        grid[r][c] = 1
+    board = gol.SparseBoard.from_grid(grid)
+    assert [list(board[i]) for i in range(board.rows)] == grid
+    assert [list(row) for row in board] == grid
+    with pytest.raises(TypeError):
+        board[0][0] = 1
+    board.set(0, 0, 1)
+    assert board[0][0] == 1
@@ -0,0 +1,61 @@
+import pytest
+
+import gameOfLifeFinal as gol
+
+np = gol.np
+needs_numpy = pytest.mark.skipif(np is None, reason="requires numpy")
+
+
+def board_with(objects, rows=40, cols=40):
+    grid = [[0] * cols for _ in range(rows)]
+    for name, r, c in objects:
+        grid = gol.place_pattern(grid, gol.load_pattern(name), r, c)
+    return grid
+
+
+def test_census_names_library_objects():
+    grid = board_with([('block', 2, 2), ('block', 2, 30), ('blinker', 20, 5), ('glider', 20, 25)])
+    census = gol.object_census(grid)
+    assert census['still life'] == {'block': 2}
+    assert census['oscillator'] == {'blinker': 1}
+    assert census['spaceship'] == {'glider': 1}
+    assert not census['other']
+
+
+@pytest.mark.parametrize('name, kind', [('lightweight_spaceship', 'spaceship'), ('pulsar', 'oscillator')])
+@pytest.mark.parametrize('numpy_available', [True, False])
+def test_census_keeps_objects_with_gaps_whole(monkeypatch, name, kind, numpy_available):
+    if not numpy_available:
+        monkeypatch.setattr(gol, 'np', None)
+    grid = board_with([(name, 10, 10)])
+    for _ in range(3):
+        census = gol.object_census(grid)
+        assert {k: dict(v) for k, v in census.items() if v} == {kind: {name: 1}}
+        grid = gol.next_generation(grid)
+
+
+def test_census_counts_gun_pieces_separately():
+    census = gol.object_census(board_with([('gosper_gun', 5, 2)], cols=50))
+    assert census['still life'] == {'block': 2}
+    assert sum(census['other'].values()) == 2
+
+
+@needs_numpy
+def test_census_numpy_and_pure_python_agree(monkeypatch):
+    board = (np.random.default_rng(2).random((120, 120)) < 0.3).astype(np.uint8)
+    for _ in range(40):
+        board = gol.next_generation(board)
+    expected = gol.object_census(board)
+    monkeypatch.setattr(gol, 'np', None)
+    assert gol.object_census(gol.convert_board(board.tolist(), 'sparse')) == expected
+
+
+@needs_numpy
+def test_census_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(gol, 'CENSUS_CACHE_SIZE', 100)
+    gol._census_tables.clear()
+    board = (np.random.default_rng(3).random((256, 256)) < 0.3).astype(np.uint8)
+    gol.object_census(gol.next_generation(board))
+    for _, _, learned in gol._census_tables.values():
+        assert len(learned) <= 100
+
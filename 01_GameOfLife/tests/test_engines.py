@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+import gameOfLifeFinal as gol
+
+STEPS = 12
+HIGHLIFE = gol.LifeRule.parse('B36/S23')
+needs_numpy = pytest.mark.skipif(gol.np is None, reason="requires numpy")
+
+
+def random_grid(rows, cols, seed, density=0.35):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def reference_run(grid, steps, rule):
+    """Boards 1..steps from the pure-Python reference engine"""
+    boards = []
+    for _ in range(steps):
+        grid = gol.next_generation_list(grid, rule)
+        boards.append(grid)
+    return boards
+
+
+def check_engine(step, board, rule, rows=30, cols=45):
+    grid = gol.convert_board(board, 'list')
+    for expected in reference_run(grid, STEPS, rule):
+        board = step(board)
+        assert gol.convert_board(board, 'list') == expected
+
+
+@pytest.mark.parametrize('rule', [gol.CONWAY, HIGHLIFE], ids=str)
+class TestMatchesListEngine:
+    def test_dispatch_on_lists(self, rule):
+        check_engine(lambda b: gol.next_generation(b, rule), random_grid(30, 45, 1), rule)
+
+    @needs_numpy
+    def test_numpy(self, rule):
+        board = gol.grid_to_array(random_grid(30, 45, 2))
+        check_engine(lambda b: gol.next_generation_numpy(b, rule), board, rule)
+
+    def test_packed(self, rule):
+        board = gol.PackedBoard.from_grid(random_grid(30, 45, 3))
+        check_engine(lambda b: gol.next_generation_packed(b, rule), board, rule)
+
+    def test_sparse(self, rule):
+        board = gol.SparseBoard.from_grid(random_grid(30, 45, 4))
+        check_engine(lambda b: gol.next_generation_sparse(b, rule), board, rule)
+
+    def test_tiled(self, rule):
+        state = {'tiles': None}
+
+        def step(grid):
+            grid, state['tiles'], _, _ = gol.next_generation_tiled(grid, state['tiles'], rule=rule)
+            return grid
+        check_engine(step, random_grid(30, 45, 5), rule)
+
+    @needs_numpy
+    def test_memmap(self, rule, tmp_path):
+        board = gol.MemmapBoard.create(str(tmp_path / 'board.golm'), 30, 45, board=random_grid(30, 45, 6),
+                                       band_rows=7)
+        try:
+            check_engine(lambda b: gol.next_generation(b, rule), board, rule)
+        finally:
+            board.close()
+
+    @needs_numpy
+    def test_parallel(self, rule):
+        try:
+            check_engine(lambda b: gol.next_generation_parallel(b, workers=3, rule=rule),
+                         random_grid(30, 45, 7), rule)
+        finally:
+            gol.close_parallel_engines()
+
+    @pytest.mark.parametrize('exponent', [0, 1, 3])
+    def test_hashlife(self, rule, exponent):
+        # Hashlife runs on the unbounded plane: keep the soup far enough from the edges
+        # that nothing wraps around the torus within 2**exponent generations
+        grid = [[0] * 48 for _ in range(40)]
+        for i, row in enumerate(random_grid(10, 12, 8)):
+            grid[15 + i][18:30] = row
+        success, _, jumped = gol.hashlife_jump(grid, exponent, rule)
+        assert success
+        assert jumped == reference_run(grid, 1 << exponent, rule)[-1]
+
+
+def test_3d_numpy_matches_list_engine():
+    if gol.np is None:
+        pytest.skip("requires numpy")
+    rng = random.Random(9)
+    grid = [[[1 if rng.random() < 0.3 else 0 for _ in range(7)] for _ in range(6)] for _ in range(5)]
+    board = gol.np.array(grid, dtype=gol.np.uint8)
+    for _ in range(4):
+        grid = gol.next_3d_generation_list(grid)
+        board = gol.next_3d_generation_numpy(board)
+        assert board.tolist() == grid
+
+
+@needs_numpy
+def test_parallel_close_survives_a_dead_worker(monkeypatch):
+    monkeypatch.setattr(gol, 'PARALLEL_CLOSE_TIMEOUT', 1)
+    engine = gol.ParallelEngine(20, 20, workers=3)
+    engine.load(random_grid(20, 20, 8))
+    engine.step(2)
+    engine.processes[1].kill()
+    engine.processes[1].join()
+    engine.close()
+    assert engine.processes == []
@@ -0,0 +1,44 @@
+import pytest
+
+import gameOfLifeFinal as gol
+
+np = gol.np
+pytestmark = pytest.mark.skipif(np is None, reason="ensemble simulation requires numpy")
+
+
+def test_stacked_step_matches_separate_boards():
+    np.random.seed(4)
+    densities = [0.05, 0.2, 0.35, 0.5, 0.8]
+    boards = gol.initialize_ensemble(len(densities), 20, 30, densities)
+    separate = [board.copy() for board in boards]
+    for _ in range(15):
+        boards = gol.next_generation_ensemble(boards)
+        separate = [gol.next_generation(board) for board in separate]
+        assert np.array_equal(boards, np.stack(separate))
+
+
+def test_initialize_ensemble_uses_each_density():
+    np.random.seed(5)
+    boards = gol.initialize_ensemble(3, 100, 100, [0.0, 0.5, 1.0])
+    populations = np.count_nonzero(boards, axis=(1, 2))
+    assert populations[0] == 0 and populations[2] == 100 * 100
+    assert 4000 < populations[1] < 6000
+
+
+def test_extinct_and_stable_flags():
+    empty = np.zeros((10, 10), dtype=np.uint8)
+    lonely = empty.copy()
+    lonely[5, 5] = 1
+    block = empty.copy()
+    block[2:4, 2:4] = 1
+    glider = np.array(gol.place_pattern(empty.tolist(), gol.load_pattern('glider'), 1, 1), dtype=np.uint8)
+    boards = np.stack([lonely, block, glider])
+    stats = gol.EnsembleStats(len(boards))
+    stats.update(boards, 0)
+    for generation in range(1, 3):
+        boards = gol.next_generation_ensemble(boards)
+        stats.update(boards, generation)
+    assert stats.is_extinct().tolist() == [True, False, False]
+    assert stats.is_stable().tolist() == [True, True, False]
+    assert stats.get_current_population().tolist() == [0, 4, 5]
+    assert [stats.get_summary(i)['status'] for i in range(3)] == ['Extinct', 'Stable', 'Near Stable']
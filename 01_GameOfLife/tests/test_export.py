@@ -0,0 +1,54 @@
+import pytest
+
+import gameOfLifeFinal as gol
+
+Image = pytest.importorskip("PIL.Image")
+
+GRID = [[0, 1, 0, 0, 0, 0, 0, 0, 0, 1],
+        [0, 0, 1, 0, 0, 0, 0, 0, 0, 0],
+        [1, 1, 1, 0, 0, 0, 0, 0, 0, 0]]
+ENGINES = [engine for engine in gol.ENGINES if engine != 'numpy' or gol.np is not None]
+
+
+def exported(tmp_path, board, **options):
+    filename = str(tmp_path / 'board.png')
+    success, message = gol.export_as_image(board, filename, **options)
+    assert success, message
+    return Image.open(filename)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_one_bit_png(tmp_path, engine):
+    img = exported(tmp_path, gol.convert_board(GRID, engine), cell_size=3)
+    assert img.mode == '1' and img.size == (30, 9)
+    pixels = img.convert('L')
+    # Live cells are black, dead cells white, each cell_size x cell_size
+    assert pixels.getpixel((3, 0)) == 0 and pixels.getpixel((5, 2)) == 0
+    assert pixels.getpixel((0, 0)) == 255 and pixels.getpixel((29, 8)) == 255
+    assert pixels.getpixel((27, 0)) == 0 and pixels.getpixel((26, 0)) == 255
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_paletted_png(tmp_path, engine):
+    palette = ((10, 20, 30), (200, 100, 50))
+    img = exported(tmp_path, gol.convert_board(GRID, engine), cell_size=2, mode='P', palette=palette)
+    assert img.mode == 'P' and img.size == (20, 6)
+    rgb = img.convert('RGB')
+    assert rgb.getpixel((2, 0)) == palette[1] and rgb.getpixel((3, 1)) == palette[1]
+    assert rgb.getpixel((0, 0)) == palette[0] and rgb.getpixel((19, 5)) == palette[0]
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_rgb_png(tmp_path, engine):
+    img = exported(tmp_path, gol.convert_board(GRID, engine), cell_size=1, mode='RGB')
+    assert img.mode == 'RGB' and img.size == (10, 3)
+    assert img.getpixel((1, 0)) == gol.CELL_PALETTE[1]
+    assert img.getpixel((0, 2)) == gol.CELL_PALETTE[1]
+    assert img.getpixel((0, 0)) == gol.CELL_PALETTE[0]
+    assert [img.getpixel((j, i)) == gol.CELL_PALETTE[1] for i in range(3) for j in range(10)] == \
+        [bool(cell) for row in GRID for cell in row]
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    success, message = gol.export_as_image(GRID, str(tmp_path / 'x.png'), mode='CMYK')
+    assert not success and 'CMYK' in message
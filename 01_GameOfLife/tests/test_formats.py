@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+import gameOfLifeFinal as gol
+
+ENGINES = [engine for engine in gol.ENGINES if engine != 'numpy' or gol.np is not None]
+
+GLIDER = [[0, 1, 0, 0, 0],
+          [0, 0, 1, 0, 0],
+          [1, 1, 1, 0, 0],
+          [0, 0, 0, 0, 0]]
+
+
+@pytest.mark.parametrize('generation', [0, 12345, (1 << 64) - 1, 1 << 64, 1 << 200])
+def test_binary_save_keeps_any_generation(tmp_path, generation):
+    filename = str(tmp_path / 'save.golb')
+    assert gol.save_state_binary(GLIDER, generation, filename)[0]
+    success, board, loaded_generation, rule = gol.load_state_binary(filename)
+    assert success and board == GLIDER
+    assert loaded_generation == generation
+    assert str(rule) == str(gol.CONWAY)
+
+
+def test_memmap_save_rejects_huge_generation(tmp_path):
+    success, message = gol.save_state(GLIDER, 1 << 64, str(tmp_path / 'save.golm'))
+    assert not success and '.golb' in message
+
+
+def random_grid(rows, cols, seed, density=0.3):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def shifted_cells(board):
+    """Live cells moved so the bounding box starts at (0, 0), as pattern files store them"""
+    cells = set(gol.iter_live_cells(board))
+    top = min(r for r, _ in cells)
+    left = min(c for _, c in cells)
+    return {(r - top, c - left) for r, c in cells}
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_json_round_trip(tmp_path, engine):
+    grid = random_grid(17, 23, seed=1)
+    filename = str(tmp_path / 'save.json')
+    assert gol.save_state(gol.convert_board(grid, engine), 42, filename)[0]
+    success, board, generation = gol.load_state(filename)
+    assert success and generation == 42
+    assert gol.convert_board(board, 'list') == grid
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib', 'lzma'])
+@pytest.mark.parametrize('engine', ENGINES)
+def test_binary_round_trip(tmp_path, engine, compression):
+    grid = random_grid(17, 23, seed=2)
+    rule = gol.LifeRule.parse('B36/S23')
+    filename = str(tmp_path / 'save.golb')
+    assert gol.save_state_binary(gol.convert_board(grid, engine), 7, filename, rule, compression)[0]
+    success, board, generation, loaded_rule = gol.load_state_binary(filename)
+    assert success and generation == 7 and str(loaded_rule) == str(rule)
+    assert gol.board_engine(board) == engine
+    assert gol.convert_board(board, 'list') == grid
+    success, board, generation = gol.load_state(filename)
+    assert success and gol.convert_board(board, 'list') == grid
+
+
+@pytest.mark.skipif(gol.np is None, reason="MemmapBoard requires numpy")
+def test_memmap_round_trip(tmp_path):
+    grid = random_grid(17, 23, seed=3)
+    filename = str(tmp_path / 'save.golm')
+    assert gol.save_state(grid, 9, filename)[0]
+    success, board, generation = gol.load_state(filename)
+    try:
+        assert success and generation == 9
+        assert gol.convert_board(board, 'list') == grid
+    finally:
+        board.close()
+
+
+def test_run_log_round_trip(tmp_path):
+    grid = random_grid(17, 23, seed=4)
+    filename = str(tmp_path / 'run.golr')
+    expected = [grid]
+    with gol.RunLogWriter(filename, 17, 23, generation=5, keyframe_interval=4) as log:
+        log.append(grid)
+        for _ in range(10):
+            expected.append(gol.next_generation_list(expected[-1]))
+            log.append(expected[-1])
+    with gol.RunLogReader(filename) as log:
+        assert len(log) == len(expected)
+        assert list(log) == expected
+        assert log.board_at(12) == expected[7]
+        assert [population for _, population in log.populations()] == [gol.count_population(g) for g in expected]
+
+
+@pytest.mark.parametrize('engine', ['sparse', 'packed'])
+@pytest.mark.parametrize('write, read, extension', [
+    (gol.write_rle, gol.read_rle, '.rle'),
+    (gol.write_life106, gol.read_life106, '.lif'),
+])
+def test_pattern_file_round_trip(tmp_path, write, read, extension, engine):
+    grid = random_grid(17, 23, seed=5)
+    filename = str(tmp_path / ('pattern' + extension))
+    assert write(grid, filename)[0]
+    success, _, board, _ = read(filename, engine)
+    assert success and gol.board_engine(board) == engine
+    assert shifted_cells(board) == shifted_cells(grid)
+    success, _, board, _ = gol.load_pattern_file(filename, engine)
+    assert success and shifted_cells(board) == shifted_cells(grid)
+
+
+def test_rle_keeps_rule(tmp_path):
+    filename = str(tmp_path / 'pattern.rle')
+    assert gol.write_rle(GLIDER, filename, gol.LifeRule.parse('B36/S23'))[0]
+    assert str(gol.read_rle(filename)[3]) == 'B36/S23'
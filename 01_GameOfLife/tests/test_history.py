@@ -0,0 +1,89 @@
+import random
+
+import gameOfLifeFinal as gol
+
+
+def soup_run(steps, rows=24, cols=32, seed=11):
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < 0.35 else 0 for _ in range(cols)] for _ in range(rows)]
+    boards = [grid]
+    for _ in range(steps):
+        boards.append(gol.next_generation_list(boards[-1]))
+    return boards
+
+
+def test_grid_history_evicts_segments_and_rebuilds_kept_states():
+    boards = soup_run(130)
+    history = gol.GridHistory(boards[0], generation=100, max_length=40, keyframe_interval=7)
+    for board in boards[1:]:
+        history.append(board)
+        assert len(history) <= 40
+    # Whole segments are evicted, so between max_length - interval + 1 and max_length remain
+    assert 40 - 7 < len(history) <= 40
+    first = history.generation_at(0) - 100
+    assert (first, len(history)) == (len(boards) - len(history), len(boards) - first)
+    kept = boards[first:]
+    # Step back from the newest state to the oldest kept one, then forward again
+    for index in list(range(len(history) - 1, -1, -1)) + list(range(len(history))):
+        assert history[index] == kept[index]
+    assert history[-1] == kept[-1]
+    assert list(history) == kept
+    assert history[3:17] == kept[3:17]
+    assert history[::5] == kept[::5]
+
+
+def test_grid_history_returns_copies():
+    boards = soup_run(5)
+    history = gol.GridHistory(boards[0], keyframe_interval=3)
+    for board in boards[1:]:
+        history.append(board)
+    history[2][0][0] ^= 1
+    boards[1][0][0] ^= 1
+    assert history[2] == soup_run(5)[2]
+    assert history[1] == soup_run(5)[1]
+
+
+def small_timeline(board, cache_size=5):
+    rows, cols = len(board), len(board[0])
+    # Room for 8 checkpoints, so the first 1024 generations start at an interval of 128
+    budget = 2 * 8 * rows * ((cols + 7) // 8 + 32)
+    return gol.CheckpointTimeline(board, generation=10, memory_budget=budget, cache_size=cache_size)
+
+
+def test_checkpoint_timeline_thins_and_seeks():
+    boards = soup_run(1500)
+    timeline = small_timeline(boards[0])
+    assert (timeline.max_checkpoints, timeline.interval) == (8, 128)
+    for board in boards[1:]:
+        timeline.append(board)
+        assert len(timeline.checkpoints) <= 8
+        assert len(timeline.cache) <= 5
+    assert timeline.interval == 256
+    assert all((g - 10) % 256 == 0 for g in timeline.checkpoint_generations)
+    assert len(timeline) == len(boards)
+    for index in (1499, 0, 777, 1023, 1024, 1025, 3, 1300, 1299):
+        assert timeline[index] == boards[index]
+        assert len(timeline.cache) <= 5
+    assert timeline.board_at(10 + 640) == boards[640]
+
+
+def test_checkpoint_timeline_edit_truncates_forward_history():
+    boards = soup_run(300)
+    timeline = small_timeline(boards[0])
+    for board in boards[1:]:
+        timeline.append(board)
+    edited = [row[:] for row in boards[200]]
+    edited[0][0] ^= 1
+    timeline.edit(10 + 200, edited)
+    assert len(timeline) == 201
+    assert max(timeline.checkpoint_generations) == 210
+    assert timeline[-1] == edited
+    assert timeline[150] == boards[150]
+    branch = [edited]
+    for _ in range(60):
+        branch.append(gol.next_generation_list(branch[-1]))
+        timeline.append(branch[-1])
+    assert len(timeline) == 261
+    for index in (260, 230, 200, 199, 64):
+        expected = branch[index - 200] if index >= 200 else boards[index]
+        assert timeline[index] == expected
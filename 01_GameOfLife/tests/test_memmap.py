@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+import gameOfLifeFinal as gol
+
+pytestmark = pytest.mark.skipif(gol.np is None, reason="MemmapBoard requires numpy")
+
+
+def random_grid(rows, cols, seed, density=0.3):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def test_memmap_board_through_shared_apis(tmp_path):
+    grid = random_grid(40, 50, seed=2)
+    board = gol.MemmapBoard.create(str(tmp_path / 'board.golm'), 40, 50, board=grid, band_rows=16)
+    try:
+        assert gol.convert_board(board, 'memmap') is board
+        assert gol.convert_board(board, 'list') == grid
+        assert gol.board_hash(board) == gol.board_hash(board)
+
+        expected = gol.next_generation_list(grid)
+        assert gol.next_generation(board) is board
+        assert gol.convert_board(board, 'list') == expected
+
+        stats = gol.GameStats()
+        stats.update(board, board.generation)
+        assert stats.get_current_population() == gol.count_population(expected)
+
+        board, generation, stats = gol.run_headless(board, 5, start_generation=board.generation)
+        for _ in range(5):
+            expected = gol.next_generation_list(expected)
+        assert generation == 6
+        assert gol.convert_board(board, 'list') == expected
+
+        for name in ('save.json', 'save.golb', 'copy.golm'):
+            filename = str(tmp_path / name)
+            assert gol.save_state(board, generation, filename)[0]
+            success, loaded, loaded_generation = gol.load_state(filename)
+            assert success and loaded_generation == generation
+            assert gol.convert_board(loaded, 'list') == expected
+            if isinstance(loaded, gol.MemmapBoard):
+                loaded.close()
+    finally:
+        board.close()
+
+
+def test_convert_to_memmap_needs_a_file():
+    with pytest.raises(ValueError, match="MemmapBoard.create"):
+        gol.convert_board([[0, 1], [1, 0]], 'memmap')
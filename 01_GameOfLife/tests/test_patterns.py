@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+import gameOfLifeFinal as gol
+
+needs_numpy = pytest.mark.skipif(gol.np is None, reason="requires numpy")
+ALL_NAMES = tuple(gol.PATTERN_INDEX.patterns)
+
+
+def stamp(rows, cols, pattern, top, left):
+    """Board with pattern written at (top, left), wrapping around the edges"""
+    grid = [[0] * cols for _ in range(rows)]
+    for di, row in enumerate(pattern):
+        for dj, cell in enumerate(row):
+            grid[(top + di) % rows][(left + dj) % cols] = cell
+    return grid
+
+
+@pytest.fixture(params=['numpy', 'packed'])
+def engine(request, monkeypatch):
+    if request.param == 'numpy':
+        if gol.np is None:
+            pytest.skip("requires numpy")
+    else:
+        monkeypatch.setattr(gol, 'np', None)
+    return request.param
+
+
+@pytest.mark.parametrize('name', ['glider', 'lightweight_spaceship', 'gosper_gun'])
+def test_every_orientation_is_found(engine, name):
+    orientations = gol.pattern_orientations(gol.load_pattern(name))
+    assert len(orientations) == 8
+    for oriented in orientations:
+        grid = stamp(50, 50, oriented, 7, 9)
+        assert gol.detect_patterns(grid, [name]) == {name: [(7, 9)]}
+
+
+@pytest.mark.parametrize('name', ['glider', 'beacon', 'gosper_gun'])
+def test_patterns_wrapping_across_the_edges(engine, name):
+    pattern = gol.load_pattern(name)
+    top, left = 40 - len(pattern) // 2, 50 - len(pattern[0]) // 2
+    grid = stamp(40, 50, pattern, top, left)
+    assert gol.detect_patterns(grid, [name]) == {name: [(top, left)]}
+    assert gol.detect_patterns(grid, [name], wrap=False) == {}
+
+
+@needs_numpy
+@pytest.mark.parametrize('seed', [1, 2, 3])
+@pytest.mark.parametrize('wrap', [True, False])
+def test_numpy_and_packed_paths_agree_on_soups(monkeypatch, seed, wrap):
+    rng = random.Random(seed)
+    grid = [[1 if rng.random() < 0.3 else 0 for _ in range(70)] for _ in range(60)]
+    for _ in range(30):
+        grid = gol.next_generation_list(grid)
+    # Make sure the soup also holds a large pattern checked beyond its 64-cell window
+    grid = gol.place_pattern(grid, gol.load_pattern('gosper_gun'), 45, 30)
+    found = gol.detect_patterns(grid, ALL_NAMES, wrap)
+    assert found['gosper_gun'] == [(45, 30)]
+    monkeypatch.setattr(gol, 'np', None)
+    assert gol.detect_patterns(grid, ALL_NAMES, wrap) == found
+
+
+def test_index_lookup_in_any_orientation():
+    index = gol.PatternIndex({'glider': gol.load_pattern('glider'), 'block': gol.load_pattern('block')})
+    for oriented in gol.pattern_orientations(gol.load_pattern('glider')):
+        assert index.lookup(oriented) == 'glider'
+    assert index.lookup([[1, 1], [1, 1]]) == 'block'
+    assert index.lookup([[1, 1, 1]]) is None
+    assert index.lookup([[0, 0]]) is None
+
+
+def test_index_replacing_a_name_drops_its_old_shape():
+    line = [[1, 1, 1, 1, 1]]
+    dots = [[1, 0, 1, 0, 1]]
+    index = gol.PatternIndex()
+    assert index.register('Thing', line)[0]
+    version = index.version
+    assert index.register('thing', dots)[0]
+    assert index.version > version
+    assert index.lookup(line) is None
+    assert index.lookup([[1], [0], [1], [0], [1]]) == 'thing'
+    assert index.names() == ['thing'] and len(index.by_key) == 1
+    # A shape shared with another name passes to that name when its owner is replaced
+    assert index.register('spaced', dots)[0]
+    assert index.register('thing', line)[0]
+    assert index.lookup(dots) == 'spaced'
+    assert index.lookup(line) == 'thing'
+    assert not index.register('empty', [[0, 0]])[0]
+
+
+def test_register_pattern_adds_to_loading_and_detection(monkeypatch):
+    monkeypatch.setattr(gol, 'PATTERN_INDEX', gol.PatternIndex(gol.PATTERN_LIBRARY, gol.DETECTION_PATTERNS))
+    ship = gol.load_pattern('lightweight_spaceship')
+    assert gol.register_pattern('my_ship', [row[::-1] for row in ship], detect=True)[0]
+    assert 'my_ship' in gol.PATTERN_INDEX
+    assert gol.load_pattern('my_ship') == [row[::-1] for row in ship]
+    grid = gol.place_pattern([[0] * 30 for _ in range(30)], ship[::-1], 5, 5)
+    assert gol.detect_patterns(grid)['my_ship'] == [(5, 5)]
@@ -0,0 +1,26 @@
+import gameOfLifeFinal as gol
+
+
+def blinker_grid():
+    grid = [[0] * 12 for _ in range(12)]
+    grid[1][1] = grid[1][2] = grid[2][1] = 1
+    for j in (6, 7, 8):
+        grid[6][j] = 1
+    return grid
+
+
+def test_stats_read_headers_and_detect_cycles_on_request(tmp_path, monkeypatch):
+    path = str(tmp_path / 'run.golr')
+    _, generation, run_stats = gol.run_headless(blinker_grid(), 20, stop_on_cycle=False,
+                                                log_path=path, keyframe_interval=4)
+    with gol.RunLogReader(path) as log:
+        def no_decoding(*args):
+            raise AssertionError("stats() decoded a board")
+        with monkeypatch.context() as patch:
+            patch.setattr(log, '_decode_keyframe', no_decoding)
+            patch.setattr(log, '_apply_delta', no_decoding)
+            stats = log.stats()
+        assert list(stats.population_history) == list(run_stats.population_history)
+        assert stats.generation == generation
+        assert stats.get_cycle() is None
+        assert log.stats(detect_cycles=True).get_cycle() == run_stats.get_cycle() == (2, 1)
@@ -0,0 +1,78 @@
+import pytest
+
+import gameOfLifeFinal as gol
+
+needs_numpy = pytest.mark.skipif(gol.np is None, reason="requires numpy")
+
+
+def place(grid, name, r, c):
+    return gol.place_pattern(grid, gol.load_pattern(name), r, c)
+
+
+def run(stats, grid, generation, steps):
+    for _ in range(steps):
+        grid = gol.next_generation(grid)
+        generation += 1
+        stats.update(grid, generation)
+    return grid, generation
+
+
+def test_cycle_detection_restarts_after_edit_at_same_generation():
+    grid = place([[0] * 20 for _ in range(20)], 'block', 2, 2)
+    stats = gol.GameStats()
+    stats.update(grid, 0)
+    grid, generation = run(stats, grid, 0, 2)
+    assert stats.get_cycle() == (1, 0)
+    assert stats.get_summary()['status'] == 'Stable'
+
+    # Drawing a glider at the same generation starts a new run
+    grid = place(grid, 'glider', 8, 8)
+    stats.update(grid, generation)
+    assert stats.get_cycle() is None
+    grid, generation = run(stats, grid, generation, 6)
+    assert stats.get_cycle() is None
+    assert stats.get_summary()['status'] != 'Stable'
+
+
+def test_rewinding_restarts_cycle_detection():
+    grid = place([[0] * 20 for _ in range(20)], 'blinker', 5, 5)
+    stats = gol.GameStats()
+    stats.update(grid, 0)
+    run(stats, grid, 0, 3)
+    assert stats.get_cycle() == (2, 0)
+    stats.update(grid, 1)
+    assert stats.get_cycle() is None
+
+
+def test_transient_is_relative_to_first_recorded_generation():
+    grid = place([[0] * 20 for _ in range(20)], 'blinker', 5, 5)
+    stats = gol.GameStats()
+    stats.update(grid, 1000)
+    run(stats, grid, 1000, 3)
+    assert stats.get_cycle() == (2, 0)
+    assert stats.is_stable()
+
+
+@needs_numpy
+def test_ensemble_detects_oscillators_per_board():
+    np = gol.np
+    empty = [[0] * 12 for _ in range(12)]
+    boards = np.array([place(empty, 'block', 2, 2), place(empty, 'blinker', 4, 4),
+                       place(empty, 'glider', 1, 1)], dtype=np.uint8)
+    stats = gol.EnsembleStats(len(boards))
+    stats.update(boards, 0)
+    for generation in range(1, 4):
+        boards = gol.next_generation_ensemble(boards)
+        stats.update(boards, generation)
+    assert stats.is_stable().tolist() == [True, True, False]
+    assert stats.cycle_period.tolist()[:2] == [1, 2]
+    assert stats.get_summary(1)['status'] == 'Oscillating'
+    assert stats.get_summary(1)['period'] == 2
+
+
+@needs_numpy
+def test_run_ensemble_stops_once_every_board_settles():
+    gol.np.random.seed(0)
+    _, stats = gol.run_ensemble(20, 16, 16, 0.3, generations=5000)
+    assert stats.generation < 5000
+    assert gol.np.all(stats.is_extinct() | stats.is_stable())
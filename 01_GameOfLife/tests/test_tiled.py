@@ -0,0 +1,28 @@
+import random
+
+import pytest
+
+import gameOfLifeFinal as gol
+
+
+def random_grid(rows, cols, seed, density=0.3):
+    rng = random.Random(seed)
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize('numpy_available', [True, False])
+def test_tiled_engine_tracks_population_and_changed_tiles(monkeypatch, numpy_available):
+    if not numpy_available:
+        monkeypatch.setattr(gol, 'np', None)
+    grid = random_grid(70, 90, seed=1)
+    stats = gol.GameStats()
+    stats.update(grid, 0)
+    active = None
+    for generation in range(1, 40):
+        expected = gol.next_generation_list(grid)
+        new_grid, active, births, deaths = gol.next_generation_tiled(grid, active)
+        assert new_grid == expected
+        assert active == gol.changed_tiles_between(grid, new_grid)
+        stats.update(new_grid, generation, active, births=births, deaths=deaths)
+        assert stats.get_current_population() == gol.count_population(new_grid)
+        grid = new_grid